@@ -0,0 +1,197 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 12:29:18.833778
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ENUM_NAMES = ('userstatus', 'userposition', 'eventtype', 'taskstatus')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Databases bootstrapped by init_models before migrations existed
+    # already have this schema. Offline SQL is rendered for an empty one.
+    if not op.get_context().as_sql and sa.inspect(op.get_bind()).has_table('users'):
+        return
+
+    op.create_table(
+        'teams',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('description', sa.String(), nullable=True),
+        sa.Column('team_lead_id', sa.UUID(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('team_lead_id'),
+        sa.UniqueConstraint('team_lead_id', name='uq_team_lead'),
+    )
+    op.create_index(op.f('ix_teams_name'), 'teams', ['name'], unique=True)
+    op.create_table(
+        'users',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('email', sa.String(length=150), nullable=False),
+        sa.Column('first_name', sa.String(length=50), nullable=False),
+        sa.Column('last_name', sa.String(length=50), nullable=False),
+        sa.Column('password', sa.String(), nullable=False),
+        sa.Column(
+            'status',
+            sa.Enum('ACTIVE', 'INACTIVE', 'FIRED', name='userstatus'),
+            nullable=False,
+        ),
+        sa.Column(
+            'position',
+            sa.Enum(
+                'NONE',
+                'ADMIN',
+                'JUNIOR',
+                'DEVELOPER',
+                'MANAGER',
+                'CEO',
+                name='userposition',
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            'hired_at',
+            sa.Date(),
+            server_default=sa.func.current_date(),
+            nullable=False,
+        ),
+        sa.Column('fired_at', sa.Date(), nullable=True),
+        sa.Column('team_id', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['team_id'], ['teams.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    # teams and users reference each other, so one side is added afterwards.
+    with op.batch_alter_table('teams') as batch_op:
+        batch_op.create_foreign_key(
+            'teams_team_lead_id_fkey',
+            'users',
+            ['team_lead_id'],
+            ['id'],
+            ondelete='SET NULL',
+        )
+    op.create_table(
+        'calendar_events',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column(
+            'event_type', sa.Enum('MEETING', 'TASK', name='eventtype'), nullable=False
+        ),
+        sa.Column('title', sa.String(length=50), nullable=False),
+        sa.Column('description', sa.String(), nullable=False),
+        sa.Column(
+            'start_time', sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column('end_time', sa.DateTime(), nullable=False),
+        sa.Column(
+            'created_at', sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column('event_creator_id', sa.UUID(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ['event_creator_id'], ['users.id'], ondelete='SET NULL'
+        ),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_table(
+        'meetings',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(length=50), nullable=False),
+        sa.Column('description', sa.String(), nullable=False),
+        sa.Column('start_time', sa.DateTime(), nullable=False),
+        sa.Column('end_time', sa.DateTime(), nullable=False),
+        sa.Column(
+            'created_at', sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column('meeting_creator_id', sa.UUID(), nullable=True),
+        sa.Column('calendar_event_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['calendar_event_id'], ['calendar_events.id'], ondelete='SET NULL'
+        ),
+        sa.ForeignKeyConstraint(
+            ['meeting_creator_id'], ['users.id'], ondelete='SET NULL'
+        ),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_table(
+        'tasks',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(length=50), nullable=False),
+        sa.Column('description', sa.String(), nullable=False),
+        sa.Column('due_date', sa.DateTime(), nullable=False),
+        sa.Column(
+            'status',
+            sa.Enum('IN_PROGRESS', 'COMPLETED', name='taskstatus'),
+            nullable=False,
+        ),
+        sa.Column(
+            'created_at', sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.Column('employee_id', sa.UUID(), nullable=False),
+        sa.Column('manager_id', sa.UUID(), nullable=True),
+        sa.Column('calendar_event_id', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ['calendar_event_id'], ['calendar_events.id'], ondelete='SET NULL'
+        ),
+        sa.ForeignKeyConstraint(['employee_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['manager_id'], ['users.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint(
+            'title',
+            'manager_id',
+            'employee_id',
+            'due_date',
+            name='uq_task_title_mgr_emp_due',
+        ),
+    )
+    op.create_table(
+        'employee_evaluations',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('score_quality', sa.Integer(), nullable=False),
+        sa.Column('task_id', sa.Integer(), nullable=False),
+        sa.CheckConstraint('score_quality BETWEEN 1 AND 10', name='chk_score_quality'),
+        sa.ForeignKeyConstraint(['task_id'], ['tasks.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('task_id'),
+        sa.UniqueConstraint('task_id', name='uq_task_id'),
+    )
+    op.create_table(
+        'user_meeting_table',
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('meeting_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['meeting_id'], ['meetings.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'meeting_id'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('user_meeting_table')
+    op.drop_table('employee_evaluations')
+    op.drop_table('tasks')
+    op.drop_table('meetings')
+    op.drop_table('calendar_events')
+    with op.batch_alter_table('teams') as batch_op:
+        batch_op.drop_constraint('teams_team_lead_id_fkey', type_='foreignkey')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_table('users')
+    op.drop_index(op.f('ix_teams_name'), table_name='teams')
+    op.drop_table('teams')
+    for enum_name in ENUM_NAMES:
+        sa.Enum(name=enum_name).drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,77 @@
+"""hot path indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 12:41:02.114507
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = (
+    ('ix_tasks_employee_id_due_date', 'tasks', ['employee_id', 'due_date', 'id']),
+    ('ix_tasks_manager_id_due_date', 'tasks', ['manager_id', 'due_date', 'id']),
+    ('ix_tasks_calendar_event_id', 'tasks', ['calendar_event_id']),
+    ('ix_meetings_calendar_event_id', 'meetings', ['calendar_event_id']),
+    ('ix_meetings_meeting_creator_id', 'meetings', ['meeting_creator_id']),
+    (
+        'ix_calendar_events_event_creator_id_start_time',
+        'calendar_events',
+        ['event_creator_id', 'start_time', 'id'],
+    ),
+    ('ix_users_team_id', 'users', ['team_id']),
+    ('ix_user_meeting_table_meeting_id', 'user_meeting_table', ['meeting_id']),
+)
+
+
+def is_invalid_index(name: str) -> bool:
+    # An interrupted CREATE INDEX CONCURRENTLY leaves an invalid index
+    # behind, which IF NOT EXISTS would otherwise keep forever.
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql' or op.get_context().as_sql:
+        return False
+    query = sa.text(
+        'SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid '
+        'WHERE c.relname = :name AND NOT i.indisvalid'
+    )
+    return bind.execute(query, {'name': name}).scalar() is not None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction, and
+    # databases bootstrapped by init_models may already have the indexes.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            if is_invalid_index(name):
+                op.drop_index(name, table_name=table, postgresql_concurrently=True)
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
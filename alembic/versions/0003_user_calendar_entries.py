@@ -0,0 +1,90 @@
+"""user calendar entries
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 13:05:47.302911
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BACKFILL_SQL = """
+INSERT INTO user_calendar_entries
+    (user_id, calendar_event_id, start_time, end_time, event_type)
+SELECT umt.user_id, ce.id, ce.start_time, ce.end_time, ce.event_type
+FROM calendar_events ce
+JOIN meetings m ON m.calendar_event_id = ce.id
+JOIN user_meeting_table umt ON umt.meeting_id = m.id
+UNION
+SELECT t.employee_id, ce.id, ce.start_time, ce.end_time, ce.event_type
+FROM calendar_events ce
+JOIN tasks t ON t.calendar_event_id = ce.id
+UNION
+SELECT ce.event_creator_id, ce.id, ce.start_time, ce.end_time, ce.event_type
+FROM calendar_events ce
+WHERE ce.event_creator_id IS NOT NULL
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Schemas built by init_models before it stamped the revision have the
+    # table already, kept up to date by the services.
+    if not op.get_context().as_sql and sa.inspect(op.get_bind()).has_table(
+        'user_calendar_entries'
+    ):
+        return
+
+    op.create_table(
+        'user_calendar_entries',
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('calendar_event_id', sa.Integer(), nullable=False),
+        sa.Column('start_time', sa.DateTime(), nullable=False),
+        sa.Column('end_time', sa.DateTime(), nullable=False),
+        sa.Column(
+            'event_type',
+            postgresql.ENUM('MEETING', 'TASK', name='eventtype', create_type=False),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ['calendar_event_id'], ['calendar_events.id'], ondelete='CASCADE'
+        ),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'calendar_event_id'),
+    )
+    op.create_index(
+        'ix_user_calendar_entries_calendar_event_id',
+        'user_calendar_entries',
+        ['calendar_event_id'],
+    )
+    op.create_index(
+        'ix_user_calendar_entries_user_id_start_time',
+        'user_calendar_entries',
+        ['user_id', 'start_time', 'calendar_event_id'],
+    )
+    op.execute(BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_user_calendar_entries_user_id_start_time',
+        table_name='user_calendar_entries',
+    )
+    op.drop_index(
+        'ix_user_calendar_entries_calendar_event_id',
+        table_name='user_calendar_entries',
+    )
+    op.drop_table('user_calendar_entries')
@@ -0,0 +1,75 @@
+"""calendar time ranges
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 13:32:15.618240
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Task events become points at the due date, meeting events get the real
+# meeting end instead of a copy of its start.
+BACKFILL_SQL = (
+    """
+    UPDATE calendar_events SET start_time = end_time
+    WHERE event_type = 'TASK'
+    """,
+    """
+    UPDATE calendar_events SET end_time = (
+        SELECT m.end_time FROM meetings m
+        WHERE m.calendar_event_id = calendar_events.id
+    )
+    WHERE event_type = 'MEETING' AND EXISTS (
+        SELECT 1 FROM meetings m WHERE m.calendar_event_id = calendar_events.id
+    )
+    """,
+    """
+    UPDATE user_calendar_entries SET
+        start_time = (
+            SELECT ce.start_time FROM calendar_events ce
+            WHERE ce.id = user_calendar_entries.calendar_event_id
+        ),
+        end_time = (
+            SELECT ce.end_time FROM calendar_events ce
+            WHERE ce.id = user_calendar_entries.calendar_event_id
+        )
+    """,
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for statement in BACKFILL_SQL:
+        op.execute(statement)
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_user_calendar_entries_user_id_end_time',
+            'user_calendar_entries',
+            ['user_id', 'end_time', 'start_time'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The backfilled event times are left as they are.
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_user_calendar_entries_user_id_end_time',
+            table_name='user_calendar_entries',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,41 @@
+"""meeting time range index
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 14:02:39.507126
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_meetings_start_time_end_time',
+            'meetings',
+            ['start_time', 'end_time'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_meetings_start_time_end_time',
+            table_name='meetings',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,106 @@
+"""recurring meetings
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 15:11:08.264310
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Schemas built by init_models before it stamped the revision may have
+    # these already; their series ends must not be overwritten. Offline SQL
+    # is rendered for a schema without them.
+    if op.get_context().as_sql:
+        meeting_columns, has_overrides_table = set(), False
+    else:
+        inspector = sa.inspect(op.get_bind())
+        meeting_columns = {
+            column['name'] for column in inspector.get_columns('meetings')
+        }
+        has_overrides_table = inspector.has_table('meeting_occurrence_overrides')
+    if 'recurrence_rule' not in meeting_columns:
+        op.add_column(
+            'meetings',
+            sa.Column('recurrence_rule', sa.String(length=255), nullable=True),
+        )
+    if 'series_end_time' not in meeting_columns:
+        op.add_column(
+            'meetings', sa.Column('series_end_time', sa.DateTime(), nullable=True)
+        )
+        # Every existing meeting is a single occurrence.
+        op.execute('UPDATE meetings SET series_end_time = end_time')
+        with op.batch_alter_table('meetings') as batch_op:
+            batch_op.alter_column(
+                'series_end_time', existing_type=sa.DateTime(), nullable=False
+            )
+
+    if not has_overrides_table:
+        op.create_table(
+            'meeting_occurrence_overrides',
+            sa.Column('meeting_id', sa.Integer(), nullable=False),
+            sa.Column('original_start_time', sa.DateTime(), nullable=False),
+            sa.Column(
+                'is_cancelled', sa.Boolean(), server_default=sa.false(), nullable=False
+            ),
+            sa.Column('start_time', sa.DateTime(), nullable=False),
+            sa.Column('end_time', sa.DateTime(), nullable=False),
+            sa.Column('title', sa.String(length=50), nullable=True),
+            sa.Column('description', sa.String(), nullable=True),
+            sa.ForeignKeyConstraint(
+                ['meeting_id'], ['meetings.id'], ondelete='CASCADE'
+            ),
+            sa.PrimaryKeyConstraint('meeting_id', 'original_start_time'),
+        )
+
+    # Overlap queries now bound meetings by the end of the whole series.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_meetings_start_time_series_end_time',
+            'meetings',
+            ['start_time', 'series_end_time'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_meetings_start_time_end_time',
+            table_name='meetings',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_meetings_start_time_end_time',
+            'meetings',
+            ['start_time', 'end_time'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_meetings_start_time_series_end_time',
+            table_name='meetings',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    op.drop_table('meeting_occurrence_overrides')
+    with op.batch_alter_table('meetings') as batch_op:
+        batch_op.drop_column('series_end_time')
+        batch_op.drop_column('recurrence_rule')
@@ -0,0 +1,56 @@
+"""meeting series end index
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 18:40:52.118204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Overlap queries bound series_end_time from below; leading with
+    # start_time made them range-scan every meeting of the past.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_meetings_series_end_time_start_time',
+            'meetings',
+            ['series_end_time', 'start_time'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_meetings_start_time_series_end_time',
+            table_name='meetings',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_meetings_start_time_series_end_time',
+            'meetings',
+            ['start_time', 'series_end_time'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_meetings_series_end_time_start_time',
+            table_name='meetings',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -8,12 +8,15 @@ from auth_service.security.authentication import (
 )
 from auth_service.security.identification import check_jwt
 from config.config import settings
+from infrastructure.cache.membership import publish_team_leads, publish_user_teams
+from infrastructure.db.calendar_entries import sync_calendar_entries
 from infrastructure.models.calendar import CalendarEvent
 from infrastructure.models.evaluation import TaskEvaluation
 from infrastructure.models.meeting import Meeting
 from infrastructure.models.task import Task
 from infrastructure.models.user import User, UserPosition
 from infrastructure.models.team import Team
+from infrastructure.db.redis_db import get_redis
 from infrastructure.db.sql_db import AsyncSessionLocal
 
 
@@ -46,7 +49,25 @@ class AdminAuth(AuthenticationBackend):
         return True
 
 
-class CalendarAdmin(ModelView, model=CalendarEvent):
+class CalendarEntriesSyncMixin:
+    """Admin writes skip the repositories, so the read model is synced here."""
+
+    def get_calendar_event_id(self, model) -> int:
+        return model.calendar_event_id
+
+    async def sync_entries(self, model) -> None:
+        async with AsyncSessionLocal() as session:
+            await sync_calendar_entries(session, [self.get_calendar_event_id(model)])
+            await session.commit()
+
+    async def after_model_change(self, data, model, is_created, request) -> None:
+        await self.sync_entries(model)
+
+    async def after_model_delete(self, model, request) -> None:
+        await self.sync_entries(model)
+
+
+class CalendarAdmin(CalendarEntriesSyncMixin, ModelView, model=CalendarEvent):
     column_list = [
         CalendarEvent.id,
         CalendarEvent.event_type,
@@ -61,6 +82,9 @@ class CalendarAdmin(ModelView, model=CalendarEvent):
     page_size = 50
     page_size_options = [10, 25, 50]
 
+    def get_calendar_event_id(self, model) -> int:
+        return model.id
+
 
 class EvaluationAdmin(ModelView, model=TaskEvaluation):
     column_list = [
@@ -74,13 +98,15 @@ class EvaluationAdmin(ModelView, model=TaskEvaluation):
     page_size_options = [10, 25, 50]
 
 
-class MeetingAdmin(ModelView, model=Meeting):
+class MeetingAdmin(CalendarEntriesSyncMixin, ModelView, model=Meeting):
     column_list = [
         Meeting.id,
         Meeting.title,
         Meeting.description,
         Meeting.start_time,
         Meeting.end_time,
+        Meeting.recurrence_rule,
+        Meeting.series_end_time,
         Meeting.created_at,
         Meeting.meeting_creator_id,
         Meeting.meeting_creator,
@@ -91,7 +117,7 @@ class MeetingAdmin(ModelView, model=Meeting):
     page_size_options = [10, 25, 50]
 
 
-class TaskAdmin(ModelView, model=Task):
+class TaskAdmin(CalendarEntriesSyncMixin, ModelView, model=Task):
     column_list = [
         Task.id,
         Task.title,
@@ -117,9 +143,14 @@ class TeamAdmin(ModelView, model=Team):
         Team.name,
         Team.description,
         Team.team_lead,
-        Team.members,
     ]
 
+    async def after_model_change(self, data, model, is_created, request) -> None:
+        await publish_team_leads({model.id: model.team_lead_id}, await get_redis())
+
+    async def after_model_delete(self, model, request) -> None:
+        await publish_team_leads({model.id: None}, await get_redis())
+
 
 class UserAdmin(ModelView, model=User):
     column_list = [
@@ -135,3 +166,9 @@ class UserAdmin(ModelView, model=User):
     ]
     page_size = 50
     page_size_options = [10, 25, 50]
+
+    async def after_model_change(self, data, model, is_created, request) -> None:
+        await publish_user_teams({model.id: model.team_id}, await get_redis())
+
+    async def after_model_delete(self, model, request) -> None:
+        await publish_user_teams({model.id: None}, await get_redis())
@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from sqladmin import Admin
 import uvicorn
@@ -13,11 +15,26 @@ from auth_service.admin_service.admin import (
 )
 from auth_service.endpoints.login import login_router
 from auth_service.endpoints.user import user_router
+from auth_service.security.pwd_crypt import shutdown_executor
 from config.config import settings
+from infrastructure.cache.pubsub import start_listener, stop_listener
+from infrastructure.db.redis_db import close_redis, init_redis
+from infrastructure.metrics.metrics import metrics_router
 from infrastructure.db.sql_db import engine, init_models
 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await init_models()
+    redis = await init_redis()
+    start_listener(redis)
+    yield
+    await stop_listener()
+    await close_redis()
+    shutdown_executor()
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 authentication_backend = AdminAuth(secret_key='...')
@@ -26,6 +43,7 @@ admin = Admin(app=app, engine=engine, authentication_backend=authentication_back
 
 app.include_router(login_router, prefix=f'{settings.API_URL}/auth')
 app.include_router(user_router, prefix=f'{settings.API_URL}/users')
+app.include_router(metrics_router, prefix=f'{settings.API_URL}/internal/metrics')
 
 
 admin.add_view(CalendarAdmin)
@@ -36,11 +54,6 @@ admin.add_view(TeamAdmin)
 admin.add_view(UserAdmin)
 
 
-@app.on_event('startup')
-async def on_startup():
-    await init_models()
-
-
 # if __name__ == '__main__':
 #     asyncio.run(init_models())
 #     uvicorn.run(
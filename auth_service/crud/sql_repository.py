@@ -2,7 +2,6 @@ from datetime import date
 from typing import Optional, Sequence, Union
 from uuid import UUID
 
-from fastapi_pagination import Params
 from fastapi_pagination.ext.sqlalchemy import paginate
 from pydantic import EmailStr
 from sqlalchemy import update, delete
@@ -10,8 +9,11 @@ from sqlalchemy.orm import selectinload, joinedload
 from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from infrastructure.db.keyset import keyset_paginate
+from infrastructure.db.sql_db import replica_safe
 from infrastructure.models.team import Team
 from infrastructure.models.user import User, UserPosition, UserStatus
+from infrastructure.schemas.pagination import KeysetParams
 from infrastructure.schemas.user import (
     UserCreate,
     UserEditManager,
@@ -25,8 +27,13 @@ async def get_user_by_id(session: AsyncSession, id: UUID) -> Optional[User]:
     return result.scalar()
 
 
-async def get_all_users_db(session: AsyncSession, params: Params) -> Sequence[User]:
+@replica_safe
+async def get_all_users_db(
+    session: AsyncSession, params: KeysetParams
+) -> Sequence[User]:
     query = select(User)
+    if params.is_keyset:
+        return await keyset_paginate(session, query, params, [User.id])
     return await paginate(session, query, params)
 
 
@@ -43,6 +50,15 @@ async def create_new_user(session: AsyncSession, user_data: UserCreate) -> User:
     return new_user
 
 
+async def update_user_password(
+    session: AsyncSession, user: User, hashed_password: str
+) -> User:
+    user.password = hashed_password
+    await session.commit()
+    return user
+
+
+@replica_safe
 async def get_user_full_info_by_id(session: AsyncSession, id: UUID) -> Optional[User]:
     query = (
         select(User)
@@ -66,28 +82,40 @@ async def update_user_data(
     if update_data.get('position') == UserStatus.FIRED:
         update_data['fired_at'] = date.today()
 
-    stmt = update(User).where(User.id == user_id).values(**update_data)
-    await session.execute(stmt)
-    await session.commit()
+    if not update_data:
+        return await get_user_by_id(session, user_id)
 
-    result = await session.execute(select(User).where(User.id == user_id))
-    return result.scalar()
+    stmt = update(User).where(User.id == user_id).values(**update_data).returning(User)
+    updated_user = await session.scalar(stmt)
+    await session.commit()
+    return updated_user
 
 
 async def rehire_user_db(session: AsyncSession, user_to_rehire: User) -> User:
-    user_to_rehire.fired_at = None
-    user_to_rehire.status = UserStatus.ACTIVE
+    stmt = (
+        update(User)
+        .where(User.id == user_to_rehire.id)
+        .values(fired_at=None, status=UserStatus.ACTIVE)
+        .returning(User)
+    )
+    user_to_rehire = await session.scalar(stmt)
     await session.commit()
-    await session.refresh(user_to_rehire)
     return user_to_rehire
 
 
 async def fire_user_db(session: AsyncSession, user_to_fire: User) -> User:
-    user_to_fire.status = UserStatus.FIRED
-    user_to_fire.position = UserPosition.NONE
-    user_to_fire.fired_at = date.today()
+    stmt = (
+        update(User)
+        .where(User.id == user_to_fire.id)
+        .values(
+            status=UserStatus.FIRED,
+            position=UserPosition.NONE,
+            fired_at=date.today(),
+        )
+        .returning(User)
+    )
+    user_to_fire = await session.scalar(stmt)
     await session.commit()
-    await session.refresh(user_to_fire)
     return user_to_fire
 
 
@@ -98,6 +126,12 @@ async def delete_user_by_id(session: AsyncSession, user_id: UUID) -> int:
     return deleted_rows
 
 
+async def get_team_id_by_team_lead_id(
+    session: AsyncSession, team_lead_id: UUID
+) -> Optional[int]:
+    return await session.scalar(select(Team.id).filter_by(team_lead_id=team_lead_id))
+
+
 async def get_team(session: AsyncSession):
     query = select(Team).options(joinedload(Team.members))
     result = await session.execute(query)
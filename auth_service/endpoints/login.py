@@ -1,21 +1,35 @@
-from typing import Annotated
+from typing import Annotated, Optional
+from uuid import UUID
 
 from fastapi import Depends, APIRouter, Request, status
+from redis import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config.config import settings
-from config.constants import SERVICE_SECRET_KEY_HEADER
+from config.constants import (
+    REFRESH_TOKEN_TYPE,
+    SERVICE_SECRET_KEY_HEADER,
+    USER_AUTH_HEADER,
+)
 from auth_service.crud.sql_repository import (
     create_new_user,
     get_user_by_email,
+    get_user_by_id,
 )
+from infrastructure.cache.revocation import is_token_revoked, revoke_token
+from infrastructure.cache.user_cache import get_user_version
+from infrastructure.db.redis_db import get_redis
 from infrastructure.db.sql_db import get_session
 from infrastructure.exceptions.auth_exceptions import (
     EmailAlreadyExistsException,
     IncorrectEmailOrPasswordException,
     InvalidServiceSecretKeyException,
+    InvalidTokenException,
+    NotEnoughRightsException,
+    TokenRevokedException,
+    UserNotFoundException,
 )
-from infrastructure.schemas.token import Token
+from infrastructure.schemas.token import Token, TokenRefresh
 from infrastructure.schemas.user import (
     UserAuthentication,
     UserCreate,
@@ -25,7 +39,9 @@ from auth_service.security.authentication import (
     authenticate_user,
     create_access_token_for_user,
     create_internal_access_token,
+    create_refresh_token_for_user,
 )
+from auth_service.security.identification import decode_jwt
 from auth_service.security.pwd_crypt import get_hashed_password
 
 
@@ -43,7 +59,7 @@ async def create_user(
     if user:
         raise EmailAlreadyExistsException
 
-    user_data.password = get_hashed_password(user_data.password)
+    user_data.password = await get_hashed_password(user_data.password)
     new_user = await create_new_user(session, user_data)
     return new_user
 
@@ -52,13 +68,71 @@ async def create_user(
 async def user_login_for_access_token(
     form_data: UserAuthentication,
     session: Annotated[AsyncSession, Depends(get_session)],
+    redis: Annotated[Redis, Depends(get_redis)],
 ):
     user = await authenticate_user(session, form_data.email, form_data.password)
     if not user:
         raise IncorrectEmailOrPasswordException
 
-    access_token = create_access_token_for_user(user)
-    return Token(access_token=access_token, token_type='Bearer')
+    if not settings.USER_TOKEN_CLAIMS_ENABLED:
+        access_token = create_access_token_for_user(user)
+        return Token(access_token=access_token, token_type='Bearer')
+
+    version = await get_user_version(str(user.id), redis)
+    access_token = create_access_token_for_user(user, version)
+    refresh_token = create_refresh_token_for_user(user)
+    return Token(
+        access_token=access_token, token_type='Bearer', refresh_token=refresh_token
+    )
+
+
+@login_router.post('/token_refresh', response_model=Token)
+async def user_refresh_access_token(
+    refresh_data: TokenRefresh,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    redis: Annotated[Redis, Depends(get_redis)],
+):
+    payload = decode_jwt(
+        f'Bearer {refresh_data.refresh_token}', settings.USER_JWT_SECRET_KEY
+    )
+    if payload.get('type') != REFRESH_TOKEN_TYPE:
+        raise InvalidTokenException
+    if await is_token_revoked(payload, redis):
+        raise TokenRevokedException
+
+    user = await get_user_by_id(session, UUID(payload['sub']))
+    if user is None:
+        raise UserNotFoundException
+
+    version = await get_user_version(str(user.id), redis)
+    access_token = create_access_token_for_user(user, version)
+    return Token(
+        access_token=access_token,
+        token_type='Bearer',
+        refresh_token=refresh_data.refresh_token,
+    )
+
+
+@login_router.post('/logout', status_code=status.HTTP_204_NO_CONTENT)
+async def user_logout(
+    request: Request,
+    redis: Annotated[Redis, Depends(get_redis)],
+    refresh_data: Optional[TokenRefresh] = None,
+):
+    authorization_header = request.headers.get(USER_AUTH_HEADER)
+    if not authorization_header:
+        raise NotEnoughRightsException
+
+    payload = decode_jwt(authorization_header, settings.USER_JWT_SECRET_KEY)
+    await revoke_token(payload, redis)
+
+    if refresh_data:
+        refresh_payload = decode_jwt(
+            f'Bearer {refresh_data.refresh_token}', settings.USER_JWT_SECRET_KEY
+        )
+        if refresh_payload['sub'] != payload['sub']:
+            raise InvalidTokenException
+        await revoke_token(refresh_payload, redis)
 
 
 @login_router.post('/token_service', response_model=Token)
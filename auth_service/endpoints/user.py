@@ -1,9 +1,9 @@
 from datetime import date, timedelta
-from typing import Annotated
+from typing import Annotated, Union
 from uuid import UUID
 
 from fastapi import Depends, APIRouter, Request, status
-from fastapi_pagination import Page, Params
+from fastapi_pagination import Page
 from redis import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,6 +15,7 @@ from auth_service.crud.sql_repository import (
     delete_user_by_object,
     fire_user_db,
     get_all_users_db,
+    get_team_id_by_team_lead_id,
     get_user_by_email,
     get_user_by_id,
     get_user_full_info_by_id,
@@ -26,6 +27,9 @@ from auth_service.permissions.rbac_user import (
     require_authentication,
     require_user_authentication,
 )
+from config.config import settings
+from infrastructure.cache.membership import publish_team_leads, publish_user_teams
+from infrastructure.cache.user_cache import publish_user_invalidation
 from infrastructure.db.redis_db import get_redis
 from infrastructure.exceptions.auth_exceptions import (
     EmailAlreadyExistsException,
@@ -42,6 +46,7 @@ from infrastructure.exceptions.user_exeptions import (
 from config.constants import DAYS_TILL_DELETE, USER_REDIS_KEY
 from infrastructure.models.user import UserPosition, UserStatus
 
+from infrastructure.schemas.pagination import CursorPage, KeysetParams
 from infrastructure.schemas.user import (
     UserEditManager,
     UserMinimal,
@@ -54,13 +59,13 @@ from infrastructure.db.sql_db import get_session
 user_router = APIRouter()
 
 
-@user_router.get('/', response_model=Page[UserMinimal])
+@user_router.get('/', response_model=Union[Page[UserMinimal], CursorPage[UserMinimal]])
 @require_authentication
 async def get_all_users(
     request: Request,
     session: Annotated[AsyncSession, Depends(get_session)],
     redis: Annotated[Redis, Depends(get_redis)],
-    params: Annotated[Params, Depends()],
+    params: Annotated[KeysetParams, Depends()],
 ):
     users = await get_all_users_db(session, params)
     return users
@@ -98,7 +103,9 @@ async def edit_myself(
         str_user_id,
         UserMinimal.model_validate(updated_user).model_dump_json(),
         redis,
+        settings.USER_CACHE_EXPIRE_SECONDS,
     )
+    await publish_user_invalidation(str_user_id, redis)
 
     return updated_user
 
@@ -128,7 +135,9 @@ async def rehire_user(
         str(user_id),
         user_pydantic.model_dump_json(),
         redis,
+        settings.USER_CACHE_EXPIRE_SECONDS,
     )
+    await publish_user_invalidation(str(user_id), redis)
 
     return user_pydantic
 
@@ -158,7 +167,9 @@ async def fire_user(
         str(user_id),
         user_pydantic.model_dump_json(),
         redis,
+        settings.USER_CACHE_EXPIRE_SECONDS,
     )
+    await publish_user_invalidation(str(user_id), redis)
 
     return user_pydantic
 
@@ -203,7 +214,11 @@ async def edit_user_info(
         str(edited_user.id),
         UserMinimal.model_validate(edited_user).model_dump_json(),
         redis,
+        settings.USER_CACHE_EXPIRE_SECONDS,
     )
+    await publish_user_invalidation(str(edited_user.id), redis)
+    if new_user_data.team_id is not None:
+        await publish_user_teams({edited_user.id: edited_user.team_id}, redis)
 
     return edited_user
 
@@ -224,5 +239,11 @@ async def delete_user(
     if user_to_delete.fired_at + timedelta(days=DAYS_TILL_DELETE) > date.today():
         raise NotAllowedToDeleteException
 
+    # The team the user led is left without a lead.
+    led_team_id = await get_team_id_by_team_lead_id(session, user_id)
     await delete_user_by_object(session, user_to_delete)
     await delete_key_from_cache(USER_REDIS_KEY, str(user_id), redis)
+    if led_team_id is not None:
+        await publish_team_leads({led_team_id: None}, redis)
+    await publish_user_teams({user_id: None}, redis)
+    await publish_user_invalidation(str(user_id), redis)
@@ -7,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from auth_service.security.identification import identificate_service, identificate_user
 from infrastructure.db.redis_db import get_redis
-from infrastructure.db.sql_db import get_session
+from infrastructure.db.sql_db import get_session, release_session, route_session
 from infrastructure.exceptions.auth_exceptions import NotEnoughRightsException
 from config.constants import SERVICE_AUTH_HEADER, USER_AUTH_HEADER
 from infrastructure.models.user import UserStatus
@@ -30,6 +30,7 @@ def require_position_authentication(positions: list):
                 current_user = await identificate_user(
                     user_authorization_header, session, redis
                 )
+                await route_session(request, session, current_user.id, redis)
 
                 if current_user.status != UserStatus.ACTIVE:
                     raise NotEnoughRightsException
@@ -46,7 +47,10 @@ def require_position_authentication(positions: list):
             args_list = [user_id, request, session, redis]
             if new_user_data:
                 args_list.append(new_user_data)
-            return await func(*args_list)
+            try:
+                return await func(*args_list)
+            finally:
+                await release_session(session)
 
         return wrapper
 
@@ -71,6 +75,7 @@ def require_authentication(func):
             current_user = await identificate_user(
                 user_authorization_header, session, redis
             )
+            await route_session(request, session, current_user.id, redis)
 
         elif service_authorization_header:
             permission = identificate_service(service_authorization_header)
@@ -90,7 +95,10 @@ def require_authentication(func):
         if user_id:
             args_list.append(user_id)
 
-        return await func(*args_list)
+        try:
+            return await func(*args_list)
+        finally:
+            await release_session(session)
 
     return wrapper
 
@@ -111,6 +119,7 @@ def require_user_authentication(func):
         current_user = await identificate_user(
             user_authorization_header, session, redis
         )
+        await route_session(request, session, current_user.id, redis)
         if current_user.status != UserStatus.ACTIVE:
             raise NotEnoughRightsException
 
@@ -120,6 +129,9 @@ def require_user_authentication(func):
             args_list.append(new_user_data)
         args_list.append(current_user)
 
-        return await func(*args_list)
+        try:
+            return await func(*args_list)
+        finally:
+            await release_session(session)
 
     return wrapper
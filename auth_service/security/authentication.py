@@ -1,29 +1,66 @@
 from datetime import datetime, timedelta
 from typing import Optional
+from uuid import uuid4
 
 import jwt
 from pydantic import EmailStr
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config.config import settings
+from config.constants import ACCESS_TOKEN_TYPE, REFRESH_TOKEN_TYPE
 from infrastructure.models.user import User
-from auth_service.crud.sql_repository import get_user_by_email
-from auth_service.security.pwd_crypt import verify_password
+from auth_service.crud.sql_repository import get_user_by_email, update_user_password
+from auth_service.security.pwd_crypt import verify_password_and_update
 
 
 async def authenticate_user(
     session: AsyncSession, email: EmailStr, password: str
 ) -> Optional[User]:
     user = await get_user_by_email(session, email)
-    if not user or not verify_password(password, user.password):
+    if not user:
         return None
+
+    verified, new_hash = await verify_password_and_update(password, user.password)
+    if not verified:
+        return None
+    # Hash was made with outdated bcrypt settings, upgrade it transparently.
+    if new_hash:
+        await update_user_password(session, user, new_hash)
     return user
 
 
-def create_access_token_for_user(user: User) -> str:
-    to_encode = {'sub': str(user.id)}
+def create_access_token_for_user(user: User, version: Optional[int] = None) -> str:
+    to_encode = {'sub': str(user.id), 'jti': uuid4().hex}
+    if version is None:
+        expire = datetime.now() + timedelta(
+            minutes=settings.USER_ACCESS_TOKEN_EXPIRE_MINUTES
+        )
+    else:
+        # Services trust these claims while the user version is current,
+        # the short lifetime bounds how stale they can get otherwise.
+        expire = datetime.now() + timedelta(
+            minutes=settings.USER_CLAIMS_ACCESS_TOKEN_EXPIRE_MINUTES
+        )
+        to_encode.update(
+            {
+                'type': ACCESS_TOKEN_TYPE,
+                'ver': version,
+                'position': user.position.value,
+                'status': user.status.value,
+                'team_id': user.team_id,
+            }
+        )
+    to_encode.update({'exp': expire})
+    encoded_jwt = jwt.encode(
+        to_encode, settings.USER_JWT_SECRET_KEY, algorithm=settings.ALGORITHM
+    )
+    return encoded_jwt
+
+
+def create_refresh_token_for_user(user: User) -> str:
+    to_encode = {'sub': str(user.id), 'type': REFRESH_TOKEN_TYPE, 'jti': uuid4().hex}
     expire = datetime.now() + timedelta(
-        minutes=settings.USER_ACCESS_TOKEN_EXPIRE_MINUTES
+        minutes=settings.USER_REFRESH_TOKEN_EXPIRE_MINUTES
     )
     to_encode.update({'exp': expire})
     encoded_jwt = jwt.encode(
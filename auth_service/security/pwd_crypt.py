@@ -1,12 +1,81 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
 from passlib.context import CryptContext
 
+from config.config import settings
+from infrastructure.exceptions.auth_exceptions import PasswordHashingBusyException
+
+
+pwd_context = CryptContext(
+    schemes=['bcrypt'], deprecated='auto', bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+executor: Optional[Executor] = None
+pending_jobs = 0
 
 
-def verify_password(plain_code, hashed_code) -> bool:
-    return pwd_context.verify(plain_code, hashed_code)
+def verify_and_update_sync(plain_code, hashed_code) -> tuple[bool, Optional[str]]:
+    return pwd_context.verify_and_update(plain_code, hashed_code)
 
 
-def get_hashed_password(password) -> str:
+def get_hashed_password_sync(password) -> str:
     return pwd_context.hash(password)
+
+
+def get_executor() -> Executor:
+    global executor
+
+    if executor is None:
+        if settings.PASSWORD_HASHING_EXECUTOR == 'process':
+            executor = ProcessPoolExecutor(
+                max_workers=settings.PASSWORD_HASHING_WORKERS
+            )
+        else:
+            executor = ThreadPoolExecutor(
+                max_workers=settings.PASSWORD_HASHING_WORKERS,
+                thread_name_prefix='pwd_crypt',
+            )
+    return executor
+
+
+def shutdown_executor() -> None:
+    global executor
+
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+        executor = None
+
+
+async def run_in_executor(func, *args):
+    global pending_jobs
+
+    if settings.PASSWORD_HASHING_EXECUTOR == 'inline':
+        return func(*args)
+
+    # Fail fast instead of queueing logins behind a saturated pool.
+    if pending_jobs >= settings.PASSWORD_HASHING_MAX_PENDING:
+        raise PasswordHashingBusyException
+
+    pending_jobs += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_executor(), func, *args)
+    finally:
+        pending_jobs -= 1
+
+
+async def verify_password_and_update(
+    plain_code, hashed_code
+) -> tuple[bool, Optional[str]]:
+    return await run_in_executor(verify_and_update_sync, plain_code, hashed_code)
+
+
+async def verify_password(plain_code, hashed_code) -> bool:
+    verified, _ = await verify_password_and_update(plain_code, hashed_code)
+    return verified
+
+
+async def get_hashed_password(password) -> str:
+    return await run_in_executor(get_hashed_password_sync, password)
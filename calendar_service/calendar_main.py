@@ -1,14 +1,29 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 import uvicorn
 
 from config.config import settings
 from calendar_service.endpoints.calendar import calendar_router
+from infrastructure.cache.pubsub import start_listener, stop_listener
+from infrastructure.db.redis_db import close_redis, init_redis
+from infrastructure.metrics.metrics import metrics_router
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    redis = await init_redis()
+    start_listener(redis)
+    yield
+    await stop_listener()
+    await close_redis()
 
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 
 app.include_router(calendar_router, prefix=f'{settings.API_URL}/calendar')
+app.include_router(metrics_router, prefix=f'{settings.API_URL}/internal/metrics')
 
 
 # if __name__ == '__main__':
@@ -1,17 +1,24 @@
-from typing import Optional
+from datetime import datetime
+from typing import Optional, Sequence
 from uuid import UUID
 
-from fastapi_pagination import Params
 from fastapi_pagination.ext.sqlalchemy import paginate
-from sqlalchemy import or_
+from sqlalchemy import and_
 from sqlalchemy.orm import selectinload
 from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from infrastructure.models.calendar import CalendarEvent, EventType
+from infrastructure.db.keyset import keyset_paginate
+from infrastructure.db.sql_db import replica_safe
+from infrastructure.models.calendar import (
+    CalendarEvent,
+    EventType,
+    UserCalendarEntry,
+)
 from infrastructure.models.meeting import Meeting
-from infrastructure.models.task import Task
 from infrastructure.models.user import User
+from infrastructure.scheduling.recurrence import get_meeting_intervals
+from infrastructure.schemas.pagination import KeysetParams
 
 
 async def get_user_by_id(session: AsyncSession, id: UUID) -> Optional[User]:
@@ -20,60 +27,70 @@ async def get_user_by_id(session: AsyncSession, id: UUID) -> Optional[User]:
     return result.scalar()
 
 
+@replica_safe
 async def get_employee_events(
     session: AsyncSession,
     employee_id: UUID,
-    params: Params,
+    params: KeysetParams,
     event_type: Optional[EventType] = None,
+    from_time: Optional[datetime] = None,
+    to_time: Optional[datetime] = None,
 ):
     query = (
         select(CalendarEvent)
-        .outerjoin(Meeting)
-        .outerjoin(Task)
-        .filter(
-            or_(
-                Meeting.participants.any(id=employee_id),
-                Task.employee_id == employee_id,
-                CalendarEvent.event_creator_id == employee_id,
-            )
-        )
+        .join(UserCalendarEntry)
+        .where(UserCalendarEntry.user_id == employee_id)
         .options(
-            selectinload(CalendarEvent.meeting),
+            selectinload(CalendarEvent.meeting).selectinload(
+                Meeting.occurrence_overrides
+            ),
             selectinload(CalendarEvent.task),
             selectinload(CalendarEvent.event_creator),
         )
     )
 
     if event_type:
-        query = query.filter(CalendarEvent.event_type == event_type)
+        query = query.filter(UserCalendarEntry.event_type == event_type)
 
-    return await paginate(session, query, params)
+    # Events overlapping [from_time, to_time); tasks are points at their due
+    # date. Filtering on end_time first uses the (user_id, end_time) index,
+    # which for current and future ranges only covers a few rows.
+    if from_time:
+        query = query.filter(UserCalendarEntry.end_time >= from_time)
+    if to_time:
+        query = query.filter(UserCalendarEntry.start_time < to_time)
 
+    # Ordering by the read model columns keeps it one index range scan.
+    order_columns = [UserCalendarEntry.start_time, UserCalendarEntry.calendar_event_id]
+    if params.is_keyset:
+        return await keyset_paginate(
+            session, query, params, order_columns, row_keys=['start_time', 'id']
+        )
+    return await paginate(session, query.order_by(*order_columns), params)
 
+
+@replica_safe
 async def get_event_full_info_by_id(
     session: AsyncSession, employee_id: UUID, event_id: int
 ):
     if employee_id:
         query = (
             select(CalendarEvent)
-            .outerjoin(Meeting)
-            .outerjoin(Task)
-            .filter(
-                or_(
-                    Meeting.participants.any(id=employee_id),
-                    Task.employee_id == employee_id,
-                    CalendarEvent.event_creator_id == employee_id,
-                )
-            )
+            .join(UserCalendarEntry)
+            .where(UserCalendarEntry.user_id == employee_id)
             .options(
-                selectinload(CalendarEvent.meeting),
+                selectinload(CalendarEvent.meeting).selectinload(
+                    Meeting.occurrence_overrides
+                ),
                 selectinload(CalendarEvent.task),
                 selectinload(CalendarEvent.event_creator),
             )
         )
     else:
         query = select(CalendarEvent).options(
-            selectinload(CalendarEvent.meeting),
+            selectinload(CalendarEvent.meeting).selectinload(
+                Meeting.occurrence_overrides
+            ),
             selectinload(CalendarEvent.task),
             selectinload(CalendarEvent.event_creator),
         )
@@ -82,3 +99,54 @@ async def get_event_full_info_by_id(
     result = await session.execute(query)
 
     return result.scalar()
+
+
+@replica_safe
+async def get_busy_intervals(
+    session: AsyncSession,
+    user_ids: Sequence[UUID],
+    start_time: datetime,
+    end_time: datetime,
+):
+    """(user_id, start_time, end_time) of events overlapping the window.
+
+    Tasks are points at their due date and don't take up time. Entries of
+    recurring meetings span the series and are replaced by the occurrences
+    inside the window.
+    """
+    query = (
+        select(
+            UserCalendarEntry.user_id,
+            UserCalendarEntry.start_time,
+            UserCalendarEntry.end_time,
+            Meeting,
+        )
+        .outerjoin(
+            Meeting,
+            and_(
+                Meeting.calendar_event_id == UserCalendarEntry.calendar_event_id,
+                Meeting.recurrence_rule.is_not(None),
+            ),
+        )
+        .where(
+            UserCalendarEntry.user_id.in_(user_ids),
+            UserCalendarEntry.end_time > start_time,
+            UserCalendarEntry.start_time < end_time,
+            UserCalendarEntry.start_time < UserCalendarEntry.end_time,
+        )
+        .options(selectinload(Meeting.occurrence_overrides))
+    )
+    result = await session.execute(query)
+
+    intervals = []
+    for user_id, entry_start, entry_end, meeting in result.all():
+        if meeting is None:
+            intervals.append((user_id, entry_start, entry_end))
+            continue
+        intervals.extend(
+            (user_id, occurrence_start, occurrence_end)
+            for occurrence_start, occurrence_end in get_meeting_intervals(
+                meeting, start_time, end_time
+            )
+        )
+    return intervals
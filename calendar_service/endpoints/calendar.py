@@ -1,38 +1,84 @@
-from typing import Annotated, Optional
+from collections import defaultdict
+from datetime import datetime
+from itertools import chain
+from typing import Annotated, Optional, Union
 
-from fastapi import Depends, APIRouter, Request
-from fastapi_pagination import Page, Params
+from fastapi import Depends, APIRouter, Query, Request
+from fastapi_pagination import Page
 from redis import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from calendar_service.crud.sql_repository import (
+    get_busy_intervals,
     get_employee_events,
     get_event_full_info_by_id,
 )
 from calendar_service.permissions.rbac_calendar import require_authentication
+from infrastructure.cache.free_busy import cache_busy_days, get_cached_busy_days
 from infrastructure.db.redis_db import get_redis
 from infrastructure.exceptions.basic_exeptions import NotFoundException
+from infrastructure.exceptions.calendar_exceptions import InvalidTimeRangeException
 from infrastructure.models.calendar import EventType
 from infrastructure.models.user import UserPosition
-from infrastructure.db.sql_db import get_session
-from infrastructure.schemas.calendar import CalendarFull
+from infrastructure.db.sql_db import get_session, read_only
+from infrastructure.schemas.calendar import (
+    CalendarFull,
+    FreeBusy,
+    FreeBusyRequest,
+    TimeInterval,
+    UserBusy,
+)
+from infrastructure.schemas.meeting import get_meeting_occurrences
+from infrastructure.schemas.pagination import CursorPage, KeysetParams
+from infrastructure.scheduling.intervals import (
+    clip_intervals,
+    get_day_bounds,
+    get_days,
+    get_free_intervals,
+    merge_intervals,
+)
 
 
 calendar_router = APIRouter()
 
 
-@calendar_router.get('/', response_model=Page[CalendarFull])
+def with_occurrences(
+    event, from_time: Optional[datetime] = None, to_time: Optional[datetime] = None
+) -> CalendarFull:
+    occurrences = []
+    if event.meeting is not None:
+        occurrences = get_meeting_occurrences(event.meeting, from_time, to_time)
+    return CalendarFull.model_validate(event).model_copy(
+        update={'occurrences': occurrences}
+    )
+
+
+@calendar_router.get(
+    '/', response_model=Union[Page[CalendarFull], CursorPage[CalendarFull]]
+)
 @require_authentication
 async def get_my_calendar_events(
     request: Request,
     session: Annotated[AsyncSession, Depends(get_session)],
     redis: Annotated[Redis, Depends(get_redis)],
-    params: Annotated[Params, Depends()],
+    params: Annotated[KeysetParams, Depends()],
     current_user=None,
     event_type: Optional[EventType] = None,
+    from_time: Optional[datetime] = Query(None, alias='from'),
+    to_time: Optional[datetime] = Query(None, alias='to'),
 ):
-    events = await get_employee_events(session, current_user.id, params, event_type)
-    print(events)
+    from_time = from_time and from_time.replace(tzinfo=None)
+    to_time = to_time and to_time.replace(tzinfo=None)
+    if from_time and to_time and to_time <= from_time:
+        raise InvalidTimeRangeException
+
+    events = await get_employee_events(
+        session, current_user.id, params, event_type, from_time, to_time
+    )
+    # Recurring meetings are expanded only for the events of this page.
+    events.items = [
+        with_occurrences(event, from_time, to_time) for event in events.items
+    ]
 
     return events
 
@@ -58,4 +104,78 @@ async def get_calendar_event_info(
     if not event:
         raise NotFoundException
 
-    return event
+    return with_occurrences(event)
+
+
+def to_time_intervals(intervals) -> list[TimeInterval]:
+    return [TimeInterval(start_time=start, end_time=end) for start, end in intervals]
+
+
+@calendar_router.post('/free_busy', response_model=FreeBusy)
+@read_only
+@require_authentication
+async def get_free_busy(
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    redis: Annotated[Redis, Depends(get_redis)],
+    free_busy_request: FreeBusyRequest,
+    current_user=None,
+):
+    user_ids = free_busy_request.user_ids
+    start_time = free_busy_request.start_time
+    end_time = free_busy_request.end_time
+    days = get_days(start_time, end_time)
+
+    # Busy intervals are cached per (user, day); the missing ones are
+    # loaded with one query spanning all missing days.
+    busy_days = await get_cached_busy_days(user_ids, days, redis)
+    missing = [
+        (user_id, day)
+        for user_id in user_ids
+        for day in days
+        if (user_id, day) not in busy_days
+    ]
+    if missing:
+        missing_days = sorted({day for _, day in missing})
+        rows = await get_busy_intervals(
+            session,
+            list({user_id for user_id, _ in missing}),
+            get_day_bounds(missing_days[0])[0],
+            get_day_bounds(missing_days[-1])[1],
+        )
+        user_intervals = defaultdict(list)
+        for user_id, busy_start, busy_end in rows:
+            user_intervals[user_id].append((busy_start, busy_end))
+
+        loaded_days = {
+            (user_id, day): merge_intervals(
+                clip_intervals(user_intervals[user_id], *get_day_bounds(day))
+            )
+            for user_id, day in missing
+        }
+        await cache_busy_days(loaded_days, redis)
+        busy_days.update(loaded_days)
+
+    users_busy = {
+        user_id: merge_intervals(
+            clip_intervals(
+                chain.from_iterable(busy_days[(user_id, day)] for day in days),
+                start_time,
+                end_time,
+            )
+        )
+        for user_id in user_ids
+    }
+    free = get_free_intervals(
+        chain.from_iterable(users_busy.values()), start_time, end_time
+    )
+
+    return FreeBusy(
+        start_time=start_time,
+        end_time=end_time,
+        users=[
+            UserBusy(user_id=user_id, busy=to_time_intervals(busy))
+            for user_id, busy in users_busy.items()
+        ],
+        free=to_time_intervals(free),
+    )
@@ -6,7 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from calendar_service.security.identification import identificate_user
 from infrastructure.db.redis_db import get_redis
-from infrastructure.db.sql_db import get_session
+from infrastructure.db.sql_db import get_session, release_session, route_session
 from infrastructure.exceptions.auth_exceptions import NotEnoughRightsException
 from config.constants import USER_AUTH_HEADER
 from infrastructure.models.user import UserStatus
@@ -20,8 +20,11 @@ def require_authentication(func):
         redis: Redis = Depends(get_redis),
         params=None,
         calendar_id=None,
+        free_busy_request=None,
         current_user=None,
         event_type=None,
+        from_time=None,
+        to_time=None,
     ):
         user_authorization_header = request.headers.get(USER_AUTH_HEADER)
 
@@ -30,6 +33,7 @@ def require_authentication(func):
         current_user = await identificate_user(
             user_authorization_header, session, redis
         )
+        await route_session(request, session, current_user.id, redis)
         if current_user.status != UserStatus.ACTIVE:
             raise NotEnoughRightsException
 
@@ -38,11 +42,21 @@ def require_authentication(func):
             args_list.append(params)
         if calendar_id:
             args_list.append(calendar_id)
+        if free_busy_request:
+            args_list.append(free_busy_request)
         if current_user:
             args_list.append(current_user)
         if event_type:
             args_list.append(event_type)
-
-        return await func(*args_list)
+        time_range = {
+            key: value
+            for key, value in (('from_time', from_time), ('to_time', to_time))
+            if value
+        }
+
+        try:
+            return await func(*args_list, **time_range)
+        finally:
+            await release_session(session)
 
     return wrapper
@@ -18,14 +18,62 @@ class Settings(BaseSettings):
     USER_ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 30
     SERVICE_ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 180
 
+    # embed position/status/team claims into short-lived user tokens
+    USER_TOKEN_CLAIMS_ENABLED: bool = False
+    USER_CLAIMS_ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
+    USER_REFRESH_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 30
+
+    JWT_CACHE_SIZE: int = 10000
+    JWT_CACHE_EXPIRE_SECONDS: int = 60 * 60
+
+    # ~180 KB of memory for 100k revoked tokens at 0.1% false positives
+    REVOCATION_BLOOM_CAPACITY: int = 100000
+    REVOCATION_BLOOM_ERROR_RATE: float = 0.001
+
+    BCRYPT_ROUNDS: int = 12
+    # 'thread', 'process' or 'inline' (on the event loop, no offloading)
+    PASSWORD_HASHING_EXECUTOR: str = 'thread'
+    PASSWORD_HASHING_WORKERS: int = 4
+    PASSWORD_HASHING_MAX_PENDING: int = 32
+
     POSTGRES_USER: str = 'postgres'
     POSTGRES_PASSWORD: str = 'postgres'
     POSTGRES_DB: str = 'db'
     DB_HOST: str = 'db'
     DB_PORT: int = 5432
 
+    # name of the running service, selects DB_ENGINE_OVERRIDES entry
+    SERVICE_NAME: str = ''
+
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 60 * 30
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    # per-service engine options, e.g. {"auth_service": {"pool_size": 10}}
+    DB_ENGINE_OVERRIDES: dict[str, dict] = {}
+    # read replicas, full SQLAlchemy URLs
+    DB_REPLICA_URLS: list[str] = []
+    # reads stay on the primary this long after the user's last write
+    DB_READ_YOUR_WRITES_SECONDS: int = 5
+
     REDIS_HOST: str = 'redis_service'
     REDIS_PORT: int = 6379
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT: int = 5
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30
+
+    USER_CACHE_EXPIRE_SECONDS: int = 60 * 5
+    USER_LOCAL_CACHE_SIZE: int = 1024
+    USER_LOCAL_CACHE_EXPIRE_SECONDS: int = 60
+
+    MEMBERSHIP_CACHE_EXPIRE_SECONDS: int = 60 * 5
+    MEMBERSHIP_LOCAL_CACHE_SIZE: int = 4096
+    MEMBERSHIP_LOCAL_CACHE_EXPIRE_SECONDS: int = 60
+
+    FREE_BUSY_CACHE_EXPIRE_SECONDS: int = 60 * 5
 
     API_URL: str = '/api/v1'
 
@@ -33,6 +81,20 @@ class Settings(BaseSettings):
     def db_url(self):
         return f'postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.POSTGRES_DB}'
 
+    @property
+    def db_engine_options(self) -> dict:
+        options = {
+            'echo': self.DB_ECHO,
+            'pool_size': self.DB_POOL_SIZE,
+            'max_overflow': self.DB_MAX_OVERFLOW,
+            'pool_timeout': self.DB_POOL_TIMEOUT,
+            'pool_recycle': self.DB_POOL_RECYCLE,
+            'pool_pre_ping': self.DB_POOL_PRE_PING,
+            'statement_cache_size': self.DB_STATEMENT_CACHE_SIZE,
+        }
+        options.update(self.DB_ENGINE_OVERRIDES.get(self.SERVICE_NAME, {}))
+        return options
+
     @property
     def redis_url(self):
         return f'redis://{self.REDIS_HOST}:{self.REDIS_PORT}'
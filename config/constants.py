@@ -6,9 +6,11 @@ EMAIL_LENGTH = 150
 MAX_DAYS_INACTIVE = 30
 
 TEAM_NAME_LENGTH = 50
+TEAM_PREVIEW_MEMBERS = 20
 TASK_NAME_LENGTH = 50
 EVENT_NAME_LENGTH = 50
 MEETING_NAME_LENGTH = 50
+RECURRENCE_RULE_LENGTH = 255
 
 PASSWORD_REGEX = re.compile(
     r'^'
@@ -25,6 +27,30 @@ SERVICE_AUTH_HEADER = 'X-Service-Auth'
 USER_AUTH_HEADER = 'Authorization'
 
 
+READ_ONLY_METHODS = ('GET', 'HEAD', 'OPTIONS')
+RECENT_WRITE_REDIS_KEY = 'recent_write'
+
 USER_REDIS_KEY = 'user'
+USER_INVALIDATION_CHANNEL = 'user_invalidation'
+USER_VERSION_REDIS_KEY = 'user_version'
+
+REVOKED_TOKENS_REDIS_KEY = 'revoked_tokens'
+REVOKED_TOKENS_CHANNEL = 'token_revocation'
+
+TEAM_LEAD_REDIS_KEY = 'team_lead'
+TEAM_LEAD_CHANNEL = 'team_lead'
+USER_TEAM_REDIS_KEY = 'user_team'
+USER_TEAM_CHANNEL = 'user_team'
+
+FREE_BUSY_REDIS_KEY = 'free_busy'
+FREE_BUSY_MAX_USERS = 100
+FREE_BUSY_MAX_DAYS = 31
+SLOT_SEARCH_MAX_SLOTS = 50
+RECURRENCE_MAX_OCCURRENCES = 1000
+
+TASK_BULK_MAX_ITEMS = 500
+
+ACCESS_TOKEN_TYPE = 'access'
+REFRESH_TOKEN_TYPE = 'refresh'
 
 DAYS_TILL_DELETE = 30
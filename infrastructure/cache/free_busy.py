@@ -0,0 +1,56 @@
+import json
+from datetime import date, datetime
+from typing import Iterable
+from uuid import UUID
+
+from redis.asyncio import Redis
+
+from config.config import settings
+from config.constants import FREE_BUSY_REDIS_KEY
+from infrastructure.scheduling.intervals import Interval, get_days
+
+
+def get_free_busy_key(user_id: UUID, day: date) -> str:
+    return f'{FREE_BUSY_REDIS_KEY}:{user_id}:{day.isoformat()}'
+
+
+async def get_cached_busy_days(
+    user_ids: Iterable[UUID], days: Iterable[date], redis: Redis
+) -> dict[tuple[UUID, date], list[Interval]]:
+    keys = [(user_id, day) for user_id in user_ids for day in days]
+    values = await redis.mget([get_free_busy_key(*key) for key in keys])
+    return {
+        key: [
+            (datetime.fromisoformat(start), datetime.fromisoformat(end))
+            for start, end in json.loads(value)
+        ]
+        for key, value in zip(keys, values)
+        if value is not None
+    }
+
+
+async def cache_busy_days(
+    busy_days: dict[tuple[UUID, date], list[Interval]], redis: Redis
+) -> None:
+    async with redis.pipeline(transaction=False) as pipe:
+        for (user_id, day), intervals in busy_days.items():
+            value = json.dumps(
+                [[start.isoformat(), end.isoformat()] for start, end in intervals]
+            )
+            pipe.set(
+                get_free_busy_key(user_id, day),
+                value,
+                ex=settings.FREE_BUSY_CACHE_EXPIRE_SECONDS,
+            )
+        await pipe.execute()
+
+
+async def invalidate_free_busy(
+    user_ids: Iterable[UUID], intervals: Iterable[Interval], redis: Redis
+) -> None:
+    days = {day for start, end in intervals for day in get_days(start, end)}
+    keys = [
+        get_free_busy_key(user_id, day) for user_id in set(user_ids) for day in days
+    ]
+    if keys:
+        await redis.delete(*keys)
@@ -0,0 +1,198 @@
+"""Team membership index: team -> team lead and user -> team."""
+
+from typing import Callable, Iterable, Optional
+from uuid import UUID
+
+from redis.asyncio import Redis
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config.config import settings
+from config.constants import (
+    TEAM_LEAD_CHANNEL,
+    TEAM_LEAD_REDIS_KEY,
+    USER_TEAM_CHANNEL,
+    USER_TEAM_REDIS_KEY,
+)
+from infrastructure.cache.lru_cache import LRUCache
+from infrastructure.cache.pubsub import register_channel_handler
+from infrastructure.models.team import Team
+from infrastructure.models.user import User
+
+
+# Stored for teams without a lead and users without a team.
+NO_VALUE = ''
+
+team_lead_cache = LRUCache(
+    max_size=settings.MEMBERSHIP_LOCAL_CACHE_SIZE,
+    ttl=settings.MEMBERSHIP_LOCAL_CACHE_EXPIRE_SECONDS,
+)
+user_team_cache = LRUCache(
+    max_size=settings.MEMBERSHIP_LOCAL_CACHE_SIZE,
+    ttl=settings.MEMBERSHIP_LOCAL_CACHE_EXPIRE_SECONDS,
+)
+
+
+def invalidate_local_team_lead(team_id: str) -> None:
+    team_lead_cache.delete(team_id)
+
+
+def clear_local_team_leads() -> None:
+    team_lead_cache.clear()
+
+
+def invalidate_local_user_team(user_id: str) -> None:
+    user_team_cache.delete(user_id)
+
+
+def clear_local_user_teams() -> None:
+    user_team_cache.clear()
+
+
+register_channel_handler(
+    TEAM_LEAD_CHANNEL, invalidate_local_team_lead, clear_local_team_leads
+)
+register_channel_handler(
+    USER_TEAM_CHANNEL, invalidate_local_user_team, clear_local_user_teams
+)
+
+
+def to_value(value) -> str:
+    return NO_VALUE if value is None else str(value)
+
+
+async def get_entries(
+    keys: Iterable,
+    cache: LRUCache,
+    redis_key: str,
+    load: Callable,
+    parse: Callable[[str], object],
+    redis: Redis,
+) -> dict:
+    """Entries from the local cache, then one MGET, then one `load` query."""
+    entries = {}
+    missing = []
+    for key in set(keys):
+        value = cache.get(str(key))
+        if value is None:
+            missing.append(key)
+        else:
+            entries[key] = parse(value) if value else None
+    if not missing:
+        return entries
+
+    values = await redis.mget([f'{redis_key}:{key}' for key in missing])
+    to_load = []
+    for key, value in zip(missing, values):
+        if value is None:
+            to_load.append(key)
+        else:
+            cache.set(str(key), value)
+            entries[key] = parse(value) if value else None
+    if not to_load:
+        return entries
+
+    loaded = dict.fromkeys(to_load) | dict(await load(to_load))
+    # NX keeps any value a writer published since the MGET.
+    async with redis.pipeline(transaction=False) as pipe:
+        for key, value in loaded.items():
+            pipe.set(
+                f'{redis_key}:{key}',
+                to_value(value),
+                ex=settings.MEMBERSHIP_CACHE_EXPIRE_SECONDS,
+                nx=True,
+            )
+        await pipe.execute()
+
+    for key, value in loaded.items():
+        cache.set(str(key), to_value(value))
+    return entries | loaded
+
+
+async def publish_entries(
+    entries: dict, cache: LRUCache, redis_key: str, channel: str, redis: Redis
+) -> None:
+    """Store committed changes and tell the other processes."""
+    if not entries:
+        return
+
+    async with redis.pipeline(transaction=False) as pipe:
+        for key, value in entries.items():
+            pipe.set(
+                f'{redis_key}:{key}',
+                to_value(value),
+                ex=settings.MEMBERSHIP_CACHE_EXPIRE_SECONDS,
+            )
+            pipe.publish(channel, str(key))
+        await pipe.execute()
+
+    for key, value in entries.items():
+        cache.set(str(key), to_value(value))
+
+
+async def get_team_lead_ids(
+    team_ids: Iterable[int], session: AsyncSession, redis: Redis
+) -> dict[int, Optional[UUID]]:
+    async def load(team_ids):
+        result = await session.execute(
+            select(Team.id, Team.team_lead_id).where(Team.id.in_(team_ids))
+        )
+        return result.all()
+
+    return await get_entries(
+        team_ids, team_lead_cache, TEAM_LEAD_REDIS_KEY, load, UUID, redis
+    )
+
+
+async def get_team_lead_id(
+    team_id: int, session: AsyncSession, redis: Redis
+) -> Optional[UUID]:
+    team_leads = await get_team_lead_ids([team_id], session, redis)
+    return team_leads[team_id]
+
+
+async def get_user_team_ids(
+    user_ids: Iterable[UUID], session: AsyncSession, redis: Redis
+) -> dict[UUID, Optional[int]]:
+    async def load(user_ids):
+        result = await session.execute(
+            select(User.id, User.team_id).where(User.id.in_(user_ids))
+        )
+        return result.all()
+
+    return await get_entries(
+        user_ids, user_team_cache, USER_TEAM_REDIS_KEY, load, int, redis
+    )
+
+
+async def get_user_team_id(
+    user_id: UUID, session: AsyncSession, redis: Redis
+) -> Optional[int]:
+    user_teams = await get_user_team_ids([user_id], session, redis)
+    return user_teams[user_id]
+
+
+async def is_user_manager(
+    manager_id: UUID, user_id: UUID, session: AsyncSession, redis: Redis
+) -> bool:
+    """Whether manager_id leads the team user_id belongs to."""
+    team_id = await get_user_team_id(user_id, session, redis)
+    if team_id is None:
+        return False
+    return await get_team_lead_id(team_id, session, redis) == manager_id
+
+
+async def publish_team_leads(
+    team_leads: dict[int, Optional[UUID]], redis: Redis
+) -> None:
+    await publish_entries(
+        team_leads, team_lead_cache, TEAM_LEAD_REDIS_KEY, TEAM_LEAD_CHANNEL, redis
+    )
+
+
+async def publish_user_teams(
+    user_teams: dict[UUID, Optional[int]], redis: Redis
+) -> None:
+    await publish_entries(
+        user_teams, user_team_cache, USER_TEAM_REDIS_KEY, USER_TEAM_CHANNEL, redis
+    )
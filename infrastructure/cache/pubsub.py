@@ -0,0 +1,70 @@
+import asyncio
+from inspect import isawaitable
+from typing import Any, Callable, Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+
+# channel -> (message handler, handler called after every (re)subscribe),
+# the reset handler may be a coroutine function
+channel_handlers: dict[str, tuple[Callable[[str], None], Optional[Callable[[], Any]]]] = {}
+
+listener_task: Optional[asyncio.Task] = None
+
+RECONNECT_DELAY_SECONDS = 1
+
+
+def register_channel_handler(
+    channel: str,
+    on_message: Callable[[str], None],
+    on_reset: Optional[Callable[[], Any]] = None,
+) -> None:
+    channel_handlers[channel] = (on_message, on_reset)
+
+
+async def publish_message(channel: str, message: str, redis: Redis) -> None:
+    await redis.publish(channel, message)
+
+
+async def listen_channels(redis: Redis) -> None:
+    while True:
+        try:
+            async with redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+                await pubsub.subscribe(*channel_handlers)
+
+                # Messages published while we were disconnected are lost,
+                # so local state must be dropped on every (re)subscribe.
+                for _, on_reset in channel_handlers.values():
+                    if on_reset:
+                        result = on_reset()
+                        if isawaitable(result):
+                            await result
+
+                async for message in pubsub.listen():
+                    if message['type'] != 'message':
+                        continue
+                    on_message, _ = channel_handlers[message['channel']]
+                    on_message(message['data'])
+        except RedisError:
+            await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+
+def start_listener(redis: Redis) -> None:
+    global listener_task
+
+    if listener_task is None and channel_handlers:
+        listener_task = asyncio.create_task(listen_channels(redis))
+
+
+async def stop_listener() -> None:
+    global listener_task
+
+    if listener_task is None:
+        return
+    listener_task.cancel()
+    try:
+        await listener_task
+    except asyncio.CancelledError:
+        pass
+    listener_task = None
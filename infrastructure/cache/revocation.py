@@ -0,0 +1,58 @@
+from datetime import datetime, timezone
+
+from redis.asyncio import Redis
+
+from config.config import settings
+from config.constants import REVOKED_TOKENS_CHANNEL, REVOKED_TOKENS_REDIS_KEY
+from infrastructure.cache.bloom_filter import BloomFilter
+from infrastructure.cache.pubsub import register_channel_handler
+from infrastructure.db.redis_db import get_redis
+
+
+revocation_filter = BloomFilter(
+    capacity=settings.REVOCATION_BLOOM_CAPACITY,
+    error_rate=settings.REVOCATION_BLOOM_ERROR_RATE,
+)
+# Until the filter is loaded from Redis every check goes to Redis.
+revocation_filter_ready = False
+
+
+async def rebuild_revocation_filter() -> None:
+    global revocation_filter_ready
+
+    redis = await get_redis()
+    now = datetime.now(timezone.utc).timestamp()
+    await redis.zremrangebyscore(REVOKED_TOKENS_REDIS_KEY, '-inf', now)
+    revoked_ids = await redis.zrange(REVOKED_TOKENS_REDIS_KEY, 0, -1)
+
+    revocation_filter.clear()
+    for token_id in revoked_ids:
+        revocation_filter.add(token_id)
+    revocation_filter_ready = True
+
+
+register_channel_handler(
+    REVOKED_TOKENS_CHANNEL, revocation_filter.add, rebuild_revocation_filter
+)
+
+
+async def is_token_revoked(payload: dict, redis: Redis) -> bool:
+    token_id = payload.get('jti')
+    if token_id is None:
+        return False
+    if revocation_filter_ready and token_id not in revocation_filter:
+        return False
+    return await redis.zscore(REVOKED_TOKENS_REDIS_KEY, token_id) is not None
+
+
+async def revoke_token(payload: dict, redis: Redis) -> None:
+    token_id = payload.get('jti')
+    if token_id is None:
+        return
+
+    # Revoked ids are kept only until the token would have expired anyway.
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.zadd(REVOKED_TOKENS_REDIS_KEY, {token_id: payload['exp']})
+        pipe.publish(REVOKED_TOKENS_CHANNEL, token_id)
+        await pipe.execute()
+    revocation_filter.add(token_id)
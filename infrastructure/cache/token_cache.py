@@ -0,0 +1,29 @@
+from datetime import datetime, timezone
+from hashlib import blake2b
+from typing import Optional
+
+from config.config import settings
+from infrastructure.cache.lru_cache import LRUCache
+
+
+token_cache = LRUCache(
+    max_size=settings.JWT_CACHE_SIZE, ttl=settings.JWT_CACHE_EXPIRE_SECONDS
+)
+
+
+def get_token_digest(access_token: str, secret_key: str) -> tuple[str, bytes]:
+    return secret_key, blake2b(access_token.encode(), digest_size=16).digest()
+
+
+def get_cached_payload(access_token: str, secret_key: str) -> Optional[dict]:
+    return token_cache.get(get_token_digest(access_token, secret_key))
+
+
+def cache_payload(
+    access_token: str, secret_key: str, payload: dict, expiring_time: datetime
+) -> None:
+    # Entries must not outlive the token, so expiry is still enforced.
+    seconds_left = (expiring_time - datetime.now(timezone.utc)).total_seconds()
+    ttl = min(seconds_left, settings.JWT_CACHE_EXPIRE_SECONDS)
+    if ttl > 0:
+        token_cache.set(get_token_digest(access_token, secret_key), payload, ttl)
@@ -0,0 +1,64 @@
+from typing import Iterable
+
+from redis.asyncio import Redis
+
+from config.config import settings
+from config.constants import USER_INVALIDATION_CHANNEL, USER_VERSION_REDIS_KEY
+from infrastructure.cache.lru_cache import LRUCache
+from infrastructure.cache.pubsub import register_channel_handler
+
+
+user_cache = LRUCache(
+    max_size=settings.USER_LOCAL_CACHE_SIZE,
+    ttl=settings.USER_LOCAL_CACHE_EXPIRE_SECONDS,
+)
+user_version_cache = LRUCache(
+    max_size=settings.USER_LOCAL_CACHE_SIZE,
+    ttl=settings.USER_LOCAL_CACHE_EXPIRE_SECONDS,
+)
+
+
+def invalidate_local_user(user_id: str) -> None:
+    user_cache.delete(user_id)
+    user_version_cache.delete(user_id)
+
+
+def clear_local_users() -> None:
+    user_cache.clear()
+    user_version_cache.clear()
+
+
+register_channel_handler(
+    USER_INVALIDATION_CHANNEL, invalidate_local_user, clear_local_users
+)
+
+
+async def get_user_version(user_id: str, redis: Redis) -> int:
+    version = user_version_cache.get(user_id)
+    if version is not None:
+        return version
+
+    version = int(await redis.hget(USER_VERSION_REDIS_KEY, user_id) or 0)
+    user_version_cache.set(user_id, version)
+    return version
+
+
+async def publish_user_invalidation(user_id: str, redis: Redis) -> None:
+    await publish_users_invalidation([user_id], redis)
+
+
+async def publish_users_invalidation(user_ids: Iterable[str], redis: Redis) -> None:
+    user_ids = list(user_ids)
+    if not user_ids:
+        return
+
+    # Bumping the version makes tokens with embedded claims fall back
+    # to a full user lookup in every service.
+    async with redis.pipeline(transaction=False) as pipe:
+        for user_id in user_ids:
+            pipe.hincrby(USER_VERSION_REDIS_KEY, user_id, 1)
+            pipe.publish(USER_INVALIDATION_CHANNEL, user_id)
+        await pipe.execute()
+
+    for user_id in user_ids:
+        invalidate_local_user(user_id)
@@ -0,0 +1,119 @@
+"""Maintenance of the user_calendar_entries read model."""
+
+import asyncio
+import sys
+from typing import Iterable, Optional
+
+from sqlalchemy import delete, except_, func, insert, select, union
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.db.sql_db import AsyncSessionLocal, engine
+from infrastructure.models.calendar import CalendarEvent, UserCalendarEntry
+from infrastructure.models.meeting import Meeting, user_meeting
+from infrastructure.models.task import Task
+
+
+ENTRY_COLUMNS = (
+    'user_id',
+    'calendar_event_id',
+    'start_time',
+    'end_time',
+    'event_type',
+)
+
+
+def get_live_entries(event_ids: Optional[list[int]] = None):
+    """Visibility computed from meetings, tasks and event creators."""
+    event_columns = (
+        CalendarEvent.id,
+        CalendarEvent.start_time,
+        CalendarEvent.end_time,
+        CalendarEvent.event_type,
+    )
+    branches = [
+        select(user_meeting.c.user_id, *event_columns)
+        .join_from(
+            CalendarEvent, Meeting, Meeting.calendar_event_id == CalendarEvent.id
+        )
+        .join(user_meeting, user_meeting.c.meeting_id == Meeting.id),
+        select(Task.employee_id, *event_columns).join_from(
+            CalendarEvent, Task, Task.calendar_event_id == CalendarEvent.id
+        ),
+        select(CalendarEvent.event_creator_id, *event_columns).where(
+            CalendarEvent.event_creator_id.is_not(None)
+        ),
+    ]
+    if event_ids is not None:
+        branches = [
+            branch.where(CalendarEvent.id.in_(event_ids)) for branch in branches
+        ]
+    return union(*branches)
+
+
+def get_stored_entries():
+    return select(*(getattr(UserCalendarEntry, column) for column in ENTRY_COLUMNS))
+
+
+async def sync_calendar_entries(
+    session: AsyncSession, event_ids: Iterable[int]
+) -> None:
+    """Recompute the entries of the given events; the caller commits."""
+    event_ids = [event_id for event_id in event_ids if event_id is not None]
+    if not event_ids:
+        return
+
+    await session.execute(
+        delete(UserCalendarEntry).where(
+            UserCalendarEntry.calendar_event_id.in_(event_ids)
+        )
+    )
+    await session.execute(
+        insert(UserCalendarEntry).from_select(
+            ENTRY_COLUMNS, get_live_entries(event_ids)
+        )
+    )
+
+
+async def rebuild_calendar_entries(session: AsyncSession) -> int:
+    await session.execute(delete(UserCalendarEntry))
+    await session.execute(
+        insert(UserCalendarEntry).from_select(ENTRY_COLUMNS, get_live_entries())
+    )
+    await session.commit()
+
+    return await session.scalar(select(func.count()).select_from(UserCalendarEntry))
+
+
+async def find_calendar_entry_mismatches(
+    session: AsyncSession,
+) -> tuple[list, list]:
+    """Return (missing, stale) rows of the read model."""
+    live_entries = select(get_live_entries().subquery())
+    missing = await session.execute(except_(live_entries, get_stored_entries()))
+    stale = await session.execute(except_(get_stored_entries(), live_entries))
+    return missing.all(), stale.all()
+
+
+async def main(command: str) -> int:
+    try:
+        async with AsyncSessionLocal() as session:
+            if command == 'rebuild':
+                count = await rebuild_calendar_entries(session)
+                print(f'Rebuilt {count} calendar entries')
+                return 0
+
+            missing, stale = await find_calendar_entry_mismatches(session)
+    finally:
+        await engine.dispose()
+
+    for row in missing:
+        print(f'Missing: {tuple(row)}')
+    for row in stale:
+        print(f'Stale: {tuple(row)}')
+    return 1 if missing or stale else 0
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 2 or sys.argv[1] not in ('rebuild', 'check'):
+        sys.exit('Usage: python -m infrastructure.db.calendar_entries rebuild|check')
+    sys.exit(asyncio.run(main(sys.argv[1])))
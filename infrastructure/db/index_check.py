@@ -0,0 +1,122 @@
+"""Fail when a foreign key used by a repository query has no index."""
+
+import ast
+import sys
+from pathlib import Path
+from typing import Iterator, Optional
+
+from sqlalchemy import Column, PrimaryKeyConstraint, UniqueConstraint
+from sqlalchemy.orm import Mapper, RelationshipProperty
+
+from infrastructure.models import Base
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+REPOSITORY_GLOB = '*_service/crud/*.py'
+FILTER_METHODS = ('where', 'filter', 'filter_by')
+JOIN_METHODS = ('join', 'outerjoin')
+STATEMENT_FUNCTIONS = ('select', 'update', 'delete')
+
+
+def get_mappers() -> dict[str, Mapper]:
+    return {mapper.class_.__name__: mapper for mapper in Base.registry.mappers}
+
+
+def is_indexed(column: Column) -> bool:
+    table = column.table
+    leading_columns = [index.columns.values()[0] for index in table.indexes]
+    leading_columns += [
+        constraint.columns.values()[0]
+        for constraint in table.constraints
+        if isinstance(constraint, (PrimaryKeyConstraint, UniqueConstraint))
+    ]
+    return any(leading is column for leading in leading_columns)
+
+
+def get_statement_mapper(node: ast.AST, mappers: dict) -> Optional[Mapper]:
+    """Find the entity of the select/update/delete a method chain starts at."""
+    while isinstance(node, ast.Call):
+        func = node.func
+        if isinstance(func, ast.Name) and func.id in STATEMENT_FUNCTIONS:
+            if node.args and isinstance(node.args[0], ast.Name):
+                return mappers.get(node.args[0].id)
+            return None
+        if not isinstance(func, ast.Attribute):
+            return None
+        node = func.value
+    return None
+
+
+def get_relationship_columns(prop: RelationshipProperty) -> Iterator[Column]:
+    for local, remote in prop.local_remote_pairs:
+        yield local
+        yield remote
+
+
+def get_filter_columns(call: ast.Call, mappers: dict) -> Iterator[Column]:
+    if call.func.attr == 'filter_by':
+        mapper = get_statement_mapper(call.func.value, mappers)
+        if mapper is not None:
+            for keyword in call.keywords:
+                if keyword.arg in mapper.columns:
+                    yield mapper.columns[keyword.arg]
+        return
+
+    for node in ast.walk(ast.Module(body=[ast.Expr(arg) for arg in call.args])):
+        if not (isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name)):
+            continue
+        mapper = mappers.get(node.value.id)
+        if mapper is None:
+            continue
+        prop = mapper.attrs.get(node.attr)
+        if isinstance(prop, RelationshipProperty):
+            yield from get_relationship_columns(prop)
+        elif prop is not None:
+            yield from prop.columns
+
+
+def get_join_columns(call: ast.Call, mappers: dict) -> Iterator[Column]:
+    mapper = get_statement_mapper(call.func.value, mappers)
+    if mapper is None or not call.args or not isinstance(call.args[0], ast.Name):
+        return
+    target = mappers.get(call.args[0].id)
+    if target is None:
+        return
+    for left, right in ((mapper, target), (target, mapper)):
+        for column in left.local_table.columns:
+            if any(fk.column.table is right.local_table for fk in column.foreign_keys):
+                yield column
+
+
+def find_unindexed_foreign_keys(root: Path = PROJECT_ROOT) -> list[str]:
+    mappers = get_mappers()
+    problems = []
+    for path in sorted(root.glob(REPOSITORY_GLOB)):
+        tree = ast.parse(path.read_text(), filename=str(path))
+        for call in ast.walk(tree):
+            if not (
+                isinstance(call, ast.Call) and isinstance(call.func, ast.Attribute)
+            ):
+                continue
+            if call.func.attr in FILTER_METHODS:
+                columns = get_filter_columns(call, mappers)
+            elif call.func.attr in JOIN_METHODS:
+                columns = get_join_columns(call, mappers)
+            else:
+                continue
+            for column in columns:
+                if column.foreign_keys and not is_indexed(column):
+                    location = f'{path.relative_to(root)}:{call.lineno}'
+                    problems.append(f'{column.table.name}.{column.name} ({location})')
+    return sorted(set(problems))
+
+
+def main() -> int:
+    problems = find_unindexed_foreign_keys()
+    for problem in problems:
+        print(f'Foreign key without index: {problem}')
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
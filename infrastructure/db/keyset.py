@@ -0,0 +1,75 @@
+import base64
+from datetime import datetime
+import json
+from typing import Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.exceptions.basic_exeptions import InvalidCursorException
+from infrastructure.schemas.pagination import CursorPage, KeysetParams
+
+
+def _cursor_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_cursor(values: Sequence) -> str:
+    raw = json.dumps(list(values), default=_cursor_value)
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str, order_columns: Sequence) -> list:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(order_columns):
+            raise ValueError
+        decoded = []
+        for column, value in zip(order_columns, values):
+            python_type = column.type.python_type
+            if python_type is datetime:
+                value = datetime.fromisoformat(value)
+            elif python_type is UUID:
+                value = UUID(value)
+            elif not isinstance(value, python_type):
+                raise ValueError
+            decoded.append(value)
+    except (ValueError, TypeError, NotImplementedError):
+        raise InvalidCursorException
+    return decoded
+
+
+async def keyset_paginate(
+    session: AsyncSession,
+    query: Select,
+    params: KeysetParams,
+    order_columns: Sequence,
+    row_keys: Optional[Sequence[str]] = None,
+) -> CursorPage:
+    """Paginate `query` by the unique ordering `order_columns`."""
+    total = None
+    if params.with_total:
+        count_query = select(func.count()).select_from(query.order_by(None).subquery())
+        total = await session.scalar(count_query)
+
+    page_query = query.order_by(*order_columns).limit(params.size + 1)
+    if params.cursor:
+        values = decode_cursor(params.cursor, order_columns)
+        page_query = page_query.where(tuple_(*order_columns) > tuple_(*values))
+
+    result = await session.execute(page_query)
+    rows = result.scalars().unique().all()
+
+    next_cursor = None
+    if len(rows) > params.size:
+        rows = rows[: params.size]
+        last_row = rows[-1]
+        row_keys = row_keys or [column.key for column in order_columns]
+        next_cursor = encode_cursor([getattr(last_row, key) for key in row_keys])
+
+    return CursorPage(
+        items=rows, size=params.size, next_cursor=next_cursor, total=total
+    )
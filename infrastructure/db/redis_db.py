@@ -1,15 +1,62 @@
-from redis.asyncio import from_url, Redis
+from typing import Optional
+
+from redis.asyncio import BlockingConnectionPool, Redis
 
 from config.config import settings
 
 
-# async def get_redis() -> Redis:
-#     print('redis starts')
-#     redis = await from_url(settings.redis_test, encoding='utf-8', decode_responses=True)
-#     return redis
+redis_pool: Optional[BlockingConnectionPool] = None
+redis_client: Optional[Redis] = None
+
+
+def create_redis_pool(url: str) -> BlockingConnectionPool:
+    return BlockingConnectionPool.from_url(
+        url,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        timeout=settings.REDIS_POOL_TIMEOUT,
+        health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+        encoding='utf-8',
+        decode_responses=True,
+    )
+
+
+async def init_redis() -> Redis:
+    global redis_pool, redis_client
+
+    if redis_client is None:
+        # redis_pool = create_redis_pool(settings.redis_test)
+        redis_pool = create_redis_pool(settings.redis_url)
+        redis_client = Redis(connection_pool=redis_pool)
+    return redis_client
+
+
+async def close_redis() -> None:
+    global redis_pool, redis_client
+
+    if redis_client is not None:
+        await redis_client.aclose()
+    if redis_pool is not None:
+        await redis_pool.disconnect()
+    redis_client = None
+    redis_pool = None
+
+
+def get_redis_pool_stats() -> dict:
+    if redis_pool is None:
+        return {
+            'max_connections': settings.REDIS_MAX_CONNECTIONS,
+            'in_use': 0,
+            'idle': 0,
+        }
+
+    return {
+        'max_connections': redis_pool.max_connections,
+        'in_use': len(redis_pool._in_use_connections),
+        'idle': len(redis_pool._available_connections),
+    }
 
 
 async def get_redis() -> Redis:
-    print('redis starts')
-    redis = await from_url(settings.redis_url, encoding='utf-8', decode_responses=True)
-    return redis
+    if redis_client is None:
+        return await init_redis()
+    return redis_client
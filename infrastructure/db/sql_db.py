@@ -1,18 +1,120 @@
 from collections.abc import AsyncIterator
+from functools import wraps
+from itertools import cycle
+from pathlib import Path
+from time import perf_counter
+from typing import Optional, Union
+from uuid import UUID
 
-from sqlalchemy import inspect
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from fastapi import Request
+from redis.asyncio import Redis
+from sqlalchemy import exc, inspect
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from config.config import settings
+from config.constants import READ_ONLY_METHODS, RECENT_WRITE_REDIS_KEY
 from infrastructure import models
 
-# engine = create_async_engine(url=settings.db_test, echo=True)
-engine = create_async_engine(url=settings.db_url, echo=True)
+
+ALEMBIC_INI_PATH = Path(__file__).resolve().parents[2] / 'alembic.ini'
+
+
+class MeasuredQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long callers wait for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def connect(self):
+        start = perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            wait = perf_counter() - start
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+
+def create_db_engine(url: str) -> AsyncEngine:
+    options = settings.db_engine_options
+    engine_kwargs = {
+        'echo': options['echo'],
+        'pool_pre_ping': options['pool_pre_ping'],
+        'pool_recycle': options['pool_recycle'],
+    }
+    if not url.startswith('sqlite'):
+        engine_kwargs.update(
+            poolclass=MeasuredQueuePool,
+            pool_size=options['pool_size'],
+            max_overflow=options['max_overflow'],
+            pool_timeout=options['pool_timeout'],
+        )
+    if url.startswith('postgresql+asyncpg'):
+        engine_kwargs['connect_args'] = {
+            'statement_cache_size': options['statement_cache_size']
+        }
+    return create_async_engine(url, **engine_kwargs)
+
+
+# engine = create_db_engine(settings.db_test)
+engine = create_db_engine(settings.db_url)
 
 AsyncSessionLocal = async_sessionmaker(
     bind=engine, autoflush=False, autocommit=False, expire_on_commit=False
 )
 
+replica_engines = [create_db_engine(url) for url in settings.DB_REPLICA_URLS]
+replica_session_factories = cycle(
+    [
+        async_sessionmaker(
+            bind=replica_engine,
+            autoflush=False,
+            autocommit=False,
+            expire_on_commit=False,
+        )
+        for replica_engine in replica_engines
+    ]
+)
+
+
+def get_pool_stats(db_engine: AsyncEngine = engine) -> dict:
+    pool = db_engine.pool
+    stats = {'pool_class': type(pool).__name__}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    if isinstance(pool, MeasuredQueuePool):
+        stats.update(
+            checkouts=pool.checkouts,
+            timeouts=pool.timeouts,
+            avg_wait_ms=pool.total_wait / pool.checkouts * 1000
+            if pool.checkouts
+            else 0.0,
+            max_wait_ms=pool.max_wait * 1000,
+        )
+    return stats
+
 
 # Function to check existing tables and create if necessary
 def check_existing_tables_and_create(sync_conn) -> None:
@@ -21,6 +123,15 @@ def check_existing_tables_and_create(sync_conn) -> None:
 
     if not existing_tables:
         models.Base.metadata.create_all(sync_conn)
+        # The schema is already at head, `alembic upgrade head` has nothing
+        # left to apply.
+        alembic_config = Config(ALEMBIC_INI_PATH)
+        alembic_config.set_main_option(
+            'script_location', str(ALEMBIC_INI_PATH.parent / 'alembic')
+        )
+        MigrationContext.configure(sync_conn).stamp(
+            ScriptDirectory.from_config(alembic_config), 'head'
+        )
 
 
 async def init_models() -> None:
@@ -28,7 +139,97 @@ async def init_models() -> None:
         await conn.run_sync(check_existing_tables_and_create)
 
 
-async def get_session() -> AsyncIterator[AsyncSession]:
-    print('session starts')
-    async with AsyncSessionLocal() as session:
+class LazySession:
+    """AsyncSession proxy that creates the session on first use.
+
+    Requests served from cache never build a session, and release() hands
+    the pooled connection back as soon as the handler is done with it.
+    When use_replica is set, replica-safe repository calls go through
+    read_session, which is bound to one of the read replicas.
+    """
+
+    def __init__(self, session_factory=AsyncSessionLocal, use_replica=False):
+        self._session_factory = session_factory
+        self._session: Optional[AsyncSession] = None
+        self._read_session: Optional[AsyncSession] = None
+        self.use_replica = use_replica
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._session_factory()
+        return self._session
+
+    @property
+    def read_session(self) -> AsyncSession:
+        if not self.use_replica:
+            return self.session
+        if self._read_session is None:
+            self._read_session = next(replica_session_factories)()
+        return self._read_session
+
+    def __getattr__(self, name):
+        return getattr(self.session, name)
+
+    async def release(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._read_session is not None:
+            await self._read_session.close()
+            self._read_session = None
+
+
+def read_only(endpoint):
+    """Mark a POST endpoint that only reads, so it is routed like a GET."""
+    endpoint.read_only = True
+    return endpoint
+
+
+def is_read_only(request: Request) -> bool:
+    return request.method in READ_ONLY_METHODS or getattr(
+        request.scope.get('endpoint'), 'read_only', False
+    )
+
+
+async def get_session(request: Request) -> AsyncIterator[LazySession]:
+    session = LazySession(use_replica=bool(replica_engines) and is_read_only(request))
+    try:
         yield session
+    finally:
+        await session.release()
+
+
+async def release_session(session: Union[AsyncSession, LazySession]) -> None:
+    if isinstance(session, LazySession):
+        await session.release()
+
+
+async def route_session(
+    request: Request,
+    session: Union[AsyncSession, LazySession],
+    user_id: Optional[UUID],
+    redis: Redis,
+) -> None:
+    """Keep a user's reads on the primary for a while after they write."""
+    if not replica_engines or user_id is None:
+        return
+
+    key = f'{RECENT_WRITE_REDIS_KEY}:{user_id}'
+    if not is_read_only(request):
+        await redis.set(key, 1, ex=settings.DB_READ_YOUR_WRITES_SECONDS)
+    elif isinstance(session, LazySession) and session.use_replica:
+        if await redis.exists(key):
+            session.use_replica = False
+
+
+def replica_safe(func):
+    """Run a read-only repository function on a replica when allowed."""
+
+    @wraps(func)
+    async def wrapper(session, *args, **kwargs):
+        if isinstance(session, LazySession):
+            session = session.read_session
+        return await func(session, *args, **kwargs)
+
+    return wrapper
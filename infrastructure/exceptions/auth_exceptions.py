@@ -17,6 +17,14 @@ class TokenExpiredException(HTTPException):
         )
 
 
+class TokenRevokedException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail='Token revoked',
+        )
+
+
 class TokenNotFoundException(HTTPException):
     def __init__(self):
         super().__init__(
@@ -79,3 +87,11 @@ class NotAllowedToDeleteException(HTTPException):
             status_code=status.HTTP_403_FORBIDDEN,
             detail='Too early to delete after firing',
         )
+
+
+class PasswordHashingBusyException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail='Too many login attempts in progress, try again later',
+        )
@@ -0,0 +1,9 @@
+from fastapi import status, HTTPException
+
+
+class InvalidTimeRangeException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="'to' should be later than 'from'",
+        )
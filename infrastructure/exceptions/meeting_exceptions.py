@@ -39,3 +39,38 @@ class CantEditMeetingException(HTTPException):
             status_code=status.HTTP_403_FORBIDDEN,
             detail='You have no rights to edit this meeting',
         )
+
+
+class MeetingConflictException(HTTPException):
+    def __init__(self, conflicts: list):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                'message': 'Participants have overlapping meetings',
+                'conflicts': conflicts,
+            },
+        )
+
+
+class NotRecurringMeetingException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail='Meeting is not recurring',
+        )
+
+
+class OccurrenceBeforeSeriesException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail='Occurrence cannot be moved before the series start',
+        )
+
+
+class InvalidRecurrenceException(HTTPException):
+    def __init__(self, message: str):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=message,
+        )
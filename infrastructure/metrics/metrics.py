@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Request
+
+from config.config import settings
+from config.constants import SERVICE_SECRET_KEY_HEADER
+from infrastructure.cache.revocation import revocation_filter
+from infrastructure.cache.membership import team_lead_cache, user_team_cache
+from infrastructure.cache.token_cache import token_cache
+from infrastructure.cache.user_cache import user_cache, user_version_cache
+from infrastructure.db.redis_db import get_redis_pool_stats
+from infrastructure.db.sql_db import get_pool_stats, replica_engines
+from infrastructure.exceptions.auth_exceptions import (
+    InvalidServiceSecretKeyException,
+)
+
+
+metrics_router = APIRouter()
+
+
+@metrics_router.get('/')
+async def get_metrics(request: Request):
+    authorization_header = request.headers.get(SERVICE_SECRET_KEY_HEADER)
+    if (
+        not authorization_header
+        or authorization_header != settings.SERVICES_COMMON_SECRET_KEY
+    ):
+        raise InvalidServiceSecretKeyException
+
+    return {
+        'db_pool': get_pool_stats(),
+        'db_replica_pools': [
+            get_pool_stats(replica_engine) for replica_engine in replica_engines
+        ],
+        'redis_pool': get_redis_pool_stats(),
+        'user_cache': user_cache.stats(),
+        'user_version_cache': user_version_cache.stats(),
+        'team_lead_cache': team_lead_cache.stats(),
+        'user_team_cache': user_team_cache.stats(),
+        'token_cache': token_cache.stats(),
+        'revocation_filter': revocation_filter.stats(),
+    }
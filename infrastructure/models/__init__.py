@@ -1,7 +1,7 @@
 from .base import Base
 from .team import Team
 from .user import User
-from .calendar import CalendarEvent
+from .calendar import CalendarEvent, UserCalendarEntry
 from .evaluation import TaskEvaluation
-from .meeting import Meeting, user_meeting
+from .meeting import Meeting, MeetingOccurrenceOverride, user_meeting
 from .task import Task
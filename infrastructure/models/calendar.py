@@ -2,7 +2,7 @@ from datetime import datetime
 from enum import Enum as PyEnum
 from typing import Optional
 
-from sqlalchemy import Enum as SQLEnum, ForeignKey, func, String
+from sqlalchemy import Enum as SQLEnum, ForeignKey, Index, func, String
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import mapped_column, Mapped, relationship
 
@@ -35,5 +35,52 @@ class CalendarEvent(Base):
     meeting = relationship('Meeting', back_populates='calendar_event', uselist=False)
     event_creator = relationship('User', back_populates='created_events')
 
+    __table_args__ = (
+        Index(
+            'ix_calendar_events_event_creator_id_start_time',
+            'event_creator_id',
+            'start_time',
+            'id',
+        ),
+    )
+
     def __repr__(self):
         return f'<Event {self.title} - {self.event_type}>'
+
+
+class UserCalendarEntry(Base):
+    """Read model: one row per calendar event a user can see."""
+
+    __tablename__ = 'user_calendar_entries'
+
+    user_id: Mapped[PG_UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey('users.id', ondelete='CASCADE'),
+        primary_key=True,
+    )
+    calendar_event_id: Mapped[int] = mapped_column(
+        ForeignKey('calendar_events.id', ondelete='CASCADE'),
+        primary_key=True,
+        index=True,
+    )
+    start_time: Mapped[datetime]
+    end_time: Mapped[datetime]
+    event_type: Mapped[EventType] = mapped_column(SQLEnum(EventType))
+
+    __table_args__ = (
+        Index(
+            'ix_user_calendar_entries_user_id_start_time',
+            'user_id',
+            'start_time',
+            'calendar_event_id',
+        ),
+        Index(
+            'ix_user_calendar_entries_user_id_end_time',
+            'user_id',
+            'end_time',
+            'start_time',
+        ),
+    )
+
+    def __repr__(self):
+        return f'<Calendar entry {self.calendar_event_id} - user {self.user_id}>'
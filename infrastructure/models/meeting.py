@@ -1,11 +1,11 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Column, ForeignKey, Table, func, String
+from sqlalchemy import Column, ForeignKey, Index, Table, func, String, false
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import mapped_column, Mapped, relationship
 
-from config.constants import MEETING_NAME_LENGTH
+from config.constants import MEETING_NAME_LENGTH, RECURRENCE_RULE_LENGTH
 from infrastructure.models.base import Base
 
 
@@ -14,7 +14,10 @@ user_meeting = Table(
     Base.metadata,
     Column('user_id', ForeignKey('users.id', ondelete='CASCADE'), primary_key=True),
     Column(
-        'meeting_id', ForeignKey('meetings.id', ondelete='CASCADE'), primary_key=True
+        'meeting_id',
+        ForeignKey('meetings.id', ondelete='CASCADE'),
+        primary_key=True,
+        index=True,
     ),
 )
 
@@ -27,12 +30,18 @@ class Meeting(Base):
     description: Mapped[str]
     start_time: Mapped[datetime]
     end_time: Mapped[datetime]
+    # For a recurring meeting start_time and end_time are the first
+    # occurrence and series_end_time is the end of the last one.
+    recurrence_rule: Mapped[Optional[str]] = mapped_column(
+        String(RECURRENCE_RULE_LENGTH)
+    )
+    series_end_time: Mapped[datetime]
     created_at: Mapped[datetime] = mapped_column(server_default=func.now())
     meeting_creator_id: Mapped[Optional[PG_UUID]] = mapped_column(
-        PG_UUID(as_uuid=True), ForeignKey('users.id', ondelete='SET NULL')
+        PG_UUID(as_uuid=True), ForeignKey('users.id', ondelete='SET NULL'), index=True
     )
     calendar_event_id: Mapped[int] = mapped_column(
-        ForeignKey('calendar_events.id', ondelete='SET NULL')
+        ForeignKey('calendar_events.id', ondelete='SET NULL'), index=True
     )
 
     meeting_creator = relationship('User', back_populates='created_meetings')
@@ -40,6 +49,39 @@ class Meeting(Base):
     participants = relationship(
         'User', secondary='user_meeting_table', back_populates='meetings'
     )
+    occurrence_overrides = relationship(
+        'MeetingOccurrenceOverride',
+        back_populates='meeting',
+        cascade='all, delete-orphan',
+        passive_deletes=True,
+    )
+
+    __table_args__ = (
+        Index(
+            'ix_meetings_series_end_time_start_time', 'series_end_time', 'start_time'
+        ),
+    )
 
     def __repr__(self):
         return f'<Event {self.title} - {self.description} starts at {self.start_time}>'
+
+
+class MeetingOccurrenceOverride(Base):
+    """A moved, renamed or cancelled occurrence of a recurring meeting."""
+
+    __tablename__ = 'meeting_occurrence_overrides'
+
+    meeting_id: Mapped[int] = mapped_column(
+        ForeignKey('meetings.id', ondelete='CASCADE'), primary_key=True
+    )
+    original_start_time: Mapped[datetime] = mapped_column(primary_key=True)
+    is_cancelled: Mapped[bool] = mapped_column(server_default=false())
+    start_time: Mapped[datetime]
+    end_time: Mapped[datetime]
+    title: Mapped[Optional[str]] = mapped_column(String(MEETING_NAME_LENGTH))
+    description: Mapped[Optional[str]]
+
+    meeting = relationship('Meeting', back_populates='occurrence_overrides')
+
+    def __repr__(self):
+        return f'<Occurrence of {self.meeting_id} at {self.original_start_time}>'
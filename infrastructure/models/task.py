@@ -3,7 +3,14 @@ from enum import Enum as PyEnum
 from typing import Optional
 
 
-from sqlalchemy import Enum as SQLEnum, ForeignKey, UniqueConstraint, func, String
+from sqlalchemy import (
+    Enum as SQLEnum,
+    ForeignKey,
+    Index,
+    UniqueConstraint,
+    func,
+    String,
+)
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import mapped_column, Mapped, relationship
 
@@ -40,7 +47,7 @@ class Task(Base):
         nullable=True,
     )
     calendar_event_id: Mapped[Optional[int]] = mapped_column(
-        ForeignKey('calendar_events.id', ondelete='SET NULL'), nullable=True
+        ForeignKey('calendar_events.id', ondelete='SET NULL'), nullable=True, index=True
     )
 
     task_employee = relationship(
@@ -60,6 +67,9 @@ class Task(Base):
             'due_date',
             name='uq_task_title_mgr_emp_due',
         ),
+        # Match the (due_date, id) ordering of the task lists.
+        Index('ix_tasks_employee_id_due_date', 'employee_id', 'due_date', 'id'),
+        Index('ix_tasks_manager_id_due_date', 'manager_id', 'due_date', 'id'),
     )
 
     def __repr__(self):
@@ -1,6 +1,8 @@
+from typing import Optional
+
 from sqlalchemy import ForeignKey, String, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from sqlalchemy.orm import mapped_column, Mapped, relationship
+from sqlalchemy.orm import mapped_column, Mapped, query_expression, relationship
 
 from infrastructure.models.base import Base
 from config.constants import TEAM_NAME_LENGTH
@@ -22,6 +24,9 @@ class Team(Base):
         unique=True,
     )
 
+    # Filled by queries that ask for it with with_expression().
+    member_count: Mapped[Optional[int]] = query_expression()
+
     members = relationship('User', back_populates='team', foreign_keys='User.team_id')
     team_lead = relationship(
         'User', back_populates='team_lead', foreign_keys=[team_lead_id]
@@ -54,6 +54,7 @@ class User(Base):
     team_id: Mapped[int] = mapped_column(
         ForeignKey('teams.id', ondelete='SET NULL'),
         nullable=True,
+        index=True,
     )
 
     team = relationship('Team', back_populates='members', foreign_keys=[team_id])
@@ -0,0 +1,118 @@
+from datetime import date, datetime, time, timedelta
+from typing import Iterable
+
+
+Interval = tuple[datetime, datetime]
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> list[Interval]:
+    """Sort by start and sweep, joining overlapping and touching intervals."""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def clip_intervals(
+    intervals: Iterable[Interval], start_time: datetime, end_time: datetime
+) -> list[Interval]:
+    return [
+        (max(start, start_time), min(end, end_time))
+        for start, end in intervals
+        if start < end_time and end > start_time
+    ]
+
+
+def get_free_intervals(
+    busy: Iterable[Interval], start_time: datetime, end_time: datetime
+) -> list[Interval]:
+    """Gaps between the busy intervals inside [start_time, end_time)."""
+    free = []
+    current = start_time
+    for start, end in merge_intervals(clip_intervals(busy, start_time, end_time)):
+        if start > current:
+            free.append((current, start))
+        current = max(current, end)
+    if current < end_time:
+        free.append((current, end_time))
+    return free
+
+
+def get_days(start_time: datetime, end_time: datetime) -> list[date]:
+    """Days touched by [start_time, end_time)."""
+    last_day = max(start_time, end_time - timedelta(microseconds=1)).date()
+    return [
+        start_time.date() + timedelta(days=offset)
+        for offset in range((last_day - start_time.date()).days + 1)
+    ]
+
+
+def get_day_bounds(day: date) -> Interval:
+    start = datetime.combine(day, time.min)
+    return start, start + timedelta(days=1)
+
+
+def get_working_windows(
+    start_time: datetime,
+    end_time: datetime,
+    work_day_start: time,
+    work_day_end: time,
+    include_weekends: bool = False,
+) -> list[Interval]:
+    """Working hours of every day in [start_time, end_time), in order."""
+    windows = []
+    for day in get_days(start_time, end_time):
+        if not include_weekends and day.weekday() >= 5:
+            continue
+        window_start = max(datetime.combine(day, work_day_start), start_time)
+        window_end = min(datetime.combine(day, work_day_end), end_time)
+        if window_start < window_end:
+            windows.append((window_start, window_end))
+    return windows
+
+
+def find_free_slots(
+    busy: Iterable[Interval],
+    windows: list[Interval],
+    duration: timedelta,
+    limit: int,
+) -> list[Interval]:
+    """Earliest `limit` slots of `duration` inside `windows` avoiding `busy`."""
+    merged = merge_intervals(busy)
+    slots = []
+    position = 0
+    for window_start, window_end in windows:
+        current = window_start
+        while current + duration <= window_end:
+            # A busy interval may run into the next window, so it is only
+            # passed once it ends before `current`.
+            while position < len(merged) and merged[position][1] <= current:
+                position += 1
+            if position < len(merged) and merged[position][0] < current + duration:
+                current = max(current, merged[position][1])
+                continue
+            slots.append((current, current + duration))
+            if len(slots) == limit:
+                return slots
+            current += duration
+    return slots
+
+
+def intervals_overlap(first: Iterable[Interval], second: Iterable[Interval]) -> bool:
+    """Whether any interval of one list overlaps an interval of the other."""
+    first, second = merge_intervals(first), merge_intervals(second)
+    first_index = second_index = 0
+    while first_index < len(first) and second_index < len(second):
+        first_start, first_end = first[first_index]
+        second_start, second_end = second[second_index]
+        if first_start < second_end and second_start < first_end:
+            return True
+        if first_end <= second_end:
+            first_index += 1
+        else:
+            second_index += 1
+    return False
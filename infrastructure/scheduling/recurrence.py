@@ -0,0 +1,245 @@
+"""Recurrence rules of repeating meetings, a subset of RFC 5545 RRULE."""
+
+from calendar import monthrange
+from datetime import datetime, time, timedelta
+from enum import Enum
+from itertools import count
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+from config.constants import RECURRENCE_MAX_OCCURRENCES
+from infrastructure.scheduling.intervals import Interval
+
+
+UNTIL_FORMATS = ('%Y%m%dT%H%M%S', '%Y%m%d')
+
+
+class Frequency(str, Enum):
+    DAILY = 'DAILY'
+    WEEKLY = 'WEEKLY'
+    MONTHLY = 'MONTHLY'
+
+
+class RecurrenceRule(NamedTuple):
+    frequency: Frequency
+    interval: int = 1
+    count: Optional[int] = None
+    until: Optional[datetime] = None
+
+    def __str__(self) -> str:
+        parts = [f'FREQ={self.frequency.value}']
+        if self.interval != 1:
+            parts.append(f'INTERVAL={self.interval}')
+        if self.count is not None:
+            parts.append(f'COUNT={self.count}')
+        if self.until is not None:
+            parts.append(f'UNTIL={self.until.strftime(UNTIL_FORMATS[0])}')
+        return ';'.join(parts)
+
+
+class Occurrence(NamedTuple):
+    original_start_time: datetime
+    start_time: datetime
+    end_time: datetime
+    override: Optional[object] = None
+
+
+def parse_until(value: str) -> datetime:
+    for until_format in UNTIL_FORMATS:
+        try:
+            until = datetime.strptime(value.rstrip('Z'), until_format)
+        except ValueError:
+            continue
+        # A date-only UNTIL includes the whole day.
+        if until_format == '%Y%m%d':
+            until = datetime.combine(until.date(), time.max)
+        return until
+    raise ValueError(f'Invalid UNTIL value {value}.')
+
+
+def parse_rrule(text: str) -> RecurrenceRule:
+    """Parse a rule, raising ValueError for anything outside the subset."""
+    if text.upper().startswith('RRULE:'):
+        text = text[len('RRULE:') :]
+
+    parts = {}
+    for part in filter(None, text.strip().split(';')):
+        key, separator, value = part.partition('=')
+        if not separator:
+            raise ValueError(f'Invalid rule part {part}.')
+        parts[key.strip().upper()] = value.strip()
+
+    unsupported = set(parts) - {'FREQ', 'INTERVAL', 'COUNT', 'UNTIL'}
+    if unsupported:
+        raise ValueError(f'Unsupported rule parts: {", ".join(sorted(unsupported))}.')
+    if 'FREQ' not in parts:
+        raise ValueError('FREQ is required.')
+    try:
+        frequency = Frequency(parts['FREQ'].upper())
+    except ValueError:
+        raise ValueError(f'Unsupported frequency {parts["FREQ"]}.') from None
+    if ('COUNT' in parts) == ('UNTIL' in parts):
+        raise ValueError('Exactly one of COUNT and UNTIL is required.')
+
+    try:
+        interval = int(parts.get('INTERVAL', 1))
+        rule_count = int(parts['COUNT']) if 'COUNT' in parts else None
+    except ValueError:
+        raise ValueError('INTERVAL and COUNT should be integers.') from None
+    if interval < 1 or (rule_count is not None and rule_count < 1):
+        raise ValueError('INTERVAL and COUNT should be positive.')
+
+    until = parse_until(parts['UNTIL']) if 'UNTIL' in parts else None
+    return RecurrenceRule(frequency, interval, rule_count, until)
+
+
+def add_months(start_time: datetime, months: int) -> Optional[datetime]:
+    """Same day and time `months` later, None if that month is too short."""
+    year, month = divmod(start_time.month - 1 + months, 12)
+    year += start_time.year
+    if start_time.day > monthrange(year, month + 1)[1]:
+        return None
+    return start_time.replace(year=year, month=month + 1)
+
+
+def iter_occurrence_starts(
+    rule: RecurrenceRule, start_time: datetime, after: Optional[datetime] = None
+) -> Iterator[datetime]:
+    """Starts of the series in order, only those later than `after`."""
+    # Months that lack the day are skipped and don't count towards COUNT,
+    # so monthly series walk from the start.
+    if rule.frequency == Frequency.MONTHLY:
+        starts = filter(
+            None, (add_months(start_time, index * rule.interval) for index in count())
+        )
+        first_index = 0
+    else:
+        days = 7 if rule.frequency == Frequency.WEEKLY else 1
+        step = timedelta(days=days * rule.interval)
+        first_index = 0
+        if after is not None and after >= start_time:
+            first_index = (after - start_time) // step + 1
+        starts = (start_time + index * step for index in count(first_index))
+
+    for index, occurrence_start in enumerate(starts, first_index):
+        if rule.count is not None and index >= rule.count:
+            return
+        if rule.until is not None and occurrence_start > rule.until:
+            return
+        if after is None or occurrence_start > after:
+            yield occurrence_start
+
+
+def get_series_end(rule: RecurrenceRule, start_time: datetime, end_time: datetime):
+    """End of the last occurrence; raises ValueError for invalid series."""
+    if end_time <= start_time:
+        raise ValueError('A recurring meeting should end after it starts.')
+
+    last_start = None
+    for index, occurrence_start in enumerate(iter_occurrence_starts(rule, start_time)):
+        if index >= RECURRENCE_MAX_OCCURRENCES:
+            raise ValueError(
+                f'Series should not exceed {RECURRENCE_MAX_OCCURRENCES} occurrences.'
+            )
+        last_start = occurrence_start
+    if last_start is None:
+        raise ValueError('Series has no occurrences.')
+    return last_start + (end_time - start_time)
+
+
+def get_meeting_series_end(
+    recurrence_rule: Optional[str], start_time: datetime, end_time: datetime
+) -> datetime:
+    if not recurrence_rule:
+        return end_time
+    return get_series_end(parse_rrule(recurrence_rule), start_time, end_time)
+
+
+def is_occurrence_start(
+    rule: RecurrenceRule, start_time: datetime, original_start_time: datetime
+) -> bool:
+    after = original_start_time - timedelta(microseconds=1)
+    return next(iter_occurrence_starts(rule, start_time, after), None) == (
+        original_start_time
+    )
+
+
+def expand_occurrences(
+    rule: RecurrenceRule,
+    start_time: datetime,
+    end_time: datetime,
+    window_start: datetime,
+    window_end: datetime,
+    overrides: Iterable = (),
+) -> list[Occurrence]:
+    """Occurrences overlapping [window_start, window_end), overrides applied."""
+    duration = end_time - start_time
+    overrides = {override.original_start_time: override for override in overrides}
+
+    occurrences = []
+    for occurrence_start in iter_occurrence_starts(
+        rule, start_time, window_start - duration
+    ):
+        if occurrence_start >= window_end:
+            break
+        if occurrence_start not in overrides:
+            occurrences.append(
+                Occurrence(
+                    occurrence_start, occurrence_start, occurrence_start + duration
+                )
+            )
+
+    for override in overrides.values():
+        if override.is_cancelled:
+            continue
+        if override.start_time < window_end and override.end_time > window_start:
+            occurrences.append(
+                Occurrence(
+                    override.original_start_time,
+                    override.start_time,
+                    override.end_time,
+                    override,
+                )
+            )
+
+    return sorted(occurrences, key=lambda occurrence: occurrence[:3])
+
+
+def get_series_intervals(
+    recurrence_rule: Optional[str],
+    start_time: datetime,
+    end_time: datetime,
+    overrides: Iterable = (),
+) -> list[Interval]:
+    """Time taken by all occurrences of a meeting or series."""
+    if not recurrence_rule:
+        return [(start_time, end_time)]
+    return [
+        (occurrence.start_time, occurrence.end_time)
+        for occurrence in expand_occurrences(
+            parse_rrule(recurrence_rule),
+            start_time,
+            end_time,
+            start_time,
+            datetime.max,
+            overrides,
+        )
+    ]
+
+
+def get_meeting_intervals(
+    meeting, window_start: datetime, window_end: datetime
+) -> list[Interval]:
+    """Time taken by a meeting or by the occurrences of a series in a window."""
+    if not meeting.recurrence_rule:
+        return [(meeting.start_time, meeting.end_time)]
+    return [
+        (occurrence.start_time, occurrence.end_time)
+        for occurrence in expand_occurrences(
+            parse_rrule(meeting.recurrence_rule),
+            meeting.start_time,
+            meeting.end_time,
+            window_start,
+            window_end,
+            meeting.occurrence_overrides,
+        )
+    ]
@@ -1,12 +1,12 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
-from config.constants import EVENT_NAME_LENGTH
+from config.constants import EVENT_NAME_LENGTH, FREE_BUSY_MAX_DAYS, FREE_BUSY_MAX_USERS
 from infrastructure.models.calendar import EventType
-from infrastructure.schemas.meeting import MeetingBase
+from infrastructure.schemas.meeting import MeetingBase, MeetingOccurrence
 from infrastructure.schemas.task import TaskBase
 from infrastructure.schemas.user import UserMinimal
 
@@ -30,3 +30,44 @@ class CalendarFull(CalendarBase):
     task: Optional[TaskBase] = Field(None, description='Event title')
     meeting: Optional[MeetingBase] = Field(None, description='Event title')
     event_creator: Optional[UserMinimal] = Field(None, description='Event creator')
+    occurrences: list[MeetingOccurrence] = Field(
+        [], description='Occurrences of a recurring meeting in the requested range'
+    )
+
+
+class TimeInterval(BaseModel):
+    start_time: datetime = Field(..., description='Interval start')
+    end_time: datetime = Field(..., description='Interval end')
+
+
+class FreeBusyRequest(BaseModel):
+    user_ids: list[UUID] = Field(
+        ..., min_length=1, max_length=FREE_BUSY_MAX_USERS, description='Users'
+    )
+    start_time: datetime = Field(..., description='Window start')
+    end_time: datetime = Field(..., description='Window end')
+
+    @model_validator(mode='after')
+    def check_window(self):
+        self.start_time = self.start_time.replace(tzinfo=None)
+        self.end_time = self.end_time.replace(tzinfo=None)
+        self.user_ids = list(dict.fromkeys(self.user_ids))
+
+        if self.end_time <= self.start_time:
+            raise ValueError(f'{self.end_time} should be later than {self.start_time}.')
+        if self.end_time - self.start_time > timedelta(days=FREE_BUSY_MAX_DAYS):
+            raise ValueError(f'Window should not exceed {FREE_BUSY_MAX_DAYS} days.')
+
+        return self
+
+
+class UserBusy(BaseModel):
+    user_id: UUID = Field(..., description='User id')
+    busy: list[TimeInterval] = Field(..., description='Merged busy intervals')
+
+
+class FreeBusy(BaseModel):
+    start_time: datetime = Field(..., description='Window start')
+    end_time: datetime = Field(..., description='Window end')
+    users: list[UserBusy] = Field(..., description='Busy intervals per user')
+    free: list[TimeInterval] = Field(..., description='Slots free for everyone')
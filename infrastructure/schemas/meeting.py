@@ -1,13 +1,33 @@
-from datetime import datetime, timezone
+from datetime import datetime, time, timedelta, timezone
+from enum import Enum
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
-
-from config.constants import MEETING_NAME_LENGTH
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+from config.constants import (
+    FREE_BUSY_MAX_DAYS,
+    FREE_BUSY_MAX_USERS,
+    MEETING_NAME_LENGTH,
+    SLOT_SEARCH_MAX_SLOTS,
+)
+from infrastructure.scheduling.recurrence import (
+    expand_occurrences,
+    get_series_end,
+    parse_rrule,
+)
 from infrastructure.schemas.user import UserMinimal
 
 
+class MeetingConflictMode(str, Enum):
+    REJECT = 'reject'
+    WARN = 'warn'
+
+
+def normalize_rrule(value: Optional[str]) -> Optional[str]:
+    return str(parse_rrule(value)) if value else value
+
+
 class MeetingCreate(BaseModel):
     title: str = Field(..., max_length=MEETING_NAME_LENGTH, description='Task name')
     description: str = Field(..., description='Meeting description')
@@ -15,6 +35,11 @@ class MeetingCreate(BaseModel):
     end_time: datetime = Field(..., description='Meeting end time')
 
     participants: list[UUID] = Field(..., description='Meeting participants')
+    recurrence_rule: Optional[str] = Field(
+        None, description='RRULE: FREQ=DAILY|WEEKLY|MONTHLY, INTERVAL, COUNT|UNTIL'
+    )
+
+    _normalize_rrule = field_validator('recurrence_rule')(normalize_rrule)
 
     @model_validator(mode='after')
     def check_times(self):
@@ -28,6 +53,10 @@ class MeetingCreate(BaseModel):
             raise ValueError(
                 f'{self.end_time} cannot be earlier than {self.start_time}.'
             )
+        if self.recurrence_rule:
+            get_series_end(
+                parse_rrule(self.recurrence_rule), self.start_time, self.end_time
+            )
 
         return self
 
@@ -41,6 +70,11 @@ class MeetingEdit(BaseModel):
     end_time: datetime = Field(..., description='Meeting end time')
 
     participants: Optional[list[UUID]] = Field(None, description='Meeting participants')
+    recurrence_rule: Optional[str] = Field(
+        None, description='RRULE, an empty string makes the meeting single'
+    )
+
+    _normalize_rrule = field_validator('recurrence_rule')(normalize_rrule)
 
     @model_validator(mode='after')
     def check_times(self):
@@ -55,6 +89,10 @@ class MeetingEdit(BaseModel):
             raise ValueError(
                 f'{self.end_time} cannot be earlier than {self.start_time}.'
             )
+        if self.recurrence_rule:
+            get_series_end(
+                parse_rrule(self.recurrence_rule), self.start_time, self.end_time
+            )
 
         return self
 
@@ -65,6 +103,8 @@ class MeetingBase(BaseModel):
     description: str = Field(..., description='Meeting description')
     start_time: datetime = Field(..., description='Start time')
     end_time: datetime = Field(..., description='End time')
+    recurrence_rule: Optional[str] = Field(None, description='Recurrence rule')
+    series_end_time: datetime = Field(..., description='End of the last occurrence')
     created_at: datetime = Field(..., description='Meeting creation time')
     meeting_creator_id: Optional[UUID] = Field(None, description='Meeting creator id')
     calendar_event_id: Optional[int] = Field(None, description='Meeting calendar id')
@@ -72,6 +112,128 @@ class MeetingBase(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class MeetingOccurrence(BaseModel):
+    original_start_time: datetime = Field(..., description='Start in the series')
+    start_time: datetime = Field(..., description='Occurrence start time')
+    end_time: datetime = Field(..., description='Occurrence end time')
+    title: str = Field(..., description='Occurrence title')
+    description: str = Field(..., description='Occurrence description')
+
+
+def get_meeting_occurrences(
+    meeting, from_time: Optional[datetime] = None, to_time: Optional[datetime] = None
+) -> list[MeetingOccurrence]:
+    """Expand a recurring meeting over the range, defaulting to the series."""
+    if not meeting.recurrence_rule:
+        return []
+
+    occurrences = expand_occurrences(
+        parse_rrule(meeting.recurrence_rule),
+        meeting.start_time,
+        meeting.end_time,
+        from_time or meeting.start_time,
+        to_time or meeting.series_end_time,
+        meeting.occurrence_overrides,
+    )
+    result = []
+    for occurrence in occurrences:
+        title, description = meeting.title, meeting.description
+        if occurrence.override is not None:
+            title = occurrence.override.title or title
+            description = occurrence.override.description or description
+        result.append(
+            MeetingOccurrence(
+                original_start_time=occurrence.original_start_time,
+                start_time=occurrence.start_time,
+                end_time=occurrence.end_time,
+                title=title,
+                description=description,
+            )
+        )
+    return result
+
+
+class MeetingOccurrenceEdit(BaseModel):
+    original_start_time: datetime = Field(..., description='Start in the series')
+    is_cancelled: bool = Field(False, description='Cancel the occurrence')
+    start_time: Optional[datetime] = Field(None, description='New start time')
+    end_time: Optional[datetime] = Field(None, description='New end time')
+    title: Optional[str] = Field(
+        None, max_length=MEETING_NAME_LENGTH, description='New title'
+    )
+    description: Optional[str] = Field(None, description='New description')
+
+    @model_validator(mode='after')
+    def check_times(self):
+        self.original_start_time = self.original_start_time.replace(tzinfo=None)
+        self.start_time = self.start_time and self.start_time.replace(tzinfo=None)
+        self.end_time = self.end_time and self.end_time.replace(tzinfo=None)
+
+        if (self.start_time is None) != (self.end_time is None):
+            raise ValueError('start_time and end_time should be given together.')
+        if self.start_time and self.end_time <= self.start_time:
+            raise ValueError(f'{self.end_time} should be later than {self.start_time}.')
+
+        return self
+
+
 class MeetingFull(MeetingBase):
     meeting_creator: UserMinimal = Field(..., description='Meeting creator')
     participants: list[UserMinimal] = Field(..., description='Meeting participants')
+    occurrences: list[MeetingOccurrence] = Field(
+        [], description='Occurrences of a recurring meeting in the requested range'
+    )
+
+
+class ParticipantConflicts(BaseModel):
+    user_id: UUID = Field(..., description='Participant id')
+    meetings: list[MeetingBase] = Field(..., description='Overlapping meetings')
+
+
+class MeetingWithConflicts(MeetingFull):
+    conflicts: list[ParticipantConflicts] = Field(
+        [], description='Overlapping meetings of the participants'
+    )
+
+
+class SlotSearch(BaseModel):
+    participants: list[UUID] = Field(
+        ..., max_length=FREE_BUSY_MAX_USERS, description='Meeting participants'
+    )
+    duration_minutes: int = Field(
+        ..., gt=0, le=24 * 60, description='Meeting duration in minutes'
+    )
+    start_time: datetime = Field(..., description='Search window start')
+    end_time: datetime = Field(..., description='Search window end')
+    work_day_start: time = Field(time(9), description='Working hours start')
+    work_day_end: time = Field(time(18), description='Working hours end')
+    include_weekends: bool = Field(False, description='Search on weekends too')
+    limit: int = Field(
+        5, ge=1, le=SLOT_SEARCH_MAX_SLOTS, description='Number of slots to return'
+    )
+
+    @model_validator(mode='after')
+    def check_window(self):
+        self.start_time = max(self.start_time.replace(tzinfo=None), datetime.now())
+        self.end_time = self.end_time.replace(tzinfo=None)
+        self.participants = list(dict.fromkeys(self.participants))
+
+        if self.end_time <= self.start_time:
+            raise ValueError(f'{self.end_time} should be later than {self.start_time}.')
+        if self.end_time - self.start_time > timedelta(days=FREE_BUSY_MAX_DAYS):
+            raise ValueError(f'Window should not exceed {FREE_BUSY_MAX_DAYS} days.')
+        if self.work_day_end <= self.work_day_start:
+            raise ValueError(
+                f'{self.work_day_end} should be later than {self.work_day_start}.'
+            )
+
+        return self
+
+    @property
+    def duration(self) -> timedelta:
+        return timedelta(minutes=self.duration_minutes)
+
+
+class MeetingSlot(BaseModel):
+    start_time: datetime = Field(..., description='Slot start')
+    end_time: datetime = Field(..., description='Slot end')
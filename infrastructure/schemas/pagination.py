@@ -0,0 +1,27 @@
+from typing import Generic, Optional, TypeVar
+
+from fastapi import Query
+from fastapi_pagination import Params
+from pydantic import BaseModel, Field
+
+
+T = TypeVar('T')
+
+
+class KeysetParams(Params):
+    keyset: bool = Query(False, description='Use cursor (keyset) pagination')
+    cursor: Optional[str] = Query(None, description='Cursor of the next page')
+    with_total: bool = Query(
+        False, description='Count total items, cursor pagination only'
+    )
+
+    @property
+    def is_keyset(self) -> bool:
+        return self.keyset or self.cursor is not None
+
+
+class CursorPage(BaseModel, Generic[T]):
+    items: list[T] = Field(..., description='Page items')
+    size: int = Field(..., description='Page size')
+    next_cursor: Optional[str] = Field(None, description='Cursor of the next page')
+    total: Optional[int] = Field(None, description='Total items, if requested')
@@ -5,7 +5,7 @@ from uuid import UUID
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 from enum import Enum
 
-from config.constants import TASK_NAME_LENGTH
+from config.constants import TASK_BULK_MAX_ITEMS, TASK_NAME_LENGTH
 from infrastructure.models.task import TaskStatus
 from infrastructure.schemas.user import UserMinimal
 
@@ -30,6 +30,12 @@ class TaskCreate(BaseModel):
         return due_date
 
 
+class TaskBulkCreate(BaseModel):
+    tasks: list[TaskCreate] = Field(
+        ..., min_length=1, max_length=TASK_BULK_MAX_ITEMS, description='Tasks'
+    )
+
+
 class TaskEdit(BaseModel):
     title: Optional[str] = Field(
         None, max_length=TASK_NAME_LENGTH, description='Task name'
@@ -47,6 +53,36 @@ class TaskEdit(BaseModel):
         return due_date
 
 
+class TaskBulkEditItem(BaseModel):
+    id: int = Field(..., description='Task id')
+    title: Optional[str] = Field(
+        None, max_length=TASK_NAME_LENGTH, description='Task name'
+    )
+    status: Optional[TaskStatus] = Field(None, description='Task status')
+    due_date: Optional[datetime] = Field(None, description='Task due date')
+
+    @field_validator('due_date')
+    @classmethod
+    def is_future(cls, due_date: datetime) -> datetime:
+        due_date = due_date.replace(tzinfo=None)
+        if due_date < datetime.now():
+            raise ValueError(f'{due_date} cant be later than now')
+        return due_date
+
+
+class TaskBulkEdit(BaseModel):
+    tasks: list[TaskBulkEditItem] = Field(
+        ..., min_length=1, max_length=TASK_BULK_MAX_ITEMS, description='Task changes'
+    )
+
+    @field_validator('tasks')
+    @classmethod
+    def is_unique(cls, tasks: list[TaskBulkEditItem]) -> list[TaskBulkEditItem]:
+        if len({task.id for task in tasks}) != len(tasks):
+            raise ValueError('Task ids should be unique')
+        return tasks
+
+
 class TaskBase(BaseModel):
     id: int = Field(..., description='Task id')
     title: str = Field(..., description='Task name')
@@ -60,6 +96,21 @@ class TaskBase(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class TaskBulkError(BaseModel):
+    index: int = Field(..., description='Position of the task in the request')
+    detail: str = Field(..., description='Why the task was not created')
+
+
+class TaskBulkResult(BaseModel):
+    created: list[TaskBase] = Field(..., description='Created tasks')
+    errors: list[TaskBulkError] = Field(..., description='Tasks not created')
+
+
+class TaskBulkEditResult(BaseModel):
+    updated: list[TaskBase] = Field(..., description='Updated tasks')
+    errors: list[TaskBulkError] = Field(..., description='Tasks not updated')
+
+
 class TaskEmployee(TaskBase):
     task_manager: Optional[UserMinimal] = Field(
         None, description='Manager who set the task'
@@ -24,6 +24,10 @@ class TeamEdit(BaseModel):
     members: Optional[list[UUID]] = Field(None, description='Team members')
 
 
+class TeamMembersAdd(BaseModel):
+    members: list[UUID] = Field(..., min_length=1, description='Users to add')
+
+
 class TeamBase(BaseModel):
     id: int = Field(..., description='Team id')
     name: str = Field(..., description='Team name')
@@ -33,8 +37,14 @@ class TeamBase(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class TeamFull(TeamBase):
-    members: 'Optional[list[UserMinimal]]' = Field(None, description='Team members')
+class TeamSummary(TeamBase):
+    member_count: int = Field(0, description='Number of team members')
+
+
+class TeamFull(TeamSummary):
+    members: 'Optional[list[UserMinimal]]' = Field(
+        None, description='First team members, the rest via /members'
+    )
     team_lead: 'Optional[UserMinimal]' = Field(None, description='Team lead')
 
 
@@ -1,6 +1,13 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 
 class Token(BaseModel):
     access_token: str = Field(..., description='Access token')
     token_type: str = Field(..., description='Token type')
+    refresh_token: Optional[str] = Field(None, description='Refresh token')
+
+
+class TokenRefresh(BaseModel):
+    refresh_token: str = Field(..., description='Refresh token')
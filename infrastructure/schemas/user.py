@@ -65,6 +65,13 @@ class UserMinimal(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class UserClaims(BaseModel):
+    id: UUID = Field(..., description='User id')
+    status: UserStatus = Field(..., description='User status')
+    position: UserPosition = Field(..., description='User postiion in the company')
+    team_id: Optional[int] = Field(None, description='Teamd id')
+
+
 class UserBase(UserMinimal):
     hired_at: date = Field(..., description='Hiring date')
     fired_at: Optional[date] = Field(..., description='Firing date')
@@ -1,17 +1,31 @@
+from datetime import datetime
 from typing import Optional, Sequence
 from uuid import UUID
 
-from fastapi_pagination import Params
 from fastapi_pagination.ext.sqlalchemy import paginate
-from sqlalchemy import delete, update
+from sqlalchemy import delete, insert, update
 from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from infrastructure.db.calendar_entries import sync_calendar_entries
+from infrastructure.db.keyset import keyset_paginate
+from infrastructure.db.sql_db import replica_safe
 from infrastructure.models.calendar import CalendarEvent, EventType
-from infrastructure.models.meeting import Meeting
+from infrastructure.models.meeting import (
+    Meeting,
+    MeetingOccurrenceOverride,
+    user_meeting,
+)
 from infrastructure.models.user import User
-from infrastructure.schemas.meeting import MeetingCreate, MeetingEdit
+from infrastructure.scheduling.recurrence import get_meeting_series_end
+from infrastructure.schemas.meeting import (
+    MeetingCreate,
+    MeetingEdit,
+    MeetingOccurrenceEdit,
+)
+from infrastructure.schemas.pagination import KeysetParams
 
 
 async def get_user_by_id(session: AsyncSession, id: UUID) -> Optional[User]:
@@ -26,6 +40,7 @@ async def get_users_by_ids(session: AsyncSession, ids: list[UUID]) -> Sequence[U
     return result.scalars().all()
 
 
+@replica_safe
 async def get_meeting_full_info_by_id(
     session: AsyncSession, meeting_id: int
 ) -> Optional[Meeting]:
@@ -35,27 +50,101 @@ async def get_meeting_full_info_by_id(
         .options(
             joinedload(Meeting.meeting_creator),
             joinedload(Meeting.participants),
+            selectinload(Meeting.occurrence_overrides),
         )
     )
     result = await session.execute(query)
     return result.scalar()
 
 
+@replica_safe
 async def get_all_employee_meetings(
-    session: AsyncSession, employee_id: UUID, params: Params
+    session: AsyncSession,
+    employee_id: UUID,
+    params: KeysetParams,
+    from_time: Optional[datetime] = None,
+    to_time: Optional[datetime] = None,
 ) -> Sequence[Meeting]:
     query = (
         select(Meeting)
-        .join(Meeting.participants)
         .where(Meeting.participants.any(User.id == employee_id))
         .options(
-            selectinload(Meeting.participants), selectinload(Meeting.meeting_creator)
+            selectinload(Meeting.participants),
+            selectinload(Meeting.meeting_creator),
+            selectinload(Meeting.occurrence_overrides),
         )
     )
 
+    # A recurring meeting matches when its series spans into the range.
+    if from_time:
+        query = query.where(Meeting.series_end_time >= from_time)
+    if to_time:
+        query = query.where(Meeting.start_time < to_time)
+
+    if params.is_keyset:
+        return await keyset_paginate(
+            session, query, params, [Meeting.start_time, Meeting.id]
+        )
     return await paginate(session, query, params)
 
 
+async def get_conflicting_meetings(
+    session: AsyncSession,
+    user_ids: Sequence[UUID],
+    start_time: datetime,
+    end_time: datetime,
+    exclude_meeting_id: Optional[int] = None,
+) -> Sequence[tuple[UUID, Meeting]]:
+    """(participant id, meeting) pairs overlapping [start_time, end_time).
+
+    The time range is matched on the meetings index first, which leads
+    with series_end_time, so the scan covers meetings still running at
+    start_time and skips everything that has already ended. Recurring
+    meetings are matched by their whole series; the caller checks their
+    occurrences.
+    """
+    query = (
+        select(user_meeting.c.user_id, Meeting)
+        .join(user_meeting, user_meeting.c.meeting_id == Meeting.id)
+        .where(
+            user_meeting.c.user_id.in_(user_ids),
+            Meeting.start_time < end_time,
+            Meeting.series_end_time > start_time,
+        )
+        .options(selectinload(Meeting.occurrence_overrides))
+        .order_by(user_meeting.c.user_id, Meeting.start_time)
+    )
+    if exclude_meeting_id is not None:
+        query = query.where(Meeting.id != exclude_meeting_id)
+    result = await session.execute(query)
+    return result.all()
+
+
+@replica_safe
+async def get_busy_meetings(
+    session: AsyncSession,
+    user_ids: Sequence[UUID],
+    start_time: datetime,
+    end_time: datetime,
+) -> Sequence[Meeting]:
+    """Meetings of any of the users whose series overlaps the window."""
+    query = (
+        select(Meeting)
+        .where(
+            Meeting.id.in_(
+                select(user_meeting.c.meeting_id).where(
+                    user_meeting.c.user_id.in_(user_ids)
+                )
+            ),
+            Meeting.start_time < end_time,
+            Meeting.series_end_time > start_time,
+        )
+        .options(selectinload(Meeting.occurrence_overrides))
+    )
+    result = await session.execute(query)
+    return result.scalars().all()
+
+
 async def get_meeting_by_id(
     session: AsyncSession, meeting_id: int
 ) -> Optional[Meeting]:
@@ -70,34 +159,57 @@ async def create_new_meeting(
     organizer_id: UUID,
     participants: Sequence[User],
 ):
-    new_calendar_event = CalendarEvent(
-        event_type=EventType.MEETING,
-        title=new_meeting_data.title,
-        description=new_meeting_data.description,
-        start_time=new_meeting_data.start_time,
-        end_time=new_meeting_data.start_time,
-        event_creator_id=organizer_id,
+    recurrence_rule = new_meeting_data.recurrence_rule or None
+    series_end_time = get_meeting_series_end(
+        recurrence_rule, new_meeting_data.start_time, new_meeting_data.end_time
     )
 
-    session.add(new_calendar_event)
-    await session.flush()
-
-    new_meeting = Meeting(
-        title=new_meeting_data.title,
-        description=new_meeting_data.description,
-        start_time=new_meeting_data.start_time,
-        end_time=new_meeting_data.end_time,
-        meeting_creator_id=organizer_id,
-        calendar_event_id=new_calendar_event.id,
-        participants=participants,
+    # The calendar event of a recurring meeting spans the whole series; it
+    # is inserted in a CTE of the meeting insert.
+    new_calendar_event = (
+        insert(CalendarEvent)
+        .values(
+            event_type=EventType.MEETING,
+            title=new_meeting_data.title,
+            description=new_meeting_data.description,
+            start_time=new_meeting_data.start_time,
+            end_time=series_end_time,
+            event_creator_id=organizer_id,
+        )
+        .returning(CalendarEvent.id)
+        .cte('new_calendar_event')
     )
-
-    session.add(new_meeting)
+    new_meeting = await session.scalar(
+        insert(Meeting)
+        .values(
+            title=new_meeting_data.title,
+            description=new_meeting_data.description,
+            start_time=new_meeting_data.start_time,
+            end_time=new_meeting_data.end_time,
+            recurrence_rule=recurrence_rule,
+            series_end_time=series_end_time,
+            meeting_creator_id=organizer_id,
+            calendar_event_id=select(new_calendar_event.c.id).scalar_subquery(),
+        )
+        .returning(Meeting)
+    )
+    await session.execute(
+        insert(user_meeting),
+        [
+            {'user_id': participant.id, 'meeting_id': new_meeting.id}
+            for participant in participants
+        ],
+    )
+    await sync_calendar_entries(session, [new_meeting.calendar_event_id])
 
     await session.commit()
-    await session.refresh(
-        new_meeting, attribute_names=['participants', 'meeting_creator']
+
+    # Everything the response needs is already at hand, nothing is reloaded.
+    set_committed_value(new_meeting, 'participants', list(participants))
+    set_committed_value(
+        new_meeting, 'meeting_creator', await session.get(User, organizer_id)
     )
+    set_committed_value(new_meeting, 'occurrence_overrides', [])
 
     return new_meeting
 
@@ -114,22 +226,51 @@ async def update_meeting(
         if value is not None
     }
     update_data.pop('participants', None)
+    recurrence_rule = update_data.pop(
+        'recurrence_rule', meeting_to_update.recurrence_rule
+    )
+    old_timing = (
+        meeting_to_update.start_time,
+        meeting_to_update.end_time,
+        meeting_to_update.recurrence_rule,
+    )
 
     for key, value in update_data.items():
         if value:
             setattr(meeting_to_update, key, value)
+    meeting_to_update.recurrence_rule = recurrence_rule or None
 
     if participants:
         meeting_to_update.participants = participants
 
+    # Overrides belong to the old occurrences once the series timing changes.
+    if old_timing != (
+        meeting_to_update.start_time,
+        meeting_to_update.end_time,
+        meeting_to_update.recurrence_rule,
+    ):
+        await session.execute(
+            delete(MeetingOccurrenceOverride).where(
+                MeetingOccurrenceOverride.meeting_id == meeting_to_update.id
+            )
+        )
+        set_committed_value(meeting_to_update, 'occurrence_overrides', [])
+        meeting_to_update.series_end_time = get_meeting_series_end(
+            meeting_to_update.recurrence_rule,
+            meeting_to_update.start_time,
+            meeting_to_update.end_time,
+        )
+    update_data['end_time'] = meeting_to_update.series_end_time
+
     await session.execute(
         update(CalendarEvent)
         .where(CalendarEvent.id == meeting_to_update.calendar_event_id)
         .values(**update_data)
     )
+    await session.flush()
+    await sync_calendar_entries(session, [meeting_to_update.calendar_event_id])
 
     await session.commit()
-    await session.refresh(meeting_to_update)
 
     return meeting_to_update
 
@@ -140,4 +281,56 @@ async def delete_meeting_from_db(session: AsyncSession, meeting_to_delete: Meeti
     await session.flush()
 
     await session.execute(delete(CalendarEvent).where(CalendarEvent.id == event_id))
+    await sync_calendar_entries(session, [event_id])
     await session.commit()
+
+
+async def save_occurrence_override(
+    session: AsyncSession,
+    meeting: Meeting,
+    occurrence_data: MeetingOccurrenceEdit,
+) -> MeetingOccurrenceOverride:
+    """Create or replace the override of one occurrence of a series."""
+    override = next(
+        (
+            override
+            for override in meeting.occurrence_overrides
+            if override.original_start_time == occurrence_data.original_start_time
+        ),
+        None,
+    )
+    if override is None:
+        override = MeetingOccurrenceOverride(
+            original_start_time=occurrence_data.original_start_time
+        )
+        meeting.occurrence_overrides.append(override)
+
+    override.is_cancelled = occurrence_data.is_cancelled
+    override.start_time = occurrence_data.start_time
+    override.end_time = occurrence_data.end_time
+    override.title = occurrence_data.title
+    override.description = occurrence_data.description
+
+    # A moved occurrence may end after the series, the calendar event is
+    # stretched to it so the read model still covers it.
+    meeting.series_end_time = max(
+        get_meeting_series_end(
+            meeting.recurrence_rule, meeting.start_time, meeting.end_time
+        ),
+        *(
+            override.end_time
+            for override in meeting.occurrence_overrides
+            if not override.is_cancelled
+        ),
+    )
+    await session.execute(
+        update(CalendarEvent)
+        .where(CalendarEvent.id == meeting.calendar_event_id)
+        .values(end_time=meeting.series_end_time)
+    )
+    await session.flush()
+    await sync_calendar_entries(session, [meeting.calendar_event_id])
+
+    await session.commit()
+
+    return override
@@ -1,29 +1,67 @@
-from typing import Annotated
+from collections import defaultdict
+from datetime import datetime
+from itertools import chain
+from typing import Annotated, Optional, Union
 
-from fastapi import BackgroundTasks, Depends, APIRouter, Request, status
-from fastapi_pagination import Page, Params
+from fastapi import BackgroundTasks, Depends, APIRouter, Query, Request, status
+from fastapi.encoders import jsonable_encoder
+from fastapi_pagination import Page
 from redis import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from infrastructure.cache.free_busy import invalidate_free_busy
 from infrastructure.db.redis_db import get_redis
 from infrastructure.exceptions.basic_exeptions import NotFoundException
+from infrastructure.exceptions.calendar_exceptions import InvalidTimeRangeException
 from infrastructure.exceptions.meeting_exceptions import (
     AtLeastTwoMeetingParticipantsException,
     CantEditMeetingException,
+    InvalidRecurrenceException,
+    MeetingConflictException,
     MeetingMembersNotFoundException,
     MeetingMembersNotUniqueException,
+    NotRecurringMeetingException,
     NotYourMeetingException,
+    OccurrenceBeforeSeriesException,
 )
 from infrastructure.models.user import UserPosition
-from infrastructure.db.sql_db import get_session
+from infrastructure.db.sql_db import get_session, read_only
 from infrastructure.notification.notification import send_email
-from infrastructure.schemas.meeting import MeetingCreate, MeetingEdit, MeetingFull
+from infrastructure.schemas.meeting import (
+    MeetingBase,
+    MeetingConflictMode,
+    MeetingCreate,
+    MeetingEdit,
+    MeetingFull,
+    MeetingOccurrenceEdit,
+    MeetingSlot,
+    MeetingWithConflicts,
+    ParticipantConflicts,
+    SlotSearch,
+    get_meeting_occurrences,
+)
+from infrastructure.scheduling.intervals import (
+    find_free_slots,
+    get_working_windows,
+    intervals_overlap,
+)
+from infrastructure.scheduling.recurrence import (
+    get_meeting_intervals,
+    get_meeting_series_end,
+    get_series_intervals,
+    is_occurrence_start,
+    parse_rrule,
+)
+from infrastructure.schemas.pagination import CursorPage, KeysetParams
 from meeting_service.crud.sql_repository import (
     create_new_meeting,
     delete_meeting_from_db,
     get_all_employee_meetings,
+    get_busy_meetings,
+    get_conflicting_meetings,
     get_meeting_full_info_by_id,
     get_users_by_ids,
+    save_occurrence_override,
     update_meeting,
 )
 from meeting_service.permissions.rbac_meeting import (
@@ -36,21 +74,79 @@ from meeting_service.permissions.rbac_meeting import (
 meeting_router = APIRouter()
 
 
-@meeting_router.get('/', response_model=Page[MeetingFull])
+def with_occurrences(
+    meeting, from_time: Optional[datetime] = None, to_time: Optional[datetime] = None
+) -> MeetingFull:
+    return MeetingFull.model_validate(meeting).model_copy(
+        update={'occurrences': get_meeting_occurrences(meeting, from_time, to_time)}
+    )
+
+
+async def check_meeting_conflicts(
+    session: AsyncSession,
+    participant_ids: list,
+    intervals: list,
+    conflicts: Optional[MeetingConflictMode],
+    exclude_meeting_id: Optional[int] = None,
+) -> list[ParticipantConflicts]:
+    """Meetings of the participants overlapping any of the given intervals."""
+    if conflicts is None:
+        return []
+
+    start_time = min(start for start, _ in intervals)
+    end_time = max(end for _, end in intervals)
+    rows = await get_conflicting_meetings(
+        session, participant_ids, start_time, end_time, exclude_meeting_id
+    )
+    overlapping = {}
+    meetings_by_user = defaultdict(list)
+    for user_id, meeting in rows:
+        if meeting.id not in overlapping:
+            overlapping[meeting.id] = intervals_overlap(
+                intervals, get_meeting_intervals(meeting, start_time, end_time)
+            )
+        if overlapping[meeting.id]:
+            meetings_by_user[user_id].append(MeetingBase.model_validate(meeting))
+    participant_conflicts = [
+        ParticipantConflicts(user_id=user_id, meetings=meetings)
+        for user_id, meetings in meetings_by_user.items()
+    ]
+
+    if participant_conflicts and conflicts == MeetingConflictMode.REJECT:
+        raise MeetingConflictException(jsonable_encoder(participant_conflicts))
+    return participant_conflicts
+
+
+@meeting_router.get(
+    '/', response_model=Union[Page[MeetingFull], CursorPage[MeetingFull]]
+)
 @require_authentication
 async def get_my_tasks(
     request: Request,
     session: Annotated[AsyncSession, Depends(get_session)],
     redis: Annotated[Redis, Depends(get_redis)],
-    params: Annotated[Params, Depends()],
+    params: Annotated[KeysetParams, Depends()],
     current_user=None,
+    from_time: Optional[datetime] = Query(None, alias='from'),
+    to_time: Optional[datetime] = Query(None, alias='to'),
 ):
-    meetings = await get_all_employee_meetings(session, current_user.id, params)
+    from_time = from_time and from_time.replace(tzinfo=None)
+    to_time = to_time and to_time.replace(tzinfo=None)
+    if from_time and to_time and to_time <= from_time:
+        raise InvalidTimeRangeException
+
+    meetings = await get_all_employee_meetings(
+        session, current_user.id, params, from_time, to_time
+    )
+    # Occurrences are expanded only for the meetings of this page.
+    meetings.items = [
+        with_occurrences(meeting, from_time, to_time) for meeting in meetings.items
+    ]
     return meetings
 
 
 @meeting_router.post(
-    '/', response_model=MeetingFull, status_code=status.HTTP_201_CREATED
+    '/', response_model=MeetingWithConflicts, status_code=status.HTTP_201_CREATED
 )
 @require_position_authentication(
     [UserPosition.MANAGER, UserPosition.CEO, UserPosition.ADMIN]
@@ -62,6 +158,7 @@ async def create_meeting(
     redis: Annotated[Redis, Depends(get_redis)],
     new_meeting_data: MeetingCreate,
     current_user=None,
+    conflicts: Optional[MeetingConflictMode] = None,
 ):
     new_meeting_data.participants.append(current_user.id)
 
@@ -74,14 +171,70 @@ async def create_meeting(
     if len(participants) < 2:
         raise AtLeastTwoMeetingParticipantsException
 
+    intervals = get_series_intervals(
+        new_meeting_data.recurrence_rule,
+        new_meeting_data.start_time,
+        new_meeting_data.end_time,
+    )
+    participant_conflicts = await check_meeting_conflicts(
+        session, new_meeting_data.participants, intervals, conflicts
+    )
+
     new_meeting = await create_new_meeting(
         session, new_meeting_data, current_user.id, participants
     )
+    await invalidate_free_busy(
+        [participant.id for participant in participants], intervals, redis
+    )
 
     email = [participant.email for participant in participants]
     background_tasks.add_task(send_email, email, 'Notification', 'Meeting added')
 
-    return new_meeting
+    return MeetingWithConflicts.model_validate(new_meeting).model_copy(
+        update={
+            'conflicts': participant_conflicts,
+            'occurrences': get_meeting_occurrences(new_meeting),
+        }
+    )
+
+
+@meeting_router.post('/slots', response_model=list[MeetingSlot])
+@read_only
+@require_position_authentication(
+    [UserPosition.MANAGER, UserPosition.CEO, UserPosition.ADMIN]
+)
+async def find_meeting_slots(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    redis: Annotated[Redis, Depends(get_redis)],
+    slot_search: SlotSearch,
+    current_user=None,
+):
+    if current_user.id not in slot_search.participants:
+        slot_search.participants.append(current_user.id)
+
+    participants = await get_users_by_ids(session, slot_search.participants)
+    if len(slot_search.participants) != len(participants):
+        raise MeetingMembersNotFoundException
+
+    meetings = await get_busy_meetings(
+        session, slot_search.participants, slot_search.start_time, slot_search.end_time
+    )
+    busy = chain.from_iterable(
+        get_meeting_intervals(meeting, slot_search.start_time, slot_search.end_time)
+        for meeting in meetings
+    )
+    windows = get_working_windows(
+        slot_search.start_time,
+        slot_search.end_time,
+        slot_search.work_day_start,
+        slot_search.work_day_end,
+        slot_search.include_weekends,
+    )
+    slots = find_free_slots(busy, windows, slot_search.duration, slot_search.limit)
+
+    return [MeetingSlot(start_time=start, end_time=end) for start, end in slots]
 
 
 @meeting_router.get('/{meeting_id}', response_model=MeetingFull)
@@ -107,10 +260,10 @@ async def get_meeting_full_info(
         ]:
             raise NotYourMeetingException
 
-    return meeting
+    return with_occurrences(meeting)
 
 
-@meeting_router.patch('/{meeting_id}', response_model=MeetingFull)
+@meeting_router.patch('/{meeting_id}', response_model=MeetingWithConflicts)
 @require_user_authentication
 async def edit_meeting(
     request: Request,
@@ -120,6 +273,7 @@ async def edit_meeting(
     meeting_id: int,
     new_meeting_data: MeetingEdit,
     current_user=None,
+    conflicts: Optional[MeetingConflictMode] = None,
 ):
     meeting_to_update = await get_meeting_full_info_by_id(session, meeting_id)
     if not meeting_to_update:
@@ -147,14 +301,71 @@ async def edit_meeting(
         if len(participants) < 2:
             raise AtLeastTwoMeetingParticipantsException
 
+    old_participant_ids = [
+        participant.id for participant in meeting_to_update.participants
+    ]
+    old_intervals = get_series_intervals(
+        meeting_to_update.recurrence_rule,
+        meeting_to_update.start_time,
+        meeting_to_update.end_time,
+        meeting_to_update.occurrence_overrides,
+    )
+
+    recurrence_rule = meeting_to_update.recurrence_rule
+    if new_meeting_data.recurrence_rule is not None:
+        recurrence_rule = new_meeting_data.recurrence_rule or None
+    try:
+        get_meeting_series_end(
+            recurrence_rule, new_meeting_data.start_time, new_meeting_data.end_time
+        )
+    except ValueError as error:
+        raise InvalidRecurrenceException(str(error))
+    # Overrides are kept only while the series timing stays the same.
+    timing_kept = (
+        new_meeting_data.start_time,
+        new_meeting_data.end_time,
+        recurrence_rule,
+    ) == (
+        meeting_to_update.start_time,
+        meeting_to_update.end_time,
+        meeting_to_update.recurrence_rule,
+    )
+    new_intervals = get_series_intervals(
+        recurrence_rule,
+        new_meeting_data.start_time,
+        new_meeting_data.end_time,
+        meeting_to_update.occurrence_overrides if timing_kept else (),
+    )
+
+    participant_conflicts = await check_meeting_conflicts(
+        session,
+        [participant.id for participant in participants]
+        if participants
+        else old_participant_ids,
+        new_intervals,
+        conflicts,
+        exclude_meeting_id=meeting_id,
+    )
+
     updated_meeting = await update_meeting(
         session, meeting_to_update, new_meeting_data, participants
     )
+    await invalidate_free_busy(
+        old_participant_ids
+        + [participant.id for participant in updated_meeting.participants],
+        old_intervals + new_intervals,
+        redis,
+    )
 
     email = [participant.email for participant in updated_meeting.participants]
     background_tasks.add_task(send_email, email, 'Notification', 'Meeting updated')
 
-    return updated_meeting
+    return MeetingWithConflicts.model_validate(updated_meeting).model_copy(
+        update={
+            'conflicts': participant_conflicts,
+            'occurrences': get_meeting_occurrences(updated_meeting),
+        }
+    )
 
 
 @meeting_router.delete('/{meeting_id}', status_code=status.HTTP_204_NO_CONTENT)
@@ -177,7 +388,72 @@ async def delete_meeting(
         if current_user.id != meeting_to_delete.meeting_creator_id:
             raise CantEditMeetingException
 
+    intervals = get_series_intervals(
+        meeting_to_delete.recurrence_rule,
+        meeting_to_delete.start_time,
+        meeting_to_delete.end_time,
+        meeting_to_delete.occurrence_overrides,
+    )
     await delete_meeting_from_db(session, meeting_to_delete)
+    await invalidate_free_busy(
+        [participant.id for participant in meeting_to_delete.participants],
+        intervals,
+        redis,
+    )
 
     email = [participant.email for participant in meeting_to_delete.participants]
     background_tasks.add_task(send_email, email, 'Notification', 'Meeting deleted')
+
+
+@meeting_router.put('/{meeting_id}/occurrences', response_model=MeetingFull)
+@require_user_authentication
+async def edit_meeting_occurrence(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    redis: Annotated[Redis, Depends(get_redis)],
+    meeting_id: int,
+    occurrence_data: MeetingOccurrenceEdit,
+    current_user=None,
+):
+    meeting = await get_meeting_full_info_by_id(session, meeting_id)
+    if not meeting:
+        raise NotFoundException
+    if current_user.position not in (UserPosition.ADMIN, UserPosition.CEO):
+        if current_user.id != meeting.meeting_creator_id:
+            raise CantEditMeetingException
+
+    if not meeting.recurrence_rule:
+        raise NotRecurringMeetingException
+    original_start_time = occurrence_data.original_start_time
+    if not is_occurrence_start(
+        parse_rrule(meeting.recurrence_rule), meeting.start_time, original_start_time
+    ):
+        raise NotFoundException
+
+    original_end_time = original_start_time + (meeting.end_time - meeting.start_time)
+    if occurrence_data.start_time is None:
+        occurrence_data.start_time = original_start_time
+        occurrence_data.end_time = original_end_time
+    if occurrence_data.start_time < meeting.start_time:
+        raise OccurrenceBeforeSeriesException
+
+    intervals = [
+        (original_start_time, original_end_time),
+        (occurrence_data.start_time, occurrence_data.end_time),
+    ] + [
+        (override.start_time, override.end_time)
+        for override in meeting.occurrence_overrides
+        if override.original_start_time == original_start_time
+    ]
+    await save_occurrence_override(session, meeting, occurrence_data)
+    await invalidate_free_busy(
+        [participant.id for participant in meeting.participants], intervals, redis
+    )
+
+    email = [participant.email for participant in meeting.participants]
+    background_tasks.add_task(
+        send_email, email, 'Notification', 'Meeting occurrence updated'
+    )
+
+    return with_occurrences(meeting)
@@ -6,7 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from meeting_service.security.identification import identificate_user
 from infrastructure.db.redis_db import get_redis
-from infrastructure.db.sql_db import get_session
+from infrastructure.db.sql_db import get_session, release_session, route_session
 from infrastructure.exceptions.auth_exceptions import NotEnoughRightsException
 from config.constants import USER_AUTH_HEADER
 from infrastructure.models.user import UserStatus
@@ -21,7 +21,9 @@ def require_position_authentication(position: list):
             session: AsyncSession = Depends(get_session),
             redis: Redis = Depends(get_redis),
             new_meeting_data=None,
+            slot_search=None,
             current_user=None,
+            conflicts=None,
         ):
             user_authorization_header = request.headers.get(USER_AUTH_HEADER)
 
@@ -31,6 +33,7 @@ def require_position_authentication(position: list):
             current_user = await identificate_user(
                 user_authorization_header, session, redis
             )
+            await route_session(request, session, current_user.id, redis)
             if current_user.status != UserStatus.ACTIVE:
                 raise NotEnoughRightsException
             if position and current_user.position not in position:
@@ -39,9 +42,15 @@ def require_position_authentication(position: list):
             args_list = [request, background_tasks, session, redis]
             if new_meeting_data:
                 args_list.append(new_meeting_data)
+            if slot_search:
+                args_list.append(slot_search)
             args_list.append(current_user)
+            conflict_check = {'conflicts': conflicts} if conflicts else {}
 
-            return await func(*args_list)
+            try:
+                return await func(*args_list, **conflict_check)
+            finally:
+                await release_session(session)
 
         return wrapper
 
@@ -56,6 +65,8 @@ def require_authentication(func):
         redis: Redis = Depends(get_redis),
         params=None,
         current_user=None,
+        from_time=None,
+        to_time=None,
     ):
         user_authorization_header = request.headers.get(USER_AUTH_HEADER)
 
@@ -64,6 +75,7 @@ def require_authentication(func):
         current_user = await identificate_user(
             user_authorization_header, session, redis
         )
+        await route_session(request, session, current_user.id, redis)
         if current_user.status != UserStatus.ACTIVE:
             raise NotEnoughRightsException
 
@@ -72,8 +84,16 @@ def require_authentication(func):
             args_list.append(params)
         if current_user:
             args_list.append(current_user)
+        time_range = {
+            key: value
+            for key, value in (('from_time', from_time), ('to_time', to_time))
+            if value
+        }
 
-        return await func(*args_list)
+        try:
+            return await func(*args_list, **time_range)
+        finally:
+            await release_session(session)
 
     return wrapper
 
@@ -87,7 +107,9 @@ def require_user_authentication(func):
         redis: Redis = Depends(get_redis),
         meeting_id=None,
         new_meeting_data=None,
+        occurrence_data=None,
         current_user=None,
+        conflicts=None,
     ):
         user_authorization_header = request.headers.get(USER_AUTH_HEADER)
 
@@ -96,6 +118,7 @@ def require_user_authentication(func):
         current_user = await identificate_user(
             user_authorization_header, session, redis
         )
+        await route_session(request, session, current_user.id, redis)
         if current_user.status != UserStatus.ACTIVE:
             raise NotEnoughRightsException
 
@@ -104,9 +127,15 @@ def require_user_authentication(func):
             args_list.append(meeting_id)
         if new_meeting_data:
             args_list.append(new_meeting_data)
+        if occurrence_data:
+            args_list.append(occurrence_data)
         if current_user:
             args_list.append(current_user)
+        conflict_check = {'conflicts': conflicts} if conflicts else {}
 
-        return await func(*args_list)
+        try:
+            return await func(*args_list, **conflict_check)
+        finally:
+            await release_session(session)
 
     return wrapper
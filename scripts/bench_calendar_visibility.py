@@ -0,0 +1,148 @@
+"""Benchmark of the calendar visibility query strategies."""
+
+import argparse
+import asyncio
+import random
+import statistics
+from time import perf_counter
+from uuid import UUID
+
+from sqlalchemy import func, or_, select, union
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from infrastructure.db.calendar_entries import rebuild_calendar_entries
+from infrastructure.models.calendar import CalendarEvent, UserCalendarEntry
+from infrastructure.models.meeting import Meeting, user_meeting
+from infrastructure.models.task import Task
+from infrastructure.models.user import User
+from scripts.synthetic import analyze, create_calendar, create_users, recreate_schema
+
+
+def or_query(user_id: UUID):
+    return (
+        select(CalendarEvent.id)
+        .outerjoin(Meeting)
+        .outerjoin(Task)
+        .where(
+            or_(
+                Meeting.participants.any(id=user_id),
+                Task.employee_id == user_id,
+                CalendarEvent.event_creator_id == user_id,
+            )
+        )
+        .order_by(CalendarEvent.start_time, CalendarEvent.id)
+    )
+
+
+def union_query(user_id: UUID):
+    visible_event_ids = union(
+        select(Meeting.calendar_event_id)
+        .join(user_meeting, user_meeting.c.meeting_id == Meeting.id)
+        .where(user_meeting.c.user_id == user_id),
+        select(Task.calendar_event_id).where(
+            Task.employee_id == user_id, Task.calendar_event_id.is_not(None)
+        ),
+        select(CalendarEvent.id).where(CalendarEvent.event_creator_id == user_id),
+    )
+    return (
+        select(CalendarEvent.id)
+        .where(CalendarEvent.id.in_(visible_event_ids))
+        .order_by(CalendarEvent.start_time, CalendarEvent.id)
+    )
+
+
+def read_model_query(user_id: UUID):
+    return (
+        select(UserCalendarEntry.calendar_event_id)
+        .where(UserCalendarEntry.user_id == user_id)
+        .order_by(UserCalendarEntry.start_time, UserCalendarEntry.calendar_event_id)
+    )
+
+
+STRATEGIES = {
+    'or': or_query,
+    'union': union_query,
+    'read_model': read_model_query,
+}
+
+
+async def load(engine, events: int, users: int) -> None:
+    await recreate_schema(engine)
+    session_factory = async_sessionmaker(engine)
+    async with session_factory() as session:
+        start = perf_counter()
+        user_ids = await create_users(session, users)
+        await create_calendar(session, user_ids, events)
+        entries = await rebuild_calendar_entries(session)
+    await analyze(engine)
+    print(
+        f'loaded {events} events, {users} users, {entries} calendar entries '
+        f'in {perf_counter() - start:.0f} s'
+    )
+
+
+async def run(
+    url: str, events: int, users: int, samples: int, page_size: int, skip_load: bool
+):
+    engine = create_async_engine(url)
+    try:
+        if not skip_load:
+            await load(engine, events, users)
+
+        session_factory = async_sessionmaker(engine)
+        async with session_factory() as session:
+            all_user_ids = (await session.scalars(select(User.id))).all()
+            user_ids = random.Random(0).sample(all_user_ids, samples)
+
+            timings = {name: {'page': [], 'count': []} for name in STRATEGIES}
+            for user_id in user_ids:
+                pages = {}
+                for name, build_query in STRATEGIES.items():
+                    query = build_query(user_id)
+
+                    start = perf_counter()
+                    pages[name] = (await session.scalars(query.limit(page_size))).all()
+                    timings[name]['page'].append(perf_counter() - start)
+
+                    start = perf_counter()
+                    await session.scalar(
+                        select(func.count()).select_from(
+                            query.order_by(None).subquery()
+                        )
+                    )
+                    timings[name]['count'].append(perf_counter() - start)
+
+                if len({tuple(page) for page in pages.values()}) != 1:
+                    raise SystemExit(f'Strategies disagree for user {user_id}: {pages}')
+    finally:
+        await engine.dispose()
+
+    print(f'{samples} users, first page of {page_size}, times in ms (median / p95)')
+    for name, kinds in timings.items():
+        summary = '  '.join(
+            f'{kind} {statistics.median(values) * 1000:8.2f} / '
+            f'{statistics.quantiles(values, n=20)[-1] * 1000:8.2f}'
+            for kind, values in kinds.items()
+        )
+        print(f'{name:<11} {summary}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', required=True, help='async URL of a scratch database')
+    parser.add_argument('--events', type=int, default=1_000_000)
+    parser.add_argument('--users', type=int, default=1_000)
+    parser.add_argument('--samples', type=int, default=50)
+    parser.add_argument('--page-size', type=int, default=50)
+    parser.add_argument('--skip-load', action='store_true')
+    args = parser.parse_args()
+    asyncio.run(
+        run(
+            args.url,
+            args.events,
+            args.users,
+            args.samples,
+            args.page_size,
+            args.skip_load,
+        )
+    )
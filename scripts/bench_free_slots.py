@@ -0,0 +1,117 @@
+"""Benchmark of the common free slot search."""
+
+import argparse
+import asyncio
+import random
+import statistics
+from datetime import datetime, time, timedelta
+from itertools import chain
+from time import perf_counter
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from infrastructure.scheduling.intervals import find_free_slots, get_working_windows
+from infrastructure.scheduling.recurrence import get_meeting_intervals
+from meeting_service.crud.sql_repository import get_busy_meetings
+from scripts.synthetic import (
+    START_TIME,
+    analyze,
+    create_calendar,
+    create_users,
+    recreate_schema,
+)
+
+
+WORK_DAY_START = time(9)
+WORK_DAY_END = time(18)
+SLOT_DURATION = timedelta(minutes=30)
+SLOT_LIMIT = 10
+
+
+def make_busy(participants: int, days: int, meetings_per_day: int, rng):
+    busy = []
+    for _ in range(participants):
+        for day in range(days):
+            day_start = datetime.combine(
+                START_TIME.date() + timedelta(days=day), WORK_DAY_START
+            )
+            for _ in range(meetings_per_day):
+                start = day_start + timedelta(minutes=30 * rng.randrange(17))
+                busy.append((start, start + timedelta(minutes=rng.choice((30, 60)))))
+    return busy
+
+
+def search(busy, window_start: datetime, window_end: datetime):
+    windows = get_working_windows(
+        window_start, window_end, WORK_DAY_START, WORK_DAY_END
+    )
+    return find_free_slots(busy, windows, SLOT_DURATION, SLOT_LIMIT)
+
+
+def report(participants: int, intervals: int, timings: list[float]) -> None:
+    print(
+        f'{participants:>5} participants {intervals:>7} intervals  '
+        f'median {statistics.median(timings) * 1000:8.2f} ms  '
+        f'max {max(timings) * 1000:8.2f} ms'
+    )
+
+
+def run_in_memory(args) -> None:
+    rng = random.Random(0)
+    window_end = START_TIME + timedelta(days=args.days)
+    for participants in args.participants:
+        busy = make_busy(participants, args.days, args.meetings_per_day, rng)
+        timings = []
+        for _ in range(args.repeat):
+            start = perf_counter()
+            search(busy, START_TIME, window_end)
+            timings.append(perf_counter() - start)
+        report(participants, len(busy), timings)
+
+
+async def run_with_database(args) -> None:
+    engine = create_async_engine(args.url)
+    try:
+        await recreate_schema(engine)
+        session_factory = async_sessionmaker(engine)
+        async with session_factory() as session:
+            user_ids = await create_users(session, max(args.participants))
+            await create_calendar(session, user_ids, args.events)
+        await analyze(engine)
+
+        window_end = START_TIME + timedelta(days=args.days)
+        async with session_factory() as session:
+            for participants in args.participants:
+                timings = []
+                for _ in range(args.repeat):
+                    start = perf_counter()
+                    meetings = await get_busy_meetings(
+                        session, user_ids[:participants], START_TIME, window_end
+                    )
+                    busy = list(
+                        chain.from_iterable(
+                            get_meeting_intervals(meeting, START_TIME, window_end)
+                            for meeting in meetings
+                        )
+                    )
+                    search(busy, START_TIME, window_end)
+                    timings.append(perf_counter() - start)
+                    session.expunge_all()
+                report(participants, len(busy), timings)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--participants', type=int, nargs='+', default=[10, 50, 200])
+    parser.add_argument('--days', type=int, default=31)
+    parser.add_argument('--meetings-per-day', type=int, default=3)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--url', help='async URL of a scratch database')
+    parser.add_argument('--events', type=int, default=100_000)
+    args = parser.parse_args()
+    if args.url:
+        asyncio.run(run_with_database(args))
+    else:
+        run_in_memory(args)
@@ -0,0 +1,44 @@
+"""Micro-benchmark of check_jwt with and without the decoded token cache."""
+
+import argparse
+from time import perf_counter
+from types import SimpleNamespace
+from uuid import uuid4
+
+from auth_service.security.authentication import create_access_token_for_user
+from auth_service.security.identification import check_jwt
+from config.config import settings
+from infrastructure.cache.token_cache import token_cache
+
+
+def time_per_call(iterations: int, call) -> float:
+    start = perf_counter()
+    for _ in range(iterations):
+        call()
+    return (perf_counter() - start) / iterations
+
+
+def main(iterations: int) -> None:
+    user = SimpleNamespace(id=uuid4())
+    header = f'Bearer {create_access_token_for_user(user)}'
+    secret_key = settings.USER_JWT_SECRET_KEY
+
+    def uncached():
+        token_cache.clear()
+        check_jwt(header, secret_key)
+
+    uncached_time = time_per_call(iterations, uncached)
+    check_jwt(header, secret_key)
+    cached_time = time_per_call(iterations, lambda: check_jwt(header, secret_key))
+
+    print(f'iterations: {iterations}')
+    print(f'uncached:   {uncached_time * 1e6:.1f} us per call')
+    print(f'cached:     {cached_time * 1e6:.1f} us per call')
+    print(f'speedup:    {uncached_time / cached_time:.1f}x')
+    print(f'cache:      {token_cache.stats()}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=20_000)
+    main(parser.parse_args().iterations)
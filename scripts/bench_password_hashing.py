@@ -0,0 +1,101 @@
+"""Benchmark of /users/me p99 while logins run, bcrypt inline vs offloaded."""
+
+import argparse
+import asyncio
+import statistics
+from time import perf_counter
+from uuid import uuid4
+
+from httpx import ASGITransport, AsyncClient
+
+from auth_service.auth_main import app
+from auth_service.security.pwd_crypt import shutdown_executor
+from config.config import settings
+from config.constants import USER_AUTH_HEADER
+
+
+PASSWORD = 'Bench@passw0rd'
+
+
+async def probe(client: AsyncClient, headers: dict, probes: int) -> list[float]:
+    timings = []
+    for _ in range(probes):
+        start = perf_counter()
+        response = await client.get(f'{settings.API_URL}/users/me', headers=headers)
+        response.raise_for_status()
+        timings.append(perf_counter() - start)
+    return timings
+
+
+async def log_in(client: AsyncClient, credentials: dict, statuses: list[int]):
+    while True:
+        response = await client.post(
+            f'{settings.API_URL}/auth/token_user', json=credentials
+        )
+        statuses.append(response.status_code)
+
+
+async def measure(client, headers, credentials, logins: int, probes: int):
+    statuses = []
+    login_tasks = [
+        asyncio.create_task(log_in(client, credentials, statuses))
+        for _ in range(logins)
+    ]
+    try:
+        timings = await probe(client, headers, probes)
+    finally:
+        for task in login_tasks:
+            task.cancel()
+        await asyncio.gather(*login_tasks, return_exceptions=True)
+    return timings, statuses
+
+
+def report(name: str, timings: list[float], statuses: list[int]) -> None:
+    print(
+        f'{name:<22} median {statistics.median(timings) * 1000:8.2f} ms  '
+        f'p99 {statistics.quantiles(timings, n=100)[-1] * 1000:8.2f} ms  '
+        f'logins {statuses.count(200):>5} ok {statuses.count(503):>5} busy'
+    )
+
+
+async def run(logins: int, probes: int) -> None:
+    # The app runs in process against the database and Redis of the current
+    # settings, and a throwaway bench user is registered there.
+    executor = settings.PASSWORD_HASHING_EXECUTOR
+    credentials = {'email': f'bench{uuid4().hex}@example.com', 'password': PASSWORD}
+
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url='http://bench'
+        ) as client:
+            response = await client.post(
+                f'{settings.API_URL}/auth/user',
+                json={**credentials, 'first_name': 'Bench', 'last_name': 'User'},
+            )
+            response.raise_for_status()
+            response = await client.post(
+                f'{settings.API_URL}/auth/token_user', json=credentials
+            )
+            response.raise_for_status()
+            headers = {USER_AUTH_HEADER: f'Bearer {response.json()["access_token"]}'}
+
+            print(f'{probes} /users/me calls, {logins} concurrent logins')
+            timings, statuses = await measure(client, headers, credentials, 0, probes)
+            report('no logins', timings, statuses)
+            for mode in ('inline', executor):
+                settings.PASSWORD_HASHING_EXECUTOR = mode
+                shutdown_executor()
+                timings, statuses = await measure(
+                    client, headers, credentials, logins, probes
+                )
+                report(f'logins, {mode}', timings, statuses)
+
+    settings.PASSWORD_HASHING_EXECUTOR = executor
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--logins', type=int, default=16)
+    parser.add_argument('--probes', type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(run(args.logins, args.probes))
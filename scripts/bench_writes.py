@@ -0,0 +1,268 @@
+"""Benchmark of task and meeting writes before and after RETURNING."""
+
+import argparse
+import asyncio
+import statistics
+from datetime import datetime, timedelta
+from time import perf_counter
+
+from sqlalchemy import event, select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from infrastructure.db.calendar_entries import sync_calendar_entries
+from infrastructure.models.calendar import CalendarEvent, EventType
+from infrastructure.models.meeting import Meeting
+from infrastructure.models.task import Task, TaskStatus
+from infrastructure.models.user import User, UserPosition
+from infrastructure.scheduling.recurrence import get_meeting_series_end
+from infrastructure.schemas.meeting import MeetingCreate
+from infrastructure.schemas.task import TaskCreate, TaskEdit
+from meeting_service.crud.sql_repository import create_new_meeting
+from scripts.synthetic import create_users, recreate_schema
+from task_service.crud.sql_repository import create_task_for_empoloyee, update_task
+
+
+async def create_task_before(session, new_task_data: TaskCreate, manager_id):
+    new_calendar_event = CalendarEvent(
+        event_type=EventType.TASK,
+        title=new_task_data.title,
+        description=new_task_data.description,
+        start_time=new_task_data.due_date,
+        end_time=new_task_data.due_date,
+        event_creator_id=manager_id,
+    )
+    session.add(new_calendar_event)
+    await session.flush()
+
+    new_task = Task(**new_task_data.model_dump())
+    new_task.manager_id = manager_id
+    new_task.calendar_event_id = new_calendar_event.id
+    new_task.status = TaskStatus.IN_PROGRESS
+    session.add(new_task)
+    await session.flush()
+    await sync_calendar_entries(session, [new_calendar_event.id])
+    await session.commit()
+    return new_task
+
+
+async def update_task_before(session, task_to_update: Task, new_task_data: TaskEdit):
+    for key, value in new_task_data.model_dump().items():
+        if value:
+            setattr(task_to_update, key, value)
+
+    calendar_update_data = {
+        'start_time': new_task_data.due_date,
+        'end_time': new_task_data.due_date,
+        'title': new_task_data.title,
+        'description': new_task_data.description,
+    }
+    calendar_update_data = {
+        key: value for key, value in calendar_update_data.items() if value is not None
+    }
+    if calendar_update_data:
+        await session.execute(
+            update(CalendarEvent)
+            .where(CalendarEvent.id == task_to_update.calendar_event_id)
+            .values(**calendar_update_data)
+        )
+
+    await session.flush()
+    await sync_calendar_entries(session, [task_to_update.calendar_event_id])
+    await session.commit()
+    await session.refresh(task_to_update)
+    return task_to_update
+
+
+async def create_meeting_before(
+    session, new_meeting_data: MeetingCreate, organizer_id, participants
+):
+    recurrence_rule = new_meeting_data.recurrence_rule or None
+    series_end_time = get_meeting_series_end(
+        recurrence_rule, new_meeting_data.start_time, new_meeting_data.end_time
+    )
+    new_calendar_event = CalendarEvent(
+        event_type=EventType.MEETING,
+        title=new_meeting_data.title,
+        description=new_meeting_data.description,
+        start_time=new_meeting_data.start_time,
+        end_time=series_end_time,
+        event_creator_id=organizer_id,
+    )
+    session.add(new_calendar_event)
+    await session.flush()
+
+    new_meeting = Meeting(
+        title=new_meeting_data.title,
+        description=new_meeting_data.description,
+        start_time=new_meeting_data.start_time,
+        end_time=new_meeting_data.end_time,
+        recurrence_rule=recurrence_rule,
+        series_end_time=series_end_time,
+        meeting_creator_id=organizer_id,
+        calendar_event_id=new_calendar_event.id,
+        participants=participants,
+        occurrence_overrides=[],
+    )
+    session.add(new_meeting)
+    await session.flush()
+    await sync_calendar_entries(session, [new_calendar_event.id])
+    await session.commit()
+    await session.refresh(
+        new_meeting, attribute_names=['participants', 'meeting_creator']
+    )
+    return new_meeting
+
+
+class StatementCounter:
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine.sync_engine, 'before_cursor_execute', self.on_execute)
+
+    def on_execute(self, *args) -> None:
+        self.count += 1
+
+
+async def measure(session_factory, counter, operations: int, operation):
+    """Median ms and statements per call; preparation is not timed."""
+    timings, statements = [], []
+    for index in range(operations):
+        async with session_factory() as session:
+            prepared = await operation.prepare(session, index)
+            counter.count = 0
+            start = perf_counter()
+            await operation.run(session, index, prepared)
+            timings.append(perf_counter() - start)
+            statements.append(counter.count)
+    return statistics.median(timings) * 1000, statistics.median(statements)
+
+
+class Operation:
+    def __init__(self, prepare, run):
+        self.prepare = prepare
+        self.run = run
+
+
+async def run(url: str, operations: int) -> None:
+    engine = create_async_engine(url)
+    counter = StatementCounter(engine)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    due_date = datetime.now().replace(microsecond=0) + timedelta(days=30)
+    try:
+        await recreate_schema(engine)
+        async with session_factory() as session:
+            manager_id, *employee_ids = await create_users(
+                session, 4, UserPosition.MANAGER
+            )
+
+        async def no_preparation(session, index):
+            return None
+
+        async def load_task(session, index):
+            return await session.scalar(
+                select(Task).order_by(Task.id).offset(index).limit(1)
+            )
+
+        async def load_participants(session, index):
+            return (
+                await session.scalars(select(User).where(User.id.in_(employee_ids)))
+            ).all()
+
+        def task_data(version, index):
+            return TaskCreate(
+                title=f'{version} {index}',
+                description='-',
+                due_date=due_date,
+                employee_id=employee_ids[0],
+            )
+
+        def task_edit(version, index):
+            return TaskEdit(
+                title=f'{version} edited {index}',
+                due_date=due_date + timedelta(days=1),
+            )
+
+        def meeting_data(version, index):
+            start_time = due_date + timedelta(hours=index)
+            return MeetingCreate(
+                title=f'{version} {index}',
+                description='-',
+                start_time=start_time,
+                end_time=start_time + timedelta(minutes=30),
+                participants=employee_ids,
+            )
+
+        benchmarks = {
+            'create task': (
+                Operation(
+                    no_preparation,
+                    lambda session, index, _: create_task_before(
+                        session, task_data('before', index), manager_id
+                    ),
+                ),
+                Operation(
+                    no_preparation,
+                    lambda session, index, _: create_task_for_empoloyee(
+                        session, task_data('after', index), manager_id
+                    ),
+                ),
+            ),
+            'update task': (
+                Operation(
+                    load_task,
+                    lambda session, index, task: update_task_before(
+                        session, task, task_edit('before', index)
+                    ),
+                ),
+                Operation(
+                    load_task,
+                    lambda session, index, task: update_task(
+                        session, task, task_edit('after', index)
+                    ),
+                ),
+            ),
+            'create meeting': (
+                Operation(
+                    load_participants,
+                    lambda session, index, participants: create_meeting_before(
+                        session,
+                        meeting_data('before', index),
+                        manager_id,
+                        participants,
+                    ),
+                ),
+                Operation(
+                    load_participants,
+                    lambda session, index, participants: create_new_meeting(
+                        session,
+                        meeting_data('after', index),
+                        manager_id,
+                        participants,
+                    ),
+                ),
+            ),
+        }
+
+        print(f'{operations} operations each, median ms / statements per call')
+        for name, (before, after) in benchmarks.items():
+            before_ms, before_statements = await measure(
+                session_factory, counter, operations, before
+            )
+            after_ms, after_statements = await measure(
+                session_factory, counter, operations, after
+            )
+            print(
+                f'{name:<15} before {before_ms:7.2f} ms / {before_statements:g}  '
+                f'after {after_ms:7.2f} ms / {after_statements:g}'
+            )
+    finally:
+        await engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--url', required=True, help='async URL of a scratch PostgreSQL database'
+    )
+    parser.add_argument('--operations', type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(run(args.url, args.operations))
@@ -0,0 +1,136 @@
+"""Synthetic data for the benchmarks, for scratch databases only."""
+
+import random
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from infrastructure.models import Base
+from infrastructure.models.calendar import CalendarEvent, EventType
+from infrastructure.models.meeting import Meeting, user_meeting
+from infrastructure.models.task import Task
+from infrastructure.models.user import User, UserPosition
+
+
+CHUNK_SIZE = 5_000
+START_TIME = datetime(2026, 1, 5, 9)
+
+
+async def recreate_schema(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def analyze(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql('ANALYZE')
+
+
+async def insert_rows(session: AsyncSession, table, rows: list[dict]) -> None:
+    for offset in range(0, len(rows), CHUNK_SIZE):
+        await session.execute(insert(table), rows[offset : offset + CHUNK_SIZE])
+
+
+async def create_users(
+    session: AsyncSession,
+    count: int,
+    position: UserPosition = UserPosition.JUNIOR,
+) -> list[UUID]:
+    user_ids = [uuid4() for _ in range(count)]
+    await insert_rows(
+        session,
+        User.__table__,
+        [
+            {
+                'id': user_id,
+                'email': f'bench{user_id.hex}@example.com',
+                'first_name': 'Bench',
+                'last_name': f'User {index}',
+                'password': '-',
+                'position': position,
+            }
+            for index, user_id in enumerate(user_ids)
+        ],
+    )
+    await session.commit()
+    return user_ids
+
+
+async def create_calendar(
+    session: AsyncSession,
+    user_ids: list[UUID],
+    events: int,
+    days: int = 730,
+    participants: int = 3,
+    seed: int = 0,
+) -> None:
+    """`events` calendar events spread over `days`, half meetings, half tasks."""
+    rng = random.Random(seed)
+    step = timedelta(days=days) / events
+    for offset in range(0, events, CHUNK_SIZE):
+        calendar_rows, meeting_rows, participant_rows, task_rows = [], [], [], []
+        for event_id in range(offset + 1, min(offset + CHUNK_SIZE, events) + 1):
+            start_time = START_TIME + event_id * step
+            if event_id % 2:
+                end_time = start_time + timedelta(minutes=rng.choice((30, 60)))
+                attendees = rng.sample(user_ids, participants)
+                calendar_rows.append(
+                    {
+                        'id': event_id,
+                        'event_type': EventType.MEETING,
+                        'title': f'Meeting {event_id}',
+                        'description': '-',
+                        'start_time': start_time,
+                        'end_time': end_time,
+                        'event_creator_id': attendees[0],
+                    }
+                )
+                meeting_rows.append(
+                    {
+                        'id': event_id,
+                        'title': f'Meeting {event_id}',
+                        'description': '-',
+                        'start_time': start_time,
+                        'end_time': end_time,
+                        'series_end_time': end_time,
+                        'meeting_creator_id': attendees[0],
+                        'calendar_event_id': event_id,
+                    }
+                )
+                participant_rows.extend(
+                    {'user_id': user_id, 'meeting_id': event_id}
+                    for user_id in attendees
+                )
+            else:
+                manager_id, employee_id = rng.sample(user_ids, 2)
+                calendar_rows.append(
+                    {
+                        'id': event_id,
+                        'event_type': EventType.TASK,
+                        'title': f'Task {event_id}',
+                        'description': '-',
+                        'start_time': start_time,
+                        'end_time': start_time,
+                        'event_creator_id': manager_id,
+                    }
+                )
+                task_rows.append(
+                    {
+                        'id': event_id,
+                        'title': f'Task {event_id}',
+                        'description': '-',
+                        'due_date': start_time,
+                        'employee_id': employee_id,
+                        'manager_id': manager_id,
+                        'calendar_event_id': event_id,
+                    }
+                )
+
+        await insert_rows(session, CalendarEvent.__table__, calendar_rows)
+        await insert_rows(session, Meeting.__table__, meeting_rows)
+        await insert_rows(session, user_meeting, participant_rows)
+        await insert_rows(session, Task.__table__, task_rows)
+        await session.commit()
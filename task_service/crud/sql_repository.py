@@ -1,16 +1,21 @@
-from typing import Optional, Sequence
+from datetime import datetime
+from typing import Iterable, Optional, Sequence
 from uuid import UUID
 
-from fastapi_pagination import Params
 from fastapi_pagination.ext.sqlalchemy import paginate
-from sqlalchemy import delete, or_, update
+from sqlalchemy import column, delete, insert, or_, tuple_, update, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from infrastructure.db.calendar_entries import sync_calendar_entries
+from infrastructure.db.keyset import keyset_paginate
+from infrastructure.db.sql_db import replica_safe
 from infrastructure.models.calendar import CalendarEvent, EventType
 from infrastructure.models.task import Task, TaskStatus
 from infrastructure.models.user import User
+from infrastructure.schemas.pagination import KeysetParams
 from infrastructure.schemas.task import TaskCreate, TaskEdit
 
 
@@ -20,45 +25,56 @@ async def get_user_by_id(session: AsyncSession, id: UUID) -> Optional[User]:
     return result.scalar()
 
 
-async def get_user_by_id_with_team(session: AsyncSession, id: UUID) -> Optional[User]:
-    query = select(User).filter_by(id=id).options(joinedload(User.team))
+async def get_task_assignees(session: AsyncSession, ids: Iterable[UUID]) -> Sequence:
+    """(id, email, team_id) of the users, in one query."""
+    query = select(User.id, User.email, User.team_id).where(User.id.in_(ids))
     result = await session.execute(query)
-    return result.scalar()
+    return result.all()
 
 
+@replica_safe
 async def get_all_employee_tasks(
-    session: AsyncSession, employee_id: UUID, params: Params
+    session: AsyncSession, employee_id: UUID, params: KeysetParams
 ) -> Sequence[Task]:
     query = (
         select(Task)
         .where(Task.employee_id == employee_id)
         .options(selectinload(Task.task_manager))
     )
+    if params.is_keyset:
+        return await keyset_paginate(session, query, params, [Task.due_date, Task.id])
     return await paginate(session, query, params)
 
 
+@replica_safe
 async def get_all_manager_tasks(
-    session: AsyncSession, manager_id: UUID, params: Params
+    session: AsyncSession, manager_id: UUID, params: KeysetParams
 ) -> Sequence[Task]:
     query = (
         select(Task)
         .where(Task.manager_id == manager_id)
         .options(selectinload(Task.task_employee))
     )
+    if params.is_keyset:
+        return await keyset_paginate(session, query, params, [Task.due_date, Task.id])
     return await paginate(session, query, params)
 
 
+@replica_safe
 async def get_all_user_tasks(
-    session: AsyncSession, user_id: UUID, params: Params
+    session: AsyncSession, user_id: UUID, params: KeysetParams
 ) -> Sequence[Task]:
     query = (
         select(Task)
         .where(or_(Task.employee_id == user_id, Task.manager_id == user_id))
         .options(selectinload(Task.task_manager), selectinload(Task.task_employee))
     )
+    if params.is_keyset:
+        return await keyset_paginate(session, query, params, [Task.due_date, Task.id])
     return await paginate(session, query, params)
 
 
+@replica_safe
 async def get_task_full_info_by_id(
     session: AsyncSession, task_id: int
 ) -> Optional[Task]:
@@ -75,44 +91,92 @@ async def get_task_full_info_by_id(
     return result.scalar()
 
 
+@replica_safe
 async def get_task_by_id(session: AsyncSession, task_id: int) -> Optional[Task]:
     query = select(Task).filter_by(id=task_id)
     result = await session.execute(query)
     return result.scalar()
 
 
-async def check_task_exist(
-    session: AsyncSession, title: str, employee_id: UUID, manager_id: UUID
-) -> Optional[Task]:
-    query = select(Task).where(
-        Task.title == title,
-        Task.employee_id == employee_id,
+async def get_tasks_for_update(session: AsyncSession, ids: Iterable[int]) -> Sequence:
+    """Current values, manager and employee email of the tasks, in one query."""
+    query = (
+        select(
+            Task.id,
+            Task.title,
+            Task.status,
+            Task.due_date,
+            Task.employee_id,
+            Task.manager_id,
+            Task.calendar_event_id,
+            User.email,
+        )
+        .join(User, User.id == Task.employee_id)
+        .where(Task.id.in_(ids))
+    )
+    result = await session.execute(query)
+    return result.all()
+
+
+async def get_existing_task_keys(
+    session: AsyncSession,
+    manager_id: UUID,
+    keys: Iterable[tuple[str, UUID, datetime]],
+) -> dict[tuple[str, UUID, datetime], int]:
+    """(title, employee_id, due_date) keys of the manager already taken.
+
+    Mirrors the uq_task_title_mgr_emp_due constraint, maps to the task id.
+    """
+    query = select(Task.title, Task.employee_id, Task.due_date, Task.id).where(
         Task.manager_id == manager_id,
+        tuple_(Task.title, Task.employee_id, Task.due_date).in_(list(keys)),
     )
     result = await session.execute(query)
-    return result.scalar_one_or_none()
+    return {
+        (title, employee_id, due_date): id
+        for title, employee_id, due_date, id in result.all()
+    }
 
 
 async def create_task_for_empoloyee(
     session: AsyncSession, new_task_data: TaskCreate, manager_id: UUID
-):
-    new_calendar_event = CalendarEvent(
-        event_type=EventType.TASK,
-        title=new_task_data.title,
-        description=new_task_data.description,
-        end_time=new_task_data.due_date,
-        event_creator_id=manager_id,
-    )
-
-    session.add(new_calendar_event)
-    await session.flush()
+) -> Optional[Task]:
+    """Insert the calendar event and the task in one statement.
 
-    new_task = Task(**new_task_data.model_dump())
-    new_task.manager_id = manager_id
-    new_task.calendar_event_id = new_calendar_event.id
-    new_task.status = TaskStatus.IN_PROGRESS
+    The event is inserted in a CTE and the task takes its id from there.
+    A task clashing with uq_task_title_mgr_emp_due is skipped by ON CONFLICT
+    and None is returned, with the transaction rolled back.
+    """
+    new_calendar_event = (
+        insert(CalendarEvent)
+        .values(
+            event_type=EventType.TASK,
+            title=new_task_data.title,
+            description=new_task_data.description,
+            start_time=new_task_data.due_date,
+            end_time=new_task_data.due_date,
+            event_creator_id=manager_id,
+        )
+        .returning(CalendarEvent.id)
+        .cte('new_calendar_event')
+    )
+    new_task = await session.scalar(
+        pg_insert(Task)
+        .values(
+            **new_task_data.model_dump(),
+            manager_id=manager_id,
+            calendar_event_id=select(new_calendar_event.c.id).scalar_subquery(),
+            status=TaskStatus.IN_PROGRESS,
+        )
+        .on_conflict_do_nothing(constraint='uq_task_title_mgr_emp_due')
+        .returning(Task)
+    )
+    if new_task is None:
+        # The CTE inserts the event even when the task is skipped.
+        await session.rollback()
+        return None
 
-    session.add(new_task)
+    await sync_calendar_entries(session, [new_task.calendar_event_id])
     await session.commit()
     return new_task
 
@@ -120,11 +184,20 @@ async def create_task_for_empoloyee(
 async def update_task(
     session: AsyncSession, task_to_update: Task, new_task_data: TaskEdit
 ):
-    for key, value in new_task_data.model_dump().items():
-        if value:
-            setattr(task_to_update, key, value)
+    task_update_data = {
+        key: value for key, value in new_task_data.model_dump().items() if value
+    }
+    if task_update_data:
+        task_to_update = await session.scalar(
+            update(Task)
+            .where(Task.id == task_to_update.id)
+            .values(**task_update_data)
+            .returning(Task)
+        )
 
+    # A task is shown in the calendar as a point at its due date.
     calendar_update_data = {
+        'start_time': new_task_data.due_date,
         'end_time': new_task_data.due_date,
         'title': new_task_data.title,
         'description': new_task_data.description,
@@ -138,9 +211,9 @@ async def update_task(
             .where(CalendarEvent.id == task_to_update.calendar_event_id)
             .values(**calendar_update_data)
         )
+        await sync_calendar_entries(session, [task_to_update.calendar_event_id])
 
     await session.commit()
-    await session.refresh(task_to_update)
 
     return task_to_update
 
@@ -151,4 +224,118 @@ async def delete_task_from_db(session: AsyncSession, task_to_delete: Task):
     await session.flush()
 
     await session.execute(delete(CalendarEvent).where(CalendarEvent.id == event_id))
+    await sync_calendar_entries(session, [event_id])
+    await session.commit()
+
+
+async def create_tasks_for_employees(
+    session: AsyncSession, new_tasks_data: Sequence[TaskCreate], manager_id: UUID
+) -> list[Optional[Task]]:
+    """Insert events and tasks with one multi-row INSERT ... RETURNING each.
+
+    Tasks come back in input order, None where an equal task already exists.
+    """
+    event_ids = await session.scalars(
+        insert(CalendarEvent).returning(CalendarEvent.id, sort_by_parameter_order=True),
+        [
+            {
+                'event_type': EventType.TASK,
+                'title': new_task_data.title,
+                'description': new_task_data.description,
+                'start_time': new_task_data.due_date,
+                'end_time': new_task_data.due_date,
+                'event_creator_id': manager_id,
+            }
+            for new_task_data in new_tasks_data
+        ],
+    )
+    event_ids = event_ids.all()
+
+    new_tasks = await session.scalars(
+        pg_insert(Task)
+        .on_conflict_do_nothing(constraint='uq_task_title_mgr_emp_due')
+        .returning(Task),
+        [
+            {
+                **new_task_data.model_dump(),
+                'manager_id': manager_id,
+                'calendar_event_id': event_id,
+                'status': TaskStatus.IN_PROGRESS,
+            }
+            for new_task_data, event_id in zip(new_tasks_data, event_ids)
+        ],
+    )
+    tasks_by_event_id = {task.calendar_event_id: task for task in new_tasks}
+
+    # Events of the skipped tasks would be left without a task.
+    skipped_event_ids = set(event_ids) - tasks_by_event_id.keys()
+    if skipped_event_ids:
+        await session.execute(
+            delete(CalendarEvent).where(CalendarEvent.id.in_(skipped_event_ids))
+        )
+
+    await sync_calendar_entries(session, list(tasks_by_event_id))
+    await session.commit()
+    return [tasks_by_event_id.get(event_id) for event_id in event_ids]
+
+
+async def update_tasks(
+    session: AsyncSession, changes: Sequence[dict], changed_event_ids: set[int]
+) -> Sequence[Task]:
+    """Write full task rows with UPDATE ... FROM (VALUES ...) RETURNING.
+
+    changes hold id, calendar_event_id, title, status and due_date of every
+    task; the calendar events in changed_event_ids get the new title and
+    due date the same way.
+    """
+    task_changes = values(
+        column('id', Task.id.type),
+        column('calendar_event_id', Task.calendar_event_id.type),
+        column('title', Task.title.type),
+        column('status', Task.status.type),
+        column('due_date', Task.due_date.type),
+        name='task_changes',
+    ).data(
+        [
+            (
+                change['id'],
+                change['calendar_event_id'],
+                change['title'],
+                change['status'],
+                change['due_date'],
+            )
+            for change in changes
+        ]
+    )
+
+    updated_tasks = await session.scalars(
+        update(Task)
+        .where(Task.id == task_changes.c.id)
+        .values(
+            title=task_changes.c.title,
+            status=task_changes.c.status,
+            due_date=task_changes.c.due_date,
+        )
+        .returning(Task)
+        .execution_options(synchronize_session=False)
+    )
+    updated_tasks = updated_tasks.all()
+
+    if changed_event_ids:
+        await session.execute(
+            update(CalendarEvent)
+            .where(
+                CalendarEvent.id == task_changes.c.calendar_event_id,
+                CalendarEvent.id.in_(changed_event_ids),
+            )
+            .values(
+                title=task_changes.c.title,
+                start_time=task_changes.c.due_date,
+                end_time=task_changes.c.due_date,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await sync_calendar_entries(session, changed_event_ids)
+
     await session.commit()
+    return updated_tasks
@@ -1,17 +1,19 @@
 from typing import Optional, Sequence
 from uuid import UUID
 
-from fastapi_pagination import Params
 from fastapi_pagination.ext.sqlalchemy import paginate
-from sqlalchemy import or_
+from sqlalchemy import or_, update
 from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from infrastructure.db.keyset import keyset_paginate
+from infrastructure.db.sql_db import replica_safe
 from infrastructure.models.evaluation import TaskEvaluation
 from infrastructure.models.task import Task
 from infrastructure.models.user import User
 from infrastructure.schemas.evaluation import TaskEvaluationCreate
+from infrastructure.schemas.pagination import KeysetParams
 
 
 async def get_user_by_id(session: AsyncSession, id: UUID) -> Optional[User]:
@@ -20,6 +22,7 @@ async def get_user_by_id(session: AsyncSession, id: UUID) -> Optional[User]:
     return result.scalar()
 
 
+@replica_safe
 async def get_eval_by_task_id(
     session: AsyncSession, task_id: int
 ) -> Optional[TaskEvaluation]:
@@ -28,8 +31,9 @@ async def get_eval_by_task_id(
     return result.scalar()
 
 
+@replica_safe
 async def get_employee_evaluations(
-    session: AsyncSession, user_id: str, params: Params
+    session: AsyncSession, user_id: str, params: KeysetParams
 ) -> Sequence[TaskEvaluation]:
     query = (
         select(TaskEvaluation)
@@ -37,6 +41,8 @@ async def get_employee_evaluations(
         .filter(or_(Task.employee_id == user_id, Task.manager_id == user_id))
         .options(selectinload(TaskEvaluation.task))
     )
+    if params.is_keyset:
+        return await keyset_paginate(session, query, params, [TaskEvaluation.id])
     return await paginate(session, query, params)
 
 
@@ -58,10 +64,13 @@ async def update_evaluation(
     eval_to_update: TaskEvaluation,
     new_task_eval_data: TaskEvaluationCreate,
 ) -> TaskEvaluation:
-    eval_to_update.score_quality = new_task_eval_data.score_quality
-
+    eval_to_update = await session.scalar(
+        update(TaskEvaluation)
+        .where(TaskEvaluation.id == eval_to_update.id)
+        .values(score_quality=new_task_eval_data.score_quality)
+        .returning(TaskEvaluation)
+    )
     await session.commit()
-    await session.refresh(eval_to_update)
 
     return eval_to_update
 
@@ -1,10 +1,13 @@
+from collections import Counter
 from typing import Annotated, Optional, Union
 
 from fastapi import BackgroundTasks, Depends, APIRouter, Request, status
-from fastapi_pagination import Page, Params
+from fastapi_pagination import Page
 from redis import Redis
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from infrastructure.cache.membership import get_team_lead_ids, is_user_manager
 from infrastructure.db.redis_db import get_redis
 from infrastructure.exceptions.auth_exceptions import UserNotFoundException
 from infrastructure.exceptions.basic_exeptions import NotFoundException
@@ -20,8 +23,14 @@ from infrastructure.exceptions.team_exceptions import (
 from infrastructure.models.user import UserPosition
 from infrastructure.db.sql_db import get_session
 from infrastructure.notification.notification import send_email
+from infrastructure.schemas.pagination import CursorPage, KeysetParams
 from infrastructure.schemas.task import (
     TaskBase,
+    TaskBulkCreate,
+    TaskBulkEdit,
+    TaskBulkEditResult,
+    TaskBulkError,
+    TaskBulkResult,
     TaskCreate,
     TaskEdit,
     TaskEmployee,
@@ -31,15 +40,19 @@ from infrastructure.schemas.task import (
     TaskRoleEnum,
 )
 from task_service.crud.sql_repository import (
-    check_task_exist,
     create_task_for_empoloyee,
+    create_tasks_for_employees,
     delete_task_from_db,
     get_all_employee_tasks,
     get_all_manager_tasks,
     get_all_user_tasks,
+    get_existing_task_keys,
+    get_task_assignees,
     get_task_full_info_by_id,
-    get_user_by_id_with_team,
+    get_tasks_for_update,
+    get_user_by_id,
     update_task,
+    update_tasks,
 )
 from task_service.endpoints.task_evaluation import task_eval_router
 from task_service.permissions.rbac_task import (
@@ -53,14 +66,18 @@ task_router = APIRouter()
 
 
 @task_router.get(
-    '/', response_model=Page[Union[TaskEmployeeManager, TaskEmployee, TaskManager]]
+    '/',
+    response_model=Union[
+        Page[Union[TaskEmployeeManager, TaskEmployee, TaskManager]],
+        CursorPage[Union[TaskEmployeeManager, TaskEmployee, TaskManager]],
+    ],
 )
 @require_authentication
 async def get_my_tasks(
     request: Request,
     session: Annotated[AsyncSession, Depends(get_session)],
     redis: Annotated[Redis, Depends(get_redis)],
-    params: Annotated[Params, Depends()],
+    params: Annotated[KeysetParams, Depends()],
     role: Optional[TaskRoleEnum] = None,
     current_user=None,
 ):
@@ -86,25 +103,25 @@ async def create_task(
     new_task_data: TaskCreate,
     current_user=None,
 ):
-    user_to_execute_task = await get_user_by_id_with_team(
-        session, new_task_data.employee_id
-    )
+    # A manager's rights are checked on the membership index, the assignee
+    # row is only read for requests that pass and for the error details.
+    if current_user.position == UserPosition.MANAGER and not await is_user_manager(
+        current_user.id, new_task_data.employee_id, session, redis
+    ):
+        user_to_execute_task = await get_user_by_id(session, new_task_data.employee_id)
+        if not user_to_execute_task:
+            raise UserNotFoundException
+        if user_to_execute_task.team_id is None:
+            raise UserNotInTeamException
+        raise NotUserManagerException
 
+    user_to_execute_task = await get_user_by_id(session, new_task_data.employee_id)
     if not user_to_execute_task:
         raise UserNotFoundException
-    if current_user.position == UserPosition.MANAGER:
-        if not user_to_execute_task.team:
-            raise UserNotInTeamException
-        if user_to_execute_task.team.team_lead_id != current_user.id:
-            raise NotUserManagerException
-
-    task_exists = await check_task_exist(
-        session, new_task_data.title, new_task_data.employee_id, current_user.id
-    )
-    if task_exists is not None:
-        raise TaskAlreadyExistsException
 
     new_task = await create_task_for_empoloyee(session, new_task_data, current_user.id)
+    if new_task is None:
+        raise TaskAlreadyExistsException
 
     email = [user_to_execute_task.email]
     background_tasks.add_task(send_email, email, 'Notification', 'Task added')
@@ -112,6 +129,189 @@ async def create_task(
     return new_task
 
 
+def get_bulk_task_error(assignee, team_leads, current_user) -> Optional[Exception]:
+    """The error create_task would raise for this assignee, if any."""
+    if assignee is None:
+        return UserNotFoundException()
+    if current_user.position == UserPosition.MANAGER:
+        if assignee.team_id is None:
+            return UserNotInTeamException()
+        if team_leads[assignee.team_id] != current_user.id:
+            return NotUserManagerException()
+    return None
+
+
+@task_router.post('/bulk', response_model=TaskBulkResult)
+@require_position_authentication(
+    [UserPosition.MANAGER, UserPosition.CEO, UserPosition.ADMIN]
+)
+async def create_tasks_bulk(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    redis: Annotated[Redis, Depends(get_redis)],
+    new_task_data: TaskBulkCreate,
+    current_user=None,
+):
+    new_tasks_data = new_task_data.tasks
+    assignees = {
+        assignee.id: assignee
+        for assignee in await get_task_assignees(
+            session, {task_data.employee_id for task_data in new_tasks_data}
+        )
+    }
+    team_leads = {}
+    if current_user.position == UserPosition.MANAGER:
+        team_leads = await get_team_lead_ids(
+            {
+                assignee.team_id
+                for assignee in assignees.values()
+                if assignee.team_id is not None
+            },
+            session,
+            redis,
+        )
+    taken_keys = await get_existing_task_keys(
+        session,
+        current_user.id,
+        {
+            (task_data.title, task_data.employee_id, task_data.due_date)
+            for task_data in new_tasks_data
+        },
+    )
+
+    # Valid tasks are created, the rest are reported by their position.
+    tasks_to_create = []
+    errors = []
+    for index, task_data in enumerate(new_tasks_data):
+        key = (task_data.title, task_data.employee_id, task_data.due_date)
+        error = get_bulk_task_error(
+            assignees.get(task_data.employee_id), team_leads, current_user
+        )
+        if error is None and key in taken_keys:
+            error = TaskAlreadyExistsException()
+        if error is not None:
+            errors.append(TaskBulkError(index=index, detail=error.detail))
+            continue
+        taken_keys[key] = None
+        tasks_to_create.append((index, task_data))
+
+    new_tasks = []
+    if tasks_to_create:
+        created = await create_tasks_for_employees(
+            session, [task_data for _, task_data in tasks_to_create], current_user.id
+        )
+        for (index, _), task in zip(tasks_to_create, created):
+            if task is None:
+                # A task with the same key was created since the check above.
+                errors.append(
+                    TaskBulkError(
+                        index=index, detail=TaskAlreadyExistsException().detail
+                    )
+                )
+            else:
+                new_tasks.append(task)
+        errors.sort(key=lambda error: error.index)
+
+    for employee_id, count in Counter(task.employee_id for task in new_tasks).items():
+        email = [assignees[employee_id].email]
+        message = 'Task added' if count == 1 else f'{count} tasks added'
+        background_tasks.add_task(send_email, email, 'Notification', message)
+
+    return TaskBulkResult(created=new_tasks, errors=errors)
+
+
+@task_router.patch('/bulk', response_model=TaskBulkEditResult)
+@require_user_authentication
+async def edit_tasks_bulk(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    redis: Annotated[Redis, Depends(get_redis)],
+    new_task_data: TaskBulkEdit,
+    current_user=None,
+):
+    changes_data = new_task_data.tasks
+    tasks = {
+        task.id: task
+        for task in await get_tasks_for_update(
+            session, [task_data.id for task_data in changes_data]
+        )
+    }
+
+    errors = []
+    changes = []
+    for index, task_data in enumerate(changes_data):
+        task = tasks.get(task_data.id)
+        if task is None:
+            errors.append(TaskBulkError(index=index, detail=NotFoundException().detail))
+        elif task.manager_id != current_user.id:
+            errors.append(
+                TaskBulkError(index=index, detail=CantEditTaskException().detail)
+            )
+        else:
+            changes.append(
+                (
+                    index,
+                    {
+                        'id': task.id,
+                        'calendar_event_id': task.calendar_event_id,
+                        'employee_id': task.employee_id,
+                        'title': task_data.title or task.title,
+                        'status': task_data.status or task.status,
+                        'due_date': task_data.due_date or task.due_date,
+                    },
+                )
+            )
+
+    # New (title, employee, due date) keys must stay unique per manager,
+    # both against stored tasks and inside the batch.
+    taken_keys = await get_existing_task_keys(
+        session,
+        current_user.id,
+        {
+            (change['title'], change['employee_id'], change['due_date'])
+            for _, change in changes
+        },
+    )
+    changes_to_apply = []
+    changed_event_ids = set()
+    for index, change in changes:
+        key = (change['title'], change['employee_id'], change['due_date'])
+        if taken_keys.get(key, change['id']) != change['id']:
+            errors.append(
+                TaskBulkError(index=index, detail=TaskAlreadyExistsException().detail)
+            )
+            continue
+        taken_keys[key] = change['id']
+        changes_to_apply.append(change)
+        task = tasks[change['id']]
+        if change['title'] != task.title or change['due_date'] != task.due_date:
+            changed_event_ids.add(change['calendar_event_id'])
+
+    updated_tasks = []
+    if changes_to_apply:
+        try:
+            updated_tasks = await update_tasks(
+                session, changes_to_apply, changed_event_ids
+            )
+        except IntegrityError:
+            await session.rollback()
+            raise TaskAlreadyExistsException
+
+    emails = {task.employee_id: task.email for task in tasks.values()}
+    for employee_id, count in Counter(
+        task.employee_id for task in updated_tasks
+    ).items():
+        message = 'Task changed' if count == 1 else f'{count} tasks changed'
+        background_tasks.add_task(
+            send_email, [emails[employee_id]], 'Notification', message
+        )
+
+    errors.sort(key=lambda error: error.index)
+    return TaskBulkEditResult(updated=updated_tasks, errors=errors)
+
+
 @task_router.get('/{task_id}', response_model=TaskFull)
 @require_user_authentication
 async def get_task_full_info(
@@ -156,14 +356,24 @@ async def edit_task(
         if current_user.id != task_to_update.manager_id:
             raise CantEditTaskException
 
-    if new_task_data.title:
-        task_name_exists = await check_task_exist(
-            session, new_task_data.title, task_to_update.employee_id, current_user.id
+    if new_task_data.title or new_task_data.due_date:
+        key = (
+            new_task_data.title or task_to_update.title,
+            task_to_update.employee_id,
+            new_task_data.due_date or task_to_update.due_date,
+        )
+        existing_keys = await get_existing_task_keys(
+            session, task_to_update.manager_id, [key]
         )
-        if task_name_exists is not None and task_name_exists.id != task_id:
+        if existing_keys.get(key, task_id) != task_id:
             raise TaskAlreadyExistsException
 
-    updated_task = await update_task(session, task_to_update, new_task_data)
+    try:
+        updated_task = await update_task(session, task_to_update, new_task_data)
+    except IntegrityError:
+        # A task with the same key was created since the check above.
+        await session.rollback()
+        raise TaskAlreadyExistsException
 
     email = [task_to_update.task_employee.email]
     background_tasks.add_task(send_email, email, 'Notification', 'Task changed')
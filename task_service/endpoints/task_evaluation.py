@@ -1,7 +1,7 @@
-from typing import Annotated
+from typing import Annotated, Union
 
 from fastapi import Depends, APIRouter, Path, Request, status
-from fastapi_pagination import Page, Params
+from fastapi_pagination import Page
 from redis import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -19,6 +19,7 @@ from infrastructure.schemas.evaluation import (
     TaskEvaluationCreate,
     TaskEvaluationFull,
 )
+from infrastructure.schemas.pagination import CursorPage, KeysetParams
 from task_service.crud.sql_repository import get_task_by_id, get_task_full_info_by_id
 from task_service.crud.sql_repository_eval import (
     create_new_task_evaluation,
@@ -37,13 +38,15 @@ task_eval_router = APIRouter()
 all_evals_router = APIRouter()
 
 
-@all_evals_router.get('/', response_model=Page[TaskEvaluationFull])
+@all_evals_router.get(
+    '/', response_model=Union[Page[TaskEvaluationFull], CursorPage[TaskEvaluationFull]]
+)
 @require_authentication
 async def get_employee_all_evaluations(
     request: Request,
     session: Annotated[AsyncSession, Depends(get_session)],
     redis: Annotated[Redis, Depends(get_redis)],
-    params: Annotated[Params, Depends()],
+    params: Annotated[KeysetParams, Depends()],
     current_user=None,
 ):
     evaluations = await get_employee_evaluations(session, current_user.id, params)
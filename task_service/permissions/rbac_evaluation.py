@@ -1,16 +1,16 @@
 from functools import wraps
 
 from fastapi import Depends, Path, Request
-from fastapi_pagination import Params
 from redis import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from task_service.security.identification import identificate_user
 from infrastructure.db.redis_db import get_redis
-from infrastructure.db.sql_db import get_session
+from infrastructure.db.sql_db import get_session, release_session, route_session
 from infrastructure.exceptions.auth_exceptions import NotEnoughRightsException
 from config.constants import USER_AUTH_HEADER
 from infrastructure.models.user import UserStatus
+from infrastructure.schemas.pagination import KeysetParams
 
 
 def require_user_authentication(func):
@@ -30,6 +30,7 @@ def require_user_authentication(func):
         current_user = await identificate_user(
             user_authorization_header, session, redis
         )
+        await route_session(request, session, current_user.id, redis)
         if current_user.status != UserStatus.ACTIVE:
             raise NotEnoughRightsException
 
@@ -39,7 +40,10 @@ def require_user_authentication(func):
         if current_user:
             args_list.append(current_user)
 
-        return await func(*args_list)
+        try:
+            return await func(*args_list)
+        finally:
+            await release_session(session)
 
     return wrapper
 
@@ -50,7 +54,7 @@ def require_authentication(func):
         request: Request,
         session: AsyncSession = Depends(get_session),
         redis: Redis = Depends(get_redis),
-        params: Params = Depends(),
+        params: KeysetParams = Depends(),
         current_user=None,
     ):
         user_authorization_header = request.headers.get(USER_AUTH_HEADER)
@@ -60,6 +64,7 @@ def require_authentication(func):
         current_user = await identificate_user(
             user_authorization_header, session, redis
         )
+        await route_session(request, session, current_user.id, redis)
         if current_user.status != UserStatus.ACTIVE:
             raise NotEnoughRightsException
 
@@ -68,6 +73,9 @@ def require_authentication(func):
         if current_user:
             args_list.append(current_user)
 
-        return await func(*args_list)
+        try:
+            return await func(*args_list)
+        finally:
+            await release_session(session)
 
     return wrapper
@@ -6,7 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from task_service.security.identification import identificate_user
 from infrastructure.db.redis_db import get_redis
-from infrastructure.db.sql_db import get_session
+from infrastructure.db.sql_db import get_session, release_session, route_session
 from infrastructure.exceptions.auth_exceptions import NotEnoughRightsException
 from config.constants import USER_AUTH_HEADER
 from infrastructure.models.user import UserStatus
@@ -32,6 +32,7 @@ def require_position_authentication(position: list):
             current_user = await identificate_user(
                 user_authorization_header, session, redis
             )
+            await route_session(request, session, current_user.id, redis)
             if current_user.status != UserStatus.ACTIVE:
                 raise NotEnoughRightsException
             if position and current_user.position not in position:
@@ -44,7 +45,10 @@ def require_position_authentication(position: list):
                 args_list.append(new_task_data)
             args_list.append(current_user)
 
-            return await func(*args_list)
+            try:
+                return await func(*args_list)
+            finally:
+                await release_session(session)
 
         return wrapper
 
@@ -68,6 +72,7 @@ def require_authentication(func):
         current_user = await identificate_user(
             user_authorization_header, session, redis
         )
+        await route_session(request, session, current_user.id, redis)
         if current_user.status != UserStatus.ACTIVE:
             raise NotEnoughRightsException
 
@@ -78,7 +83,10 @@ def require_authentication(func):
         if current_user:
             args_list.append(current_user)
 
-        return await func(*args_list)
+        try:
+            return await func(*args_list)
+        finally:
+            await release_session(session)
 
     return wrapper
 
@@ -101,6 +109,7 @@ def require_user_authentication(func):
         current_user = await identificate_user(
             user_authorization_header, session, redis
         )
+        await route_session(request, session, current_user.id, redis)
         if current_user.status != UserStatus.ACTIVE:
             raise NotEnoughRightsException
 
@@ -112,6 +121,9 @@ def require_user_authentication(func):
         if current_user:
             args_list.append(current_user)
 
-        return await func(*args_list)
+        try:
+            return await func(*args_list)
+        finally:
+            await release_session(session)
 
     return wrapper
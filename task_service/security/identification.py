@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 import uuid
-from typing import Optional
+from typing import Union
 
 import jwt
 from jwt.exceptions import InvalidTokenError
@@ -8,15 +8,19 @@ from redis import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config.config import settings
-from config.constants import USER_REDIS_KEY
+from config.constants import REFRESH_TOKEN_TYPE, USER_REDIS_KEY
+from infrastructure.cache.revocation import is_token_revoked
+from infrastructure.cache.token_cache import cache_payload, get_cached_payload
+from infrastructure.cache.user_cache import get_user_version, user_cache
 from infrastructure.exceptions.auth_exceptions import (
     InvalidTokenException,
     InvalidServiceSecretKeyException,
     TokenExpiredException,
     TokenNotFoundException,
+    TokenRevokedException,
     UserNotFoundException,
 )
-from infrastructure.schemas.user import UserMinimal
+from infrastructure.schemas.user import UserClaims, UserMinimal
 from task_service.crud.cache_repository import (
     get_key_from_cache,
     set_key_to_cache,
@@ -24,15 +28,20 @@ from task_service.crud.cache_repository import (
 from task_service.crud.sql_repository import get_user_by_id
 
 
-def check_jwt(authorization_header: str, secret_key: str) -> str:
+def decode_jwt(authorization_header: str, secret_key: str) -> dict:
     try:
         access_token = authorization_header.split(' ')[1]
-        payload = jwt.decode(access_token, secret_key, algorithms=[settings.ALGORITHM])
+    except IndexError:
+        raise TokenNotFoundException
 
+    cached_payload = get_cached_payload(access_token, secret_key)
+    if cached_payload is not None:
+        return cached_payload
+
+    try:
+        payload = jwt.decode(access_token, secret_key, algorithms=[settings.ALGORITHM])
     except InvalidTokenError:
         raise InvalidTokenException
-    except IndexError:
-        raise TokenNotFoundException
 
     expire = payload.get('exp')
     if not expire:
@@ -48,7 +57,12 @@ def check_jwt(authorization_header: str, secret_key: str) -> str:
     if subject is None:
         raise InvalidTokenException
 
-    return subject
+    cache_payload(access_token, secret_key, payload, expiring_time)
+    return payload
+
+
+def check_jwt(authorization_header: str, secret_key: str) -> str:
+    return decode_jwt(authorization_header, secret_key)['sub']
 
 
 def identificate_service(
@@ -64,12 +78,27 @@ def identificate_service(
 
 async def identificate_user(
     authorization_header: str, session: AsyncSession, redis: Redis
-) -> Optional[UserMinimal]:
-    user_id = check_jwt(authorization_header, settings.USER_JWT_SECRET_KEY)
+) -> Union[UserClaims, UserMinimal]:
+    payload = decode_jwt(authorization_header, settings.USER_JWT_SECRET_KEY)
+    if payload.get('type') == REFRESH_TOKEN_TYPE:
+        raise InvalidTokenException
+    if await is_token_revoked(payload, redis):
+        raise TokenRevokedException
+    user_id = payload['sub']
+
+    if payload.get('ver') is not None:
+        if payload['ver'] == await get_user_version(user_id, redis):
+            return UserClaims.model_validate({**payload, 'id': user_id})
+
+    local_user = user_cache.get(user_id)
+    if local_user:
+        return local_user
 
     cached_user = await get_key_from_cache(USER_REDIS_KEY, user_id, redis)
     if cached_user:
-        return UserMinimal.model_validate_json(cached_user)
+        user_pydantic = UserMinimal.model_validate_json(cached_user)
+        user_cache.set(user_id, user_pydantic)
+        return user_pydantic
 
     user = await get_user_by_id(session, uuid.UUID(user_id))
     if user is None:
@@ -78,7 +107,12 @@ async def identificate_user(
     user_pydantic = UserMinimal.model_validate(user)
 
     await set_key_to_cache(
-        USER_REDIS_KEY, user_id, user_pydantic.model_dump_json(), redis
+        USER_REDIS_KEY,
+        user_id,
+        user_pydantic.model_dump_json(),
+        redis,
+        settings.USER_CACHE_EXPIRE_SECONDS,
     )
+    user_cache.set(user_id, user_pydantic)
 
     return user_pydantic
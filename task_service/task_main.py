@@ -1,16 +1,31 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 import uvicorn
 
 from config.config import settings
 from task_service.endpoints.task import task_router
 from task_service.endpoints.task_evaluation import all_evals_router
+from infrastructure.cache.pubsub import start_listener, stop_listener
+from infrastructure.db.redis_db import close_redis, init_redis
+from infrastructure.metrics.metrics import metrics_router
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    redis = await init_redis()
+    start_listener(redis)
+    yield
+    await stop_listener()
+    await close_redis()
 
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 
 app.include_router(task_router, prefix=f'{settings.API_URL}/tasks')
 app.include_router(all_evals_router, prefix=f'{settings.API_URL}/evaluations')
+app.include_router(metrics_router, prefix=f'{settings.API_URL}/internal/metrics')
 
 
 # if __name__ == '__main__':
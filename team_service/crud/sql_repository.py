@@ -1,14 +1,21 @@
-from typing import Optional, Sequence
+from typing import Iterable, Optional, Sequence
 from uuid import UUID
 
-from fastapi_pagination import Params
 from fastapi_pagination.ext.sqlalchemy import paginate
 
-from sqlalchemy.orm import joinedload
+from sqlalchemy import func, insert, update
+from sqlalchemy.orm import joinedload, with_expression
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
+
+from config.constants import TEAM_PREVIEW_MEMBERS
+from infrastructure.db.keyset import keyset_paginate
+from infrastructure.db.sql_db import replica_safe
+from infrastructure.exceptions.team_exceptions import UserAlreadyInTeamException
 from infrastructure.models.team import Team
 from infrastructure.models.user import User
+from infrastructure.schemas.pagination import KeysetParams
 from infrastructure.schemas.team import TeamCreate, TeamEdit
 
 
@@ -24,21 +31,81 @@ async def get_users_by_ids(session: AsyncSession, ids: list[UUID]) -> Sequence[U
     return result.scalars().all()
 
 
+def get_member_count():
+    """Correlated count per team row, served by the users.team_id index."""
+    return (
+        select(func.count(User.id))
+        .where(User.team_id == Team.id)
+        .correlate(Team)
+        .scalar_subquery()
+    )
+
+
+async def get_team_member_ids(session: AsyncSession, team_id: int) -> Sequence[UUID]:
+    query = select(User.id).where(User.team_id == team_id)
+    result = await session.execute(query)
+    return result.scalars().all()
+
+
+async def set_team_members(
+    session: AsyncSession,
+    team_id: int,
+    added_ids: Iterable[UUID] = (),
+    removed_ids: Iterable[UUID] = (),
+) -> int:
+    """Apply a membership diff with one UPDATE per direction; no commit.
+
+    Only users without a team are added. If one was taken by another team
+    since it was checked, the transaction is rolled back and
+    UserAlreadyInTeamException is raised. Returns how many users changed team.
+    """
+    added_ids, removed_ids = list(added_ids), list(removed_ids)
+    changed = 0
+    if removed_ids:
+        result = await session.execute(
+            update(User)
+            .where(User.id.in_(removed_ids), User.team_id == team_id)
+            .values(team_id=None)
+        )
+        changed += result.rowcount
+    if added_ids:
+        result = await session.execute(
+            update(User)
+            .where(User.id.in_(added_ids), User.team_id.is_(None))
+            .values(team_id=team_id)
+        )
+        if result.rowcount < len(added_ids):
+            await session.rollback()
+            raise UserAlreadyInTeamException
+        changed += result.rowcount
+    return changed
+
+
 async def create_team(
     session: AsyncSession, team_data: TeamCreate, users: Sequence[User]
 ):
-    new_team = Team(
-        name=team_data.name,
-        description=team_data.description,
-        team_lead_id=team_data.team_lead_id,
+    new_team = await session.scalar(
+        insert(Team)
+        .values(
+            name=team_data.name,
+            description=team_data.description,
+            team_lead_id=team_data.team_lead_id,
+        )
+        .returning(Team)
     )
-    session.add(new_team)
-    await session.flush()
-    await session.refresh(new_team, attribute_names=['members', 'team_lead'])
-
-    new_team.members.extend(users)
+    await set_team_members(session, new_team.id, [user.id for user in users])
 
     await session.commit()
+
+    set_committed_value(new_team, 'member_count', len(users))
+    set_committed_value(
+        new_team,
+        'members',
+        sorted(users, key=lambda user: user.id)[:TEAM_PREVIEW_MEMBERS],
+    )
+    set_committed_value(
+        new_team, 'team_lead', await session.get(User, team_data.team_lead_id)
+    )
     return new_team
 
 
@@ -46,29 +113,50 @@ async def update_team(
     session: AsyncSession,
     team_to_update: Team,
     new_team_data: TeamEdit,
-    members: Sequence[User],
+    added_ids: Iterable[UUID] = (),
+    removed_ids: Iterable[UUID] = (),
 ):
     new_team_data_dict = new_team_data.model_dump()
     new_team_data_dict.pop('members')
-    for key, value in new_team_data_dict.items():
-        if value:
-            setattr(team_to_update, key, value)
-    if members:
-        team_to_update.members = members
+    team_update_data = {
+        key: value for key, value in new_team_data_dict.items() if value
+    }
+    if team_update_data:
+        team_to_update = await session.scalar(
+            update(Team)
+            .where(Team.id == team_to_update.id)
+            .values(**team_update_data)
+            .returning(Team)
+        )
+    await set_team_members(session, team_to_update.id, added_ids, removed_ids)
 
     await session.commit()
-    await session.refresh(team_to_update)
-
     return team_to_update
 
 
+async def update_team_members(
+    session: AsyncSession,
+    team_id: int,
+    added_ids: Iterable[UUID] = (),
+    removed_ids: Iterable[UUID] = (),
+) -> int:
+    changed = await set_team_members(session, team_id, added_ids, removed_ids)
+    await session.commit()
+    return changed
+
+
 async def delete_team_from_db(session: AsyncSession, team_to_delete: Team):
     await session.delete(team_to_delete)
     await session.commit()
 
 
-async def get_all_teams_db(session: AsyncSession, params: Params) -> Sequence[Team]:
-    query = select(Team)
+@replica_safe
+async def get_all_teams_db(
+    session: AsyncSession, params: KeysetParams
+) -> Sequence[Team]:
+    query = select(Team).options(with_expression(Team.member_count, get_member_count()))
+    if params.is_keyset:
+        return await keyset_paginate(session, query, params, [Team.id])
     return await paginate(session, query, params)
 
 
@@ -78,23 +166,64 @@ async def get_team_by_id(session: AsyncSession, id: int):
     return result.scalar()
 
 
+@replica_safe
 async def get_team_full_info_by_id(session: AsyncSession, id: int):
+    """Team with its lead, member count and first members only."""
     query = (
         select(Team)
         .filter_by(id=id)
-        .options(joinedload(Team.members), joinedload(Team.team_lead))
+        .options(
+            joinedload(Team.team_lead),
+            with_expression(Team.member_count, get_member_count()),
+        )
+        .execution_options(populate_existing=True)
     )
     result = await session.execute(query)
-    return result.scalar()
+    team = result.scalar()
+    if team is None:
+        return None
+
+    members = await session.scalars(
+        select(User)
+        .where(User.team_id == id)
+        .order_by(User.id)
+        .limit(TEAM_PREVIEW_MEMBERS)
+    )
+    set_committed_value(team, 'members', members.all())
+    return team
 
 
-async def get_team_by_name(session: AsyncSession, name: str):
-    query = select(Team).filter_by(name=name)
-    result = await session.execute(query)
-    return result.scalar()
+@replica_safe
+async def get_team_members_db(
+    session: AsyncSession, team_id: int, params: KeysetParams
+) -> Sequence[User]:
+    query = select(User).where(User.team_id == team_id)
+    if params.is_keyset:
+        return await keyset_paginate(session, query, params, [User.id])
+    return await paginate(session, query.order_by(User.id), params)
 
 
-async def get_team_by_team_lead_id(session: AsyncSession, team_lead_id: UUID):
-    query = select(Team).filter_by(team_lead_id=team_lead_id)
+async def get_team_conflicts(
+    session: AsyncSession, name: Optional[str], team_lead_id: Optional[UUID]
+):
+    """Name owner, lead position and status and the lead's team, in one query."""
+    query = select(
+        select(Team.id)
+        .where(Team.name == name)
+        .scalar_subquery()
+        .label('name_team_id'),
+        select(User.position)
+        .where(User.id == team_lead_id)
+        .scalar_subquery()
+        .label('team_lead_position'),
+        select(User.status)
+        .where(User.id == team_lead_id)
+        .scalar_subquery()
+        .label('team_lead_status'),
+        select(Team.id)
+        .where(Team.team_lead_id == team_lead_id)
+        .scalar_subquery()
+        .label('led_team_id'),
+    )
     result = await session.execute(query)
-    return result.scalar()
+    return result.one()
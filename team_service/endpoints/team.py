@@ -1,27 +1,39 @@
-from typing import Annotated
+from typing import Annotated, Union
+from uuid import UUID
 
 from fastapi import Depends, APIRouter, Request, status
-from fastapi_pagination import Page, Params
+from fastapi_pagination import Page
 from redis import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from infrastructure.schemas.team import TeamBase, TeamCreate, TeamEdit, TeamFull
+from infrastructure.schemas.pagination import CursorPage, KeysetParams
+from infrastructure.schemas.team import (
+    TeamCreate,
+    TeamEdit,
+    TeamFull,
+    TeamMembersAdd,
+    TeamSummary,
+)
+from infrastructure.schemas.user import UserMinimal
 from team_service.crud.sql_repository import (
     create_team,
     delete_team_from_db,
     get_all_teams_db,
     get_team_by_id,
-    get_team_by_name,
-    get_team_by_team_lead_id,
+    get_team_conflicts,
     get_team_full_info_by_id,
-    get_user_by_id,
+    get_team_member_ids,
+    get_team_members_db,
     get_users_by_ids,
     update_team,
+    update_team_members,
 )
 from team_service.permissions.rbac_team import (
     require_position_authentication,
     require_authentication,
 )
+from infrastructure.cache.membership import publish_team_leads, publish_user_teams
+from infrastructure.cache.user_cache import publish_users_invalidation
 from infrastructure.db.redis_db import get_redis
 from infrastructure.exceptions.basic_exeptions import NotFoundException
 from infrastructure.exceptions.team_exceptions import (
@@ -32,6 +44,7 @@ from infrastructure.exceptions.team_exceptions import (
     TeamMembersNotUniqueException,
     UserAlreadyInTeamException,
     UserAlreadyTeamLeadException,
+    UserNotInTeamException,
 )
 from infrastructure.models.user import UserPosition, UserStatus
 from infrastructure.db.sql_db import get_session
@@ -40,18 +53,28 @@ from infrastructure.db.sql_db import get_session
 team_router = APIRouter()
 
 
-@team_router.get('/', response_model=Page[TeamBase])
+@team_router.get('/', response_model=Union[Page[TeamSummary], CursorPage[TeamSummary]])
 @require_authentication
 async def get_all_teams(
     request: Request,
     session: Annotated[AsyncSession, Depends(get_session)],
     redis: Annotated[Redis, Depends(get_redis)],
-    params: Annotated[Params, Depends()],
+    params: Annotated[KeysetParams, Depends()],
 ):
     teams = await get_all_teams_db(session, params)
     return teams
 
 
+def check_team_lead(conflicts) -> None:
+    if conflicts.team_lead_position is None:
+        raise TeamLeadNotFoundException
+    if (
+        conflicts.team_lead_position is not UserPosition.MANAGER
+        or conflicts.team_lead_status is not UserStatus.ACTIVE
+    ):
+        raise NoManagerTeamLeadException
+
+
 @team_router.post('/', response_model=TeamFull, status_code=status.HTTP_201_CREATED)
 @require_position_authentication(
     [UserPosition.ADMIN, UserPosition.CEO, UserPosition.MANAGER]
@@ -62,23 +85,16 @@ async def create_new_team(
     redis: Annotated[Redis, Depends(get_redis)],
     new_team_data: TeamCreate,
 ):
-    team = await get_team_by_name(session, new_team_data.name)
-    if team:
+    conflicts = await get_team_conflicts(
+        session, new_team_data.name, new_team_data.team_lead_id
+    )
+    if conflicts.name_team_id is not None:
         raise TeamAlreadyExistsException
-
-    team_lead_user = await get_user_by_id(session, new_team_data.team_lead_id)
-    if team_lead_user is None:
-        raise TeamLeadNotFoundException
-    if (
-        team_lead_user.position is not UserPosition.MANAGER
-        or team_lead_user.status is not UserStatus.ACTIVE
-    ):
-        raise NoManagerTeamLeadException
-
-    other_team = await get_team_by_team_lead_id(session, new_team_data.team_lead_id)
-    if other_team:
+    check_team_lead(conflicts)
+    if conflicts.led_team_id is not None:
         raise UserAlreadyTeamLeadException
 
+    members = []
     if new_team_data.members:
         if len(new_team_data.members) != len(set(new_team_data.members)):
             raise TeamMembersNotUniqueException
@@ -90,6 +106,12 @@ async def create_new_team(
                 raise UserAlreadyInTeamException
 
     new_team = await create_team(session, new_team_data, members)
+    await publish_team_leads({new_team.id: new_team.team_lead_id}, redis)
+    if new_team_data.members:
+        await publish_user_teams(
+            dict.fromkeys(new_team_data.members, new_team.id), redis
+        )
+        await publish_users_invalidation(map(str, new_team_data.members), redis)
     return new_team
 
 
@@ -107,6 +129,36 @@ async def get_team_full_info(
     return team
 
 
+@team_router.get(
+    '/{team_id}/members',
+    response_model=Union[Page[UserMinimal], CursorPage[UserMinimal]],
+)
+@require_authentication
+async def get_team_members(
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    redis: Annotated[Redis, Depends(get_redis)],
+    params: Annotated[KeysetParams, Depends()],
+    team_id: int,
+):
+    team = await get_team_by_id(session, team_id)
+    if team is None:
+        raise NotFoundException
+    return await get_team_members_db(session, team_id, params)
+
+
+async def check_new_members(session: AsyncSession, user_ids: set[UUID]) -> None:
+    """Users to add should exist and not belong to any team yet."""
+    if not user_ids:
+        return
+    users = await get_users_by_ids(session, list(user_ids))
+    if len(users) != len(user_ids):
+        raise TeamMembersNotFoundException
+    for user in users:
+        if user.team_id:
+            raise UserAlreadyInTeamException
+
+
 @team_router.patch('/{team_id}', response_model=TeamFull)
 @require_position_authentication(
     [UserPosition.ADMIN, UserPosition.CEO, UserPosition.MANAGER]
@@ -118,42 +170,98 @@ async def edit_team(
     team_id: int,
     new_team_data: TeamEdit,
 ):
-    team_to_update = await get_team_full_info_by_id(session, team_id)
+    team_to_update = await get_team_by_id(session, team_id)
     if team_to_update is None:
         raise NotFoundException
 
-    team_unique_name = await get_team_by_name(session, new_team_data.name)
-    if team_unique_name and team_unique_name.id != team_id:
+    conflicts = await get_team_conflicts(
+        session, new_team_data.name, new_team_data.team_lead_id
+    )
+    if conflicts.name_team_id not in (None, team_id):
         raise TeamAlreadyExistsException
-
     if new_team_data.team_lead_id:
-        team_lead_user = await get_user_by_id(session, new_team_data.team_lead_id)
-
-        if team_lead_user is None:
-            raise TeamLeadNotFoundException
-        if (
-            team_lead_user.position is not UserPosition.MANAGER
-            or team_lead_user.status is not UserStatus.ACTIVE
-        ):
-            raise NoManagerTeamLeadException
-
-        other_team = await get_team_by_team_lead_id(session, new_team_data.team_lead_id)
-        if other_team and other_team.id != team_id:
+        check_team_lead(conflicts)
+        if conflicts.led_team_id not in (None, team_id):
             raise UserAlreadyTeamLeadException
 
+    # Only the difference to the current roster is checked and written.
+    added_ids, removed_ids = set(), set()
     if new_team_data.members:
         if len(new_team_data.members) != len(set(new_team_data.members)):
             raise TeamMembersNotUniqueException
-        members = await get_users_by_ids(session, new_team_data.members)
-        if len(new_team_data.members) != len(members):
-            raise TeamMembersNotFoundException
-        for user in members:
-            if user.team_id and user.team_id != team_id:
-                raise UserAlreadyInTeamException
+        member_ids = set(await get_team_member_ids(session, team_id))
+        added_ids = set(new_team_data.members) - member_ids
+        removed_ids = member_ids - set(new_team_data.members)
+        await check_new_members(session, added_ids)
+
+    team_lead_id = team_to_update.team_lead_id
+    updated_team = await update_team(
+        session, team_to_update, new_team_data, added_ids, removed_ids
+    )
+    if updated_team.team_lead_id != team_lead_id:
+        await publish_team_leads({team_id: updated_team.team_lead_id}, redis)
+    if added_ids or removed_ids:
+        await publish_user_teams(
+            dict.fromkeys(removed_ids) | dict.fromkeys(added_ids, team_id), redis
+        )
+        await publish_users_invalidation(map(str, added_ids | removed_ids), redis)
+
+    return await get_team_full_info_by_id(session, team_id)
+
+
+@team_router.post('/{team_id}/members', response_model=TeamFull)
+@require_position_authentication(
+    [UserPosition.ADMIN, UserPosition.CEO, UserPosition.MANAGER]
+)
+async def add_team_members(
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    redis: Annotated[Redis, Depends(get_redis)],
+    team_id: int,
+    new_team_data: TeamMembersAdd,
+):
+    team = await get_team_by_id(session, team_id)
+    if team is None:
+        raise NotFoundException
 
-    updated_team = await update_team(session, team_to_update, new_team_data, members)
+    if len(new_team_data.members) != len(set(new_team_data.members)):
+        raise TeamMembersNotUniqueException
+    # Users already in the team are left as they are.
+    added_ids = set(new_team_data.members) - set(
+        await get_team_member_ids(session, team_id)
+    )
+    await check_new_members(session, added_ids)
+
+    if added_ids:
+        await update_team_members(session, team_id, added_ids=added_ids)
+        await publish_user_teams(dict.fromkeys(added_ids, team_id), redis)
+        await publish_users_invalidation(map(str, added_ids), redis)
+
+    return await get_team_full_info_by_id(session, team_id)
+
+
+@team_router.delete(
+    '/{team_id}/members/{user_id}', status_code=status.HTTP_204_NO_CONTENT
+)
+@require_position_authentication(
+    [UserPosition.ADMIN, UserPosition.CEO, UserPosition.MANAGER]
+)
+async def remove_team_member(
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    redis: Annotated[Redis, Depends(get_redis)],
+    team_id: int,
+    user_id: UUID,
+):
+    team = await get_team_by_id(session, team_id)
+    if team is None:
+        raise NotFoundException
 
-    return updated_team
+    removed = await update_team_members(session, team_id, removed_ids=[user_id])
+    if not removed:
+        raise UserNotInTeamException
+    await publish_user_teams({user_id: None}, redis)
+    await publish_users_invalidation([str(user_id)], redis)
 
 
 @team_router.delete('/{team_id}', status_code=status.HTTP_204_NO_CONTENT)
@@ -168,4 +276,8 @@ async def delete_team(
     if not team_to_delete:
         raise NotFoundException
 
+    member_ids = await get_team_member_ids(session, team_id)
     await delete_team_from_db(session, team_to_delete)
+    await publish_team_leads({team_id: None}, redis)
+    await publish_user_teams(dict.fromkeys(member_ids), redis)
+    await publish_users_invalidation(map(str, member_ids), redis)
@@ -6,7 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from team_service.security.identification import identificate_user
 from infrastructure.db.redis_db import get_redis
-from infrastructure.db.sql_db import get_session
+from infrastructure.db.sql_db import get_session, release_session, route_session
 from infrastructure.exceptions.auth_exceptions import NotEnoughRightsException
 from config.constants import USER_AUTH_HEADER
 from infrastructure.models.user import UserStatus
@@ -21,6 +21,7 @@ def require_position_authentication(position: list):
             redis: Redis = Depends(get_redis),
             team_id=None,
             new_team_data=None,
+            user_id=None,
         ):
             user_authorization_header = request.headers.get(USER_AUTH_HEADER)
 
@@ -30,6 +31,7 @@ def require_position_authentication(position: list):
             current_user = await identificate_user(
                 user_authorization_header, session, redis
             )
+            await route_session(request, session, current_user.id, redis)
 
             if current_user.status != UserStatus.ACTIVE:
                 raise NotEnoughRightsException
@@ -41,8 +43,13 @@ def require_position_authentication(position: list):
                 args_list.append(team_id)
             if new_team_data:
                 args_list.append(new_team_data)
+            if user_id:
+                args_list.append(user_id)
 
-            return await func(*args_list)
+            try:
+                return await func(*args_list)
+            finally:
+                await release_session(session)
 
         return wrapper
 
@@ -65,6 +72,7 @@ def require_authentication(func):
         current_user = await identificate_user(
             user_authorization_header, session, redis
         )
+        await route_session(request, session, current_user.id, redis)
         if current_user.status != UserStatus.ACTIVE:
             raise NotEnoughRightsException
 
@@ -73,6 +81,9 @@ def require_authentication(func):
             args_list.append(params)
         if team_id:
             args_list.append(team_id)
-        return await func(*args_list)
+        try:
+            return await func(*args_list)
+        finally:
+            await release_session(session)
 
     return wrapper
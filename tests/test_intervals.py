@@ -0,0 +1,21 @@
+from datetime import datetime, time, timedelta
+
+from infrastructure.scheduling.intervals import find_free_slots, get_working_windows
+
+
+def test_find_free_slots_skips_busy_interval_spanning_days():
+    busy = [
+        (datetime(2026, 1, 7, 9), datetime(2026, 1, 7, 16)),
+        (datetime(2026, 1, 7, 16, 30), datetime(2026, 1, 8, 12)),
+    ]
+    windows = get_working_windows(
+        datetime(2026, 1, 7), datetime(2026, 1, 9), time(9), time(18)
+    )
+
+    slots = find_free_slots(busy, windows, timedelta(hours=1), 3)
+
+    assert slots == [
+        (datetime(2026, 1, 8, 12), datetime(2026, 1, 8, 13)),
+        (datetime(2026, 1, 8, 13), datetime(2026, 1, 8, 14)),
+        (datetime(2026, 1, 8, 14), datetime(2026, 1, 8, 15)),
+    ]
@@ -0,0 +1,121 @@
+import asyncio
+from uuid import uuid4
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from starlette.requests import Request
+
+from infrastructure.db import sql_db
+from infrastructure.db.sql_db import (
+    LazySession,
+    is_read_only,
+    read_only,
+    replica_safe,
+    route_session,
+)
+from infrastructure.models import Base
+from infrastructure.models.user import User
+
+
+class RecentWrites:
+    """The two Redis calls route_session makes, kept in a dict."""
+
+    def __init__(self):
+        self.keys = {}
+
+    async def set(self, key, value, ex=None):
+        self.keys[key] = value
+
+    async def exists(self, key):
+        return key in self.keys
+
+
+@replica_safe
+async def get_first_name(session, user_id):
+    return await session.scalar(select(User.first_name).where(User.id == user_id))
+
+
+async def not_marked():
+    pass
+
+
+@read_only
+async def marked():
+    pass
+
+
+def make_request(method, endpoint=not_marked):
+    return Request(
+        {'type': 'http', 'method': method, 'headers': [], 'endpoint': endpoint}
+    )
+
+
+async def create_database(path, user_ids, first_name):
+    engine = create_async_engine(f'sqlite+aiosqlite:///{path}')
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(
+            insert(User),
+            [
+                {
+                    'id': user_id,
+                    'email': f'{user_id.hex}@example.com',
+                    'first_name': first_name,
+                    'last_name': '-',
+                    'password': '-',
+                }
+                for user_id in user_ids
+            ],
+        )
+    return engine
+
+
+def test_replica_safe_reads_follow_route_session(tmp_path, monkeypatch):
+    user_id, other_user_id = uuid4(), uuid4()
+
+    async def run():
+        primary = await create_database(
+            tmp_path / 'primary.db', [user_id, other_user_id], 'primary'
+        )
+        replica = await create_database(
+            tmp_path / 'replica.db', [user_id, other_user_id], 'replica'
+        )
+        monkeypatch.setattr(sql_db, 'replica_engines', [replica])
+        monkeypatch.setattr(
+            sql_db,
+            'replica_session_factories',
+            iter(lambda: async_sessionmaker(replica), None),
+        )
+        redis = RecentWrites()
+
+        async def read(request, reader_id):
+            session = LazySession(
+                async_sessionmaker(primary), use_replica=is_read_only(request)
+            )
+            try:
+                await route_session(request, session, reader_id, redis)
+                return await get_first_name(session, reader_id)
+            finally:
+                await session.release()
+
+        try:
+            return [
+                await read(make_request('GET'), user_id),
+                await read(make_request('POST', marked), user_id),
+                await read(make_request('POST'), user_id),
+                await read(make_request('GET'), user_id),
+                await read(make_request('GET'), other_user_id),
+            ]
+        finally:
+            await primary.dispose()
+            await replica.dispose()
+
+    assert asyncio.run(run()) == [
+        'replica',
+        # read-only POST endpoints neither write nor lose the replica
+        'replica',
+        'primary',
+        # read-your-writes keeps the writer on the primary
+        'primary',
+        'replica',
+    ]